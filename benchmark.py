@@ -0,0 +1,55 @@
+import argparse
+import time
+import numpy as np
+from carving import get_carving_engine, CARVING_ENGINES
+from maze_grid import MazeGrid
+from connectivity import label_components
+
+
+def benchmark_carving(engine_name, size, complexity=0.75, density=0.75, repeats=3):
+    """
+    Time one carving engine on a square maze of the given size.
+    Uses the same complexity/density scaling as MazeGenerator.generate_maze.
+    Returns the best (carved cells, seconds) over the repeats and the
+    number of separate open regions in the last maze (1 for a connected one).
+    """
+    size = size if size % 2 == 1 else size + 1
+    walk_steps = int(complexity * (5 * (size + size)))
+    walks = int(density * ((size // 2) * (size // 2)))
+    engine = get_carving_engine(engine_name)
+
+    best = None
+    for _ in range(repeats):
+        maze = MazeGrid((size, size))
+        start = time.perf_counter()
+        engine.carve(maze, walks, walk_steps)
+        elapsed = time.perf_counter() - start
+        carved = int(np.count_nonzero(maze == 0))
+        if best is None or elapsed < best[1]:
+            best = (carved, elapsed)
+    regions = int(label_components(maze).max())
+    return best + (regions,)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maze Runner generation benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[31, 51, 201, 1001])
+    parser.add_argument("--engines", nargs="+", default=list(CARVING_ENGINES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-loop-size", type=int, default=51,
+                        help="Skip the pure Python loop engine above this size (it takes minutes)")
+    args = parser.parse_args()
+
+    print(f"{'engine':<12}{'size':>8}{'carved':>12}{'seconds':>12}{'cells/s':>14}{'regions':>10}")
+    for size in args.sizes:
+        for engine_name in args.engines:
+            if engine_name == "loop" and size > args.max_loop_size:
+                print(f"{engine_name:<12}{size:>8}{'skipped':>12}")
+                continue
+            carved, elapsed, regions = benchmark_carving(engine_name, size, repeats=args.repeats)
+            rate = carved / elapsed if elapsed > 0 else float("inf")
+            print(f"{engine_name:<12}{size:>8}{carved:>12}{elapsed:>12.4f}{rate:>14.0f}{regions:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+import numpy as np
+from connectivity import DisjointSet
+from maze_stream import eller_rows
+
+# Neighbour offsets in the same order the original walk builds its
+# direction list: left, right, up, down
+WALK_DX = np.array([-2, 2, 0, 0])
+WALK_DY = np.array([0, 0, -2, 2])
+
+
+class CarvingEngine:
+    """
+    Base class for the wall-removal stage of MazeGenerator.generate_maze.
+    An engine receives the wall grid (1 = wall, 0 = path) and carves
+    paths into it in place, drawing all randomness from rng (a
+    np.random.Generator) so seeded generation is reproducible. start is
+    the player's starting cell, for engines that grow the maze from it.
+
+    Engines that set perfect connect every open cell, so their mazes
+    never need a solvability check.
+    """
+    name = None
+    perfect = False
+
+    def carve(self, maze, density, complexity, rng=None, start=None):
+        raise NotImplementedError
+
+
+class LoopCarvingEngine(CarvingEngine):
+    """
+    The original random-walk carver: one walk at a time, one step at a time.
+    Kept as the reference implementation for the vectorized engine.
+    """
+    name = "loop"
+
+    def carve(self, maze, density, complexity, rng=None, start=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        height, width = maze.shape
+
+        # Create paths by randomly removing walls
+        for _ in range(density):
+            x = rng.integers(0, width // 2) * 2
+            y = rng.integers(0, height // 2) * 2
+            maze[y, x] = 0
+
+            for _ in range(complexity):
+                directions = []
+                if x > 1:
+                    directions.append((x - 2, y))
+                if x < width - 2:
+                    directions.append((x + 2, y))
+                if y > 1:
+                    directions.append((x, y - 2))
+                if y < height - 2:
+                    directions.append((x, y + 2))
+
+                if len(directions) > 0:
+                    next_x, next_y = directions[rng.integers(0, len(directions))]
+                    if maze[next_y, next_x] == 1:
+                        maze[next_y, next_x] = 0
+                        maze[y + (next_y - y) // 2, x + (next_x - x) // 2] = 0
+                        x, y = next_x, next_y
+
+        return maze
+
+
+class VectorizedCarvingEngine(CarvingEngine):
+    """
+    Runs the random walks in lock-step with NumPy arrays.
+
+    Each step moves every walk at once: the random direction rolls are drawn
+    in bulk, the chosen neighbours are looked up with fancy indexing and the
+    walls are removed with a single batched assignment. Walks whose every
+    neighbour is already open can never move again, so they are dropped from
+    the active set periodically; this is what keeps large mazes fast.
+
+    In the sequential carver the first few walks open most of the grid and
+    later walks start inside it, which is what keeps the corridors connected.
+    Starting every walk at once would instead grow hundreds of separate
+    trees, so walks are launched in waves that grow by a quarter of the
+    walks launched so far, each wave seeing the grid left by the previous
+    ones. The output is not identical
+    to LoopCarvingEngine for the same random state, but the walk rules
+    (uniform choice among in-bounds neighbours, only step into walls) and
+    the resulting mazes are statistically the same.
+    """
+    name = "vectorized"
+
+    def __init__(self, prune_interval=16, wave_growth=0.25):
+        # Number of steps between removing walks that can no longer move
+        self.prune_interval = prune_interval
+        # Size of the next wave as a fraction of the walks launched so far
+        self.wave_growth = wave_growth
+
+    def carve(self, maze, density, complexity, rng=None, start=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        launched = 0
+        while launched < density:
+            count = min(max(1, int(launched * self.wave_growth)), density - launched)
+            self._run_wave(maze, count, complexity, rng)
+            launched += count
+        return maze
+
+    def _run_wave(self, maze, count, complexity, rng):
+        height, width = maze.shape
+
+        # Starting cells for every walk in the wave, drawn in one go
+        xs = rng.integers(0, width // 2, size=count) * 2
+        ys = rng.integers(0, height // 2, size=count) * 2
+        maze[ys, xs] = 0
+
+        step = 0
+        while step < complexity:
+            # Drop walks with no wall left around them
+            valid = np.stack([xs > 1, xs < width - 2, ys > 1, ys < height - 2], axis=1)
+            stuck = np.ones(xs.size, dtype=bool)
+            for d in range(4):
+                nx = np.where(valid[:, d], xs + WALK_DX[d], xs)
+                ny = np.where(valid[:, d], ys + WALK_DY[d], ys)
+                stuck &= ~valid[:, d] | (maze[ny, nx] == 0)
+            xs, ys = xs[~stuck], ys[~stuck]
+            if xs.size == 0:
+                break
+
+            # Pre-draw the direction rolls for the next block of steps
+            block = min(self.prune_interval, complexity - step)
+            rolls = rng.random((block, xs.size))
+
+            for roll in rolls:
+                valid = np.stack([xs > 1, xs < width - 2, ys > 1, ys < height - 2], axis=1)
+                counts = valid.sum(axis=1)
+
+                # Pick the n-th valid direction, n uniform in [0, counts)
+                rank = (roll * counts).astype(np.int64)
+                choice = np.argmax(np.cumsum(valid, axis=1) > rank[:, None], axis=1)
+                next_x = xs + WALK_DX[choice]
+                next_y = ys + WALK_DY[choice]
+
+                # Only step into walls; if several walks target the same wall
+                # this step, the first one wins as it would sequentially
+                opening = np.flatnonzero(maze[next_y, next_x] == 1)
+                if opening.size:
+                    if opening.size > 1:
+                        flat = next_y[opening] * width + next_x[opening]
+                        _, first = np.unique(flat, return_index=True)
+                        opening = opening[first]
+
+                    maze[next_y[opening], next_x[opening]] = 0
+                    maze[(ys[opening] + next_y[opening]) // 2,
+                         (xs[opening] + next_x[opening]) // 2] = 0
+                    xs[opening] = next_x[opening]
+                    ys[opening] = next_y[opening]
+
+            step += block
+
+
+def join_start(maze, start):
+    """
+    Open start and, if it is off the lattice of odd cells the perfect-maze
+    engines carve, the cells joining it to its lattice cell. Returns the
+    maze coordinates of that lattice cell.
+    """
+    height, width = maze.shape
+    x, y = start
+    cell_x = min(x if x % 2 else x - 1, (width - 1) // 2 * 2 - 1)
+    cell_y = min(y if y % 2 else y - 1, (height - 1) // 2 * 2 - 1)
+    maze[y, x] = maze[y, cell_x] = maze[cell_y, cell_x] = 0
+    return cell_x, cell_y
+
+
+class BacktrackerCarvingEngine(CarvingEngine):
+    """
+    Depth-first recursive backtracker with an explicit stack, so maze size
+    isn't limited by Python's recursion depth.
+
+    Cells are the odd coordinates inside the border. From the start, the
+    walk moves into a random unvisited neighbouring cell (opening the wall
+    between) and backs up along the stack when there is none, until every
+    cell has been visited. The result is a perfect maze: one path between
+    any two cells, so it is solvable in a single pass, and each cell is
+    pushed and popped once, so the time is linear in the maze size.
+    density and complexity don't apply.
+    """
+    name = "backtracker"
+    perfect = True
+
+    def carve(self, maze, density, complexity, rng=None, start=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        height, width = maze.shape
+        cols = (width - 1) // 2
+        rows = (height - 1) // 2
+        if cols < 1 or rows < 1:
+            return maze
+
+        # Cell (i, j) is maze[2 * j + 1, 2 * i + 1]; cells are numbered j * cols + i
+        if start is None:
+            start = (int(rng.integers(0, cols)) * 2 + 1, int(rng.integers(0, rows)) * 2 + 1)
+        cell_x, cell_y = join_start(maze, start)
+
+        # Plain lists: the walk touches one cell at a time
+        visited = bytearray(cols * rows)
+        first = (cell_y // 2) * cols + cell_x // 2
+        visited[first] = 1
+        stack = [first]
+        walls = []  # Flat maze index of every wall opened
+
+        # One roll per step into a new cell
+        rolls = rng.random(cols * rows).tolist()
+        roll = 0
+        while stack:
+            cell = stack[-1]
+            i = cell % cols
+            options = []
+            if i > 0 and not visited[cell - 1]:
+                options.append(cell - 1)
+            if i < cols - 1 and not visited[cell + 1]:
+                options.append(cell + 1)
+            if cell >= cols and not visited[cell - cols]:
+                options.append(cell - cols)
+            if cell < cols * (rows - 1) and not visited[cell + cols]:
+                options.append(cell + cols)
+            if not options:
+                stack.pop()
+                continue
+
+            next_cell = options[int(rolls[roll] * len(options))]
+            roll += 1
+            visited[next_cell] = 1
+            stack.append(next_cell)
+
+            # The wall between two cells is halfway between them in the maze
+            a = (cell // cols * 2 + 1) * width + i * 2 + 1
+            b = (next_cell // cols * 2 + 1) * width + next_cell % cols * 2 + 1
+            walls.append((a + b) // 2)
+
+        # Every cell was visited; open them and the walls in one go
+        maze[1:rows * 2:2, 1:cols * 2:2] = 0
+        np.put(maze, walls, 0)
+        return maze
+
+
+class KruskalCarvingEngine(CarvingEngine):
+    """
+    Randomized Kruskal over the same odd-cell lattice as the backtracker.
+
+    Every wall between two neighbouring cells is an edge; the edges are
+    shuffled once and each wall is opened if the cells on either side
+    aren't connected yet, tracked with an array-backed union-find. The
+    result is a perfect maze without the backtracker's long-corridor
+    bias, built in near-linear time with a few bytes of bookkeeping per
+    cell. density and complexity don't apply.
+    """
+    name = "kruskal"
+    perfect = True
+
+    def carve(self, maze, density, complexity, rng=None, start=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        height, width = maze.shape
+        cols = (width - 1) // 2
+        rows = (height - 1) // 2
+        if cols < 1 or rows < 1:
+            return maze
+        if start is not None:
+            join_start(maze, start)
+
+        # Edges between horizontal, then vertical neighbours, in random order
+        cells = np.arange(cols * rows, dtype=np.int32).reshape(rows, cols)
+        edge_a = np.concatenate([cells[:, :-1].ravel(), cells[:-1, :].ravel()])
+        edge_b = np.concatenate([cells[:, 1:].ravel(), cells[1:, :].ravel()])
+        order = rng.permutation(edge_a.size)
+        edge_a = edge_a[order]
+        edge_b = edge_b[order]
+
+        joined = DisjointSet(cols * rows).union_edges(edge_a, edge_b)
+
+        # Open every cell and the wall halfway along each tree edge
+        a_y, a_x = np.divmod(edge_a[joined], cols)
+        b_y, b_x = np.divmod(edge_b[joined], cols)
+        maze[1:rows * 2:2, 1:cols * 2:2] = 0
+        maze[a_y + b_y + 1, a_x + b_x + 1] = 0
+        return maze
+
+
+class EllerCarvingEngine(CarvingEngine):
+    """
+    Eller's algorithm (see maze_stream.eller_rows), written into the grid
+    one row at a time as the stream produces them. Also a perfect maze,
+    and the only engine whose working state is O(width) rather than the
+    size of the maze. density and complexity don't apply.
+    """
+    name = "eller"
+    perfect = True
+
+    def carve(self, maze, density, complexity, rng=None, start=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        height, width = maze.shape
+
+        # The stream works on odd sizes; an even grid keeps its last row/column as wall
+        rows = eller_rows(width - (1 - width % 2), rng, height - (1 - height % 2))
+        for y, row in enumerate(rows):
+            maze[y, :row.size] = row
+        if start is not None:
+            join_start(maze, start)
+        return maze
+
+
+CARVING_ENGINES = {
+    LoopCarvingEngine.name: LoopCarvingEngine,
+    VectorizedCarvingEngine.name: VectorizedCarvingEngine,
+    BacktrackerCarvingEngine.name: BacktrackerCarvingEngine,
+    KruskalCarvingEngine.name: KruskalCarvingEngine,
+    EllerCarvingEngine.name: EllerCarvingEngine,
+}
+
+
+def get_carving_engine(engine):
+    """Return a carving engine instance from a name or an engine object"""
+    if isinstance(engine, CarvingEngine):
+        return engine
+    if engine not in CARVING_ENGINES:
+        raise ValueError(f"Unknown carving engine '{engine}'. Available: {', '.join(CARVING_ENGINES)}")
+    return CARVING_ENGINES[engine]()
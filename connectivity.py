@@ -0,0 +1,154 @@
+import numpy as np
+
+
+def label_components(maze):
+    """
+    Label the 4-connected open regions of a maze (0 = path, 1 = wall).
+
+    Works on the flattened grid with NumPy only: every open cell starts as
+    its own label, each round hooks the larger label of every open edge
+    onto the smaller one and then shortcuts label chains by pointer jumping,
+    so the number of rounds grows with log(cells) rather than path length.
+
+    Returns an int array shaped like the maze where walls are 0 and each
+    connected region has its own positive label.
+    """
+    height, width = maze.shape
+    open_cells = (np.asarray(maze) == 0).ravel()
+    parent = np.arange(open_cells.size, dtype=np.int64)
+
+    # Edges between horizontally and vertically adjacent open cells
+    index = np.arange(open_cells.size).reshape(height, width)
+    grid = open_cells.reshape(height, width)
+    horizontal = grid[:, :-1] & grid[:, 1:]
+    vertical = grid[:-1, :] & grid[1:, :]
+    edge_a = np.concatenate([index[:, :-1][horizontal], index[:-1, :][vertical]])
+    edge_b = np.concatenate([index[:, 1:][horizontal], index[1:, :][vertical]])
+
+    while edge_a.size:
+        root_a = parent[edge_a]
+        root_b = parent[edge_b]
+        differ = root_a != root_b
+        if not differ.any():
+            break
+
+        # Hook the larger root onto the smaller one
+        low = np.minimum(root_a[differ], root_b[differ])
+        high = np.maximum(root_a[differ], root_b[differ])
+        np.minimum.at(parent, high, low)
+
+        # Pointer jumping until every cell points straight at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+        # Edges already inside one component never need checking again
+        edge_a, edge_b = edge_a[differ], edge_b[differ]
+
+    # Compact root ids into 1..n and keep walls at 0
+    labels = np.zeros(open_cells.size, dtype=np.int64)
+    _, compact = np.unique(parent[open_cells], return_inverse=True)
+    labels[open_cells] = compact + 1
+    return labels.reshape(height, width)
+
+
+class ConnectivityMap:
+    """
+    Connected-component labels of a maze, computed once.
+    Answers "is X reachable from Y" with two array lookups.
+    """
+    def __init__(self, maze):
+        self.labels = label_components(maze)
+        self.height, self.width = self.labels.shape
+
+    def component_of(self, pos):
+        # Out of bounds and wall cells belong to no component (0)
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.labels[y, x])
+        return 0
+
+    def components_from(self, pos):
+        """
+        Components a walk starting at pos can enter. Like a BFS seeded at
+        pos, the start cell itself is always entered, so a start inside a
+        wall reaches the regions of its open neighbours.
+        """
+        component = self.component_of(pos)
+        if component:
+            return {component}
+        x, y = pos
+        neighbours = {self.component_of((x + dx, y + dy)) for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]}
+        neighbours.discard(0)
+        return neighbours
+
+    def is_reachable(self, from_pos, to_pos):
+        if tuple(from_pos) == tuple(to_pos):
+            return True
+        component = self.component_of(to_pos)
+        return component != 0 and component in self.components_from(from_pos)
+
+    def all_reachable(self, from_pos, positions):
+        components = self.components_from(from_pos)
+        return all(tuple(pos) == tuple(from_pos) or self.component_of(pos) in components
+                   for pos in positions)
+
+
+class DisjointSet:
+    """
+    Union-find over the items 0..size-1, backed by NumPy arrays (int32
+    parents, uint8 ranks) so millions of items stay compact. find uses
+    path compression (halving) and union joins by rank.
+    """
+    def __init__(self, size):
+        self.parent = np.arange(size, dtype=np.int32)
+        self.rank = np.zeros(size, dtype=np.uint8)
+        self.sets = size
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return int(item)
+
+    def union(self, a, b):
+        """Join the sets of a and b; False if they were already one set"""
+        return bool(self.union_edges([a], [b])[0])
+
+    def union_edges(self, edge_a, edge_b):
+        """
+        Union the pairs (edge_a[k], edge_b[k]) in order. Returns a mask of
+        the pairs that joined two different sets (for Kruskal, the edges
+        of the spanning tree).
+        """
+        # Memoryviews over the arrays: element access without creating
+        # NumPy scalars, while the storage stays compact
+        parent = memoryview(self.parent)
+        rank = memoryview(self.rank)
+        joined = []
+        for k, (a, b) in enumerate(zip(np.asarray(edge_a).tolist(), np.asarray(edge_b).tolist())):
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+            joined.append(k)
+            self.sets -= 1
+            if self.sets == 1:
+                break  # Everything is one set; no later pair can join
+
+        mask = np.zeros(len(edge_a), dtype=bool)
+        mask[joined] = True
+        return mask
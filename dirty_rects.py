@@ -0,0 +1,90 @@
+import time
+from collections import deque
+import pygame
+
+
+class DirtyRectTracker:
+    """
+    Tracks which screen regions changed since the last frame.
+
+    Every drawable thing is registered each frame under a stable key with
+    the rect it covers and a state value (anything that changes how it
+    looks). When either differs from the previous frame, both the old and
+    the new rect are marked dirty; things that were not registered this
+    frame (e.g. a collected key) have their old rect marked dirty too.
+    """
+    def __init__(self):
+        self.previous = {}
+        self.current = {}
+        self.dirty = []
+        self.needs_full_redraw = True
+
+        # Size of the last frame's repaint, for the frame stats overlay
+        self.rect_count = 0
+        self.area = 0
+
+    def invalidate(self):
+        """Force a full redraw on the next frame"""
+        self.needs_full_redraw = True
+
+    def begin_frame(self):
+        self.current = {}
+        self.dirty = []
+
+    def track(self, key, rect, state=None):
+        self.current[key] = (rect, state)
+        if self.previous.get(key) != (rect, state):
+            if key in self.previous:
+                self.dirty.append(self.previous[key][0])
+            self.dirty.append(rect)
+
+    def mark(self, rect):
+        self.dirty.append(rect)
+
+    def end_frame(self, clip_rect):
+        """Return the merged dirty rects for this frame, clipped to clip_rect"""
+        for key, (rect, _) in self.previous.items():
+            if key not in self.current:
+                self.dirty.append(rect)
+        self.previous = self.current
+
+        # Merge overlapping rects so each region is repainted only once
+        merged = []
+        for rect in self.dirty:
+            rect = pygame.Rect(rect).clip(clip_rect)
+            if not rect.width or not rect.height:
+                continue
+            hit = rect.collidelist(merged)
+            while hit != -1:
+                rect = rect.union(merged.pop(hit))
+                hit = rect.collidelist(merged)
+            merged.append(rect)
+
+        self.rect_count = len(merged)
+        self.area = sum(rect.width * rect.height for rect in merged)
+        return merged
+
+    def full_redraw_done(self):
+        self.needs_full_redraw = False
+
+
+class FrameTimer:
+    """Rolling average of how long each frame takes to draw"""
+    def __init__(self, window=120):
+        self.samples = deque(maxlen=window)
+        self.frames = 0
+        self.start = None
+
+    def begin(self):
+        self.start = time.perf_counter()
+
+    def end(self):
+        if self.start is not None:
+            self.samples.append(time.perf_counter() - self.start)
+            self.frames += 1
+            self.start = None
+
+    def average_ms(self):
+        if not self.samples:
+            return 0.0
+        return 1000 * sum(self.samples) / len(self.samples)
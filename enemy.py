@@ -12,45 +12,66 @@ class Enemy:
         self.target_y = y * cell_size
         self.current_x = self.target_x
         self.current_y = self.target_y
+        
+        # Position at the previous simulation tick and the interpolated
+        # position between the two that is drawn
+        self.previous_x = self.current_x
+        self.previous_y = self.current_y
+        self.draw_x = self.current_x
+        self.draw_y = self.current_y
+        
         self.moving = False
         self.maze = maze
         self.direction = random.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
         self.time_until_direction_change = random.uniform(2.0, 5.0)
         self.patrol_timer = 0
-        self.patrol_change_time = random.randint(3, 8) * 1000  # 3-8 seconds in milliseconds
+        self.patrol_change_time = random.randint(3, 8)  # 3-8 seconds
     
     def update(self, delta_time):
+        """Advance patrol and movement by delta_time seconds"""
+        self.previous_x = self.current_x
+        self.previous_y = self.current_y
+        
         # Update patrol timer
         self.patrol_timer += delta_time
         if self.patrol_timer >= self.patrol_change_time:
             self.patrol_timer = 0
-            self.patrol_change_time = random.randint(3, 8) * 1000
+            self.patrol_change_time = random.randint(3, 8)
             self.change_direction()
         
         # Handle movement animation
         if self.moving:
             dx = self.target_x - self.current_x
             dy = self.target_y - self.current_y
+            step = self.speed * self.cell_size * delta_time
             
-            if abs(dx) < self.speed and abs(dy) < self.speed:
+            if abs(dx) <= step and abs(dy) <= step:
                 self.current_x = self.target_x
                 self.current_y = self.target_y
                 self.moving = False
             else:
                 if dx != 0:
-                    self.current_x += self.speed if dx > 0 else -self.speed
+                    self.current_x += step if dx > 0 else -step
                 if dy != 0:
-                    self.current_y += self.speed if dy > 0 else -self.speed
+                    self.current_y += step if dy > 0 else -step
         else:
             # Try to move in the current direction
             self.move()
+        
+        self.draw_x = self.current_x
+        self.draw_y = self.current_y
+    
+    def interpolate(self, alpha):
+        """Place the drawn position alpha of the way from the previous tick to the current one"""
+        self.draw_x = self.previous_x + (self.current_x - self.previous_x) * alpha
+        self.draw_y = self.previous_y + (self.current_y - self.previous_y) * alpha
     
     def move(self):
         dx, dy = self.direction
         new_x, new_y = self.x + dx, self.y + dy
         
         # Check if the new position is valid (not a wall)
-        if 0 <= new_x < self.maze.shape[1] and 0 <= new_y < self.maze.shape[0] and self.maze[new_y][new_x] == 0:
+        if self.maze.is_open(new_x, new_y):
             self.x = new_x
             self.y = new_y
             self.target_x = self.x * self.cell_size
@@ -69,30 +90,35 @@ class Enemy:
         
         for dx, dy in possible_directions:
             new_x, new_y = self.x + dx, self.y + dy
-            if 0 <= new_x < self.maze.shape[1] and 0 <= new_y < self.maze.shape[0] and self.maze[new_y][new_x] == 0:
+            if self.maze.is_open(new_x, new_y):
                 self.direction = (dx, dy)
                 return
     
     def draw(self, screen):
+        self.draw_sprite(screen, self.draw_x, self.draw_y, self.cell_size, self.color, self.direction)
+    
+    @staticmethod
+    def draw_sprite(screen, left, top, cell_size, color, direction):
+        """Draw an enemy facing direction with its cell's top-left corner at (left, top)"""
         # Draw enemy body
         pygame.draw.circle(
             screen, 
-            self.color, 
-            (self.current_x + self.cell_size // 2, self.current_y + self.cell_size // 2), 
-            self.cell_size // 2 - 2
+            color, 
+            (left + cell_size // 2, top + cell_size // 2), 
+            cell_size // 2 - 2
         )
         
         # Draw eyes to indicate direction
         eye_color = (255, 255, 255)
-        eye_size = max(2, self.cell_size // 8)
+        eye_size = max(2, cell_size // 8)
         
         # Base eye positions
-        center_x = self.current_x + self.cell_size // 2
-        center_y = self.current_y + self.cell_size // 2
-        eye_offset = self.cell_size // 4
+        center_x = left + cell_size // 2
+        center_y = top + cell_size // 2
+        eye_offset = cell_size // 4
         
         # Adjust eye positions based on direction
-        dx, dy = self.direction
+        dx, dy = direction
         if dx == 1:  # Right
             eye1_pos = (center_x + eye_offset // 2, center_y - eye_offset)
             eye2_pos = (center_x + eye_offset // 2, center_y + eye_offset)
@@ -112,6 +138,10 @@ class Enemy:
     def get_position(self):
         return (self.x, self.y)
     
+    def get_draw_rect(self):
+        """Screen area covered by draw(), used to track what needs repainting"""
+        return pygame.Rect(int(self.draw_x), int(self.draw_y), self.cell_size + 1, self.cell_size + 1)
+    
     def get_rect(self):
         return pygame.Rect(
             self.current_x + 2,
@@ -123,8 +153,11 @@ class Enemy:
     def set_cell_size(self, new_cell_size):
         ratio = new_cell_size / self.cell_size
         self.cell_size = new_cell_size
-        self.speed = max(1, new_cell_size // 10)
         self.target_x = self.x * new_cell_size
         self.target_y = self.y * new_cell_size
         self.current_x = self.current_x * ratio
-        self.current_y = self.current_y * ratio 
\ No newline at end of file
+        self.current_y = self.current_y * ratio
+        self.previous_x = self.current_x
+        self.previous_y = self.current_y
+        self.draw_x = self.current_x
+        self.draw_y = self.current_y 
\ No newline at end of file
@@ -0,0 +1,208 @@
+import numpy as np
+from enemy import Enemy
+from maze_grid import NEIGHBOURS
+
+# Directions as (dx, dy), indexed by the direction arrays; the maze's
+# neighbour order, which the pathfinding service's steps also use
+DIRECTIONS = NEIGHBOURS
+
+
+class EnemySwarm:
+    """
+    All patrolling enemies of a floor, stored as parallel NumPy arrays
+    (struct of arrays) and updated together in one vectorized step.
+
+    The behaviour matches Enemy.update: walk one cell at a time in the
+    current direction, pick a random open direction when blocked or when
+    the patrol timer runs out. Enemies within chase_range steps of the
+    player instead head towards them along the pathfinding service's
+    distance field. The enemies list holds EnemyView objects that expose
+    each enemy through the usual Enemy API for drawing and collision checks.
+    """
+    def __init__(self, positions, cell_size, maze, speed=1.5, chase_range=0, rng=None):
+        self.maze = maze
+        self.cell_size = cell_size
+        self.chase_range = chase_range  # Steps; 0 never chases
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        positions = np.array([pos[:2] for pos in positions], dtype=np.int64).reshape(-1, 2)
+        count = len(positions)
+
+        # Logical cell (the cell the enemy is in or walking into)
+        self.x = positions[:, 0].copy()
+        self.y = positions[:, 1].copy()
+
+        # Pixel positions: current, previous tick, and drawn (interpolated)
+        self.current_x = self.x * float(cell_size)
+        self.current_y = self.y * float(cell_size)
+        self.previous_x = self.current_x.copy()
+        self.previous_y = self.current_y.copy()
+        self.draw_x = self.current_x.copy()
+        self.draw_y = self.current_y.copy()
+
+        self.moving = np.zeros(count, dtype=bool)
+        self.direction = self.rng.integers(0, len(DIRECTIONS), count)
+        self.speed = np.full(count, float(speed))  # Cells per second
+        self.patrol_timer = np.zeros(count)
+        self.patrol_change_time = self.rng.integers(3, 9, count).astype(float)  # 3-8 seconds
+
+        self.enemies = [EnemyView(self, i) for i in range(count)]
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def change_direction(self, selected):
+        """Give the selected enemies a random open direction (unchanged if boxed in)"""
+        indices = np.flatnonzero(selected)
+        if not indices.size:
+            return
+        valid = self.maze.open_neighbours(self.x[indices], self.y[indices])
+
+        # Random priority per direction, walls never win
+        priority = self.rng.random(valid.shape)
+        priority[~valid] = -1
+        choice = priority.argmax(axis=1)
+        has_choice = valid.any(axis=1)
+        self.direction[indices[has_choice]] = choice[has_choice]
+
+    def update(self, delta_time, pathfinder=None):
+        """
+        Advance every enemy by delta_time seconds. pathfinder is a
+        PathfindingService targeting the player, needed for chasing.
+        Returns (indices, old_x, old_y) of the enemies that changed cells.
+        """
+        self.previous_x[:] = self.current_x
+        self.previous_y[:] = self.current_y
+        idle = ~self.moving
+
+        # Patrol timers
+        self.patrol_timer += delta_time
+        due = self.patrol_timer >= self.patrol_change_time
+        if due.any():
+            self.patrol_timer[due] = 0
+            self.patrol_change_time[due] = self.rng.integers(3, 9, np.count_nonzero(due))
+            self.change_direction(due)
+
+        # Movement animation towards the target cell
+        if self.moving.any():
+            moving = self.moving
+            step = self.speed[moving] * self.cell_size * delta_time
+            dx = self.x[moving] * self.cell_size - self.current_x[moving]
+            dy = self.y[moving] * self.cell_size - self.current_y[moving]
+            arrived = (np.abs(dx) <= step) & (np.abs(dy) <= step)
+            self.current_x[moving] = np.where(arrived, self.x[moving] * self.cell_size,
+                                              self.current_x[moving] + np.sign(dx) * step)
+            self.current_y[moving] = np.where(arrived, self.y[moving] * self.cell_size,
+                                              self.current_y[moving] + np.sign(dy) * step)
+            self.moving[np.flatnonzero(moving)[arrived]] = False
+
+        # Enemies that were standing still step into their next cell, or
+        # turn if it's a wall
+        changed = np.flatnonzero(idle)
+        old_x = self.x[changed]
+        old_y = self.y[changed]
+        if changed.size and pathfinder is not None and self.chase_range > 0:
+            self.chase(changed, pathfinder)
+        if changed.size:
+            next_x = old_x + DIRECTIONS[self.direction[changed], 0]
+            next_y = old_y + DIRECTIONS[self.direction[changed], 1]
+            can_move = self.maze.open_mask(next_x, next_y)
+
+            movers = changed[can_move]
+            self.x[movers] = next_x[can_move]
+            self.y[movers] = next_y[can_move]
+            self.moving[movers] = True
+
+            blocked = np.zeros(len(self.enemies), dtype=bool)
+            blocked[changed[~can_move]] = True
+            self.change_direction(blocked)
+
+            changed, old_x, old_y = movers, old_x[can_move], old_y[can_move]
+
+        self.draw_x[:] = self.current_x
+        self.draw_y[:] = self.current_y
+        return changed, old_x, old_y
+
+    def chase(self, indices, pathfinder):
+        """Point the given enemies that are close enough to the player along the distance field"""
+        distances = pathfinder.distance(self.x[indices], self.y[indices])
+        chasers = indices[(distances > 0) & (distances <= self.chase_range)]
+        if chasers.size:
+            steps = pathfinder.next_directions(self.x[chasers], self.y[chasers])
+            found = steps >= 0
+            self.direction[chasers[found]] = steps[found]
+
+    def interpolate(self, alpha):
+        """Place the drawn positions alpha of the way from the previous tick to the current one"""
+        self.draw_x[:] = self.previous_x + (self.current_x - self.previous_x) * alpha
+        self.draw_y[:] = self.previous_y + (self.current_y - self.previous_y) * alpha
+
+    def set_cell_size(self, new_cell_size):
+        ratio = new_cell_size / self.cell_size
+        self.cell_size = new_cell_size
+        for view in self.enemies:
+            view.cell_size = new_cell_size
+        self.current_x *= ratio
+        self.current_y *= ratio
+        self.previous_x[:] = self.current_x
+        self.previous_y[:] = self.current_y
+        self.draw_x[:] = self.current_x
+        self.draw_y[:] = self.current_y
+
+
+class EnemyView(Enemy):
+    """
+    One enemy of an EnemySwarm seen through the Enemy API. Drawing and
+    collision methods are inherited from Enemy; the state they read comes
+    from the swarm's arrays, and the swarm does all updating.
+    """
+    def __init__(self, swarm, index):
+        self.swarm = swarm
+        self.index = index
+        self.cell_size = swarm.cell_size
+        self.color = (255, 0, 0)  # Red
+
+    @property
+    def x(self):
+        return int(self.swarm.x[self.index])
+
+    @property
+    def y(self):
+        return int(self.swarm.y[self.index])
+
+    @property
+    def current_x(self):
+        return float(self.swarm.current_x[self.index])
+
+    @property
+    def current_y(self):
+        return float(self.swarm.current_y[self.index])
+
+    @property
+    def draw_x(self):
+        return float(self.swarm.draw_x[self.index])
+
+    @property
+    def draw_y(self):
+        return float(self.swarm.draw_y[self.index])
+
+    @property
+    def moving(self):
+        return bool(self.swarm.moving[self.index])
+
+    @property
+    def speed(self):
+        return float(self.swarm.speed[self.index])
+
+    @property
+    def direction(self):
+        dx, dy = DIRECTIONS[self.swarm.direction[self.index]]
+        return (int(dx), int(dy))
+
+    def set_cell_size(self, new_cell_size):
+        # The swarm's arrays hold every enemy at one cell size, so the whole
+        # swarm is rescaled; calling this for each view only rescales once
+        self.swarm.set_cell_size(new_cell_size)
+
+    def update(self, delta_time):
+        raise TypeError("Swarm enemies are updated through EnemySwarm.update")
@@ -0,0 +1,93 @@
+import numpy as np
+
+
+class EntityIndex:
+    """
+    Answers "what is at or near this cell" for the entities of a floor.
+
+    Static entities (traps, keys, stairs and the door) live in per-cell
+    occupancy arrays. Enemies move, so they are kept in a coarse grid of
+    buckets of bucket_size x bucket_size cells, keyed by the cell they are
+    in or walking into, and moved between buckets as they change cells.
+    """
+    def __init__(self, maze_shape, bucket_size=4):
+        self.height, self.width = maze_shape
+        self.bucket_size = bucket_size
+
+        # Trap index + 1 per cell (0 = no trap)
+        self.trap_ids = np.zeros(maze_shape, dtype=np.int32)
+        self.traps = []
+        self.keys = np.zeros(maze_shape, dtype=bool)
+        self.stairs = np.zeros(maze_shape, dtype=bool)
+        self.door = None
+
+        # (bucket x, bucket y) -> set of enemy indices
+        self.enemy_buckets = {}
+
+    def add_traps(self, traps):
+        for trap in traps:
+            self.traps.append(trap)
+            self.trap_ids[trap.y, trap.x] = len(self.traps)
+
+    def add_keys(self, positions):
+        for x, y in positions:
+            self.keys[y, x] = True
+
+    def add_stairs(self, positions):
+        for x, y in positions:
+            self.stairs[y, x] = True
+
+    def set_door(self, position):
+        self.door = position
+
+    def trap_at(self, pos):
+        x, y = pos
+        trap_id = self.trap_ids[y, x]
+        return self.traps[trap_id - 1] if trap_id else None
+
+    def has_key(self, pos):
+        x, y = pos
+        return bool(self.keys[y, x])
+
+    def remove_key(self, pos):
+        x, y = pos
+        self.keys[y, x] = False
+
+    def is_stairs(self, pos):
+        x, y = pos
+        return bool(self.stairs[y, x])
+
+    def is_door(self, pos):
+        return pos == self.door
+
+    def _bucket(self, cell):
+        return (cell[0] // self.bucket_size, cell[1] // self.bucket_size)
+
+    def place_enemies(self, enemies):
+        """Bucket every enemy by its current cell; enemy i is enemies[i]"""
+        self.enemy_buckets = {}
+        for i, enemy in enumerate(enemies):
+            self.enemy_buckets.setdefault(self._bucket(enemy.get_position()), set()).add(i)
+
+    def move_enemy(self, i, old_cell, new_cell):
+        old_bucket = self._bucket(old_cell)
+        new_bucket = self._bucket(new_cell)
+        if old_bucket != new_bucket:
+            self.enemy_buckets[old_bucket].discard(i)
+            self.enemy_buckets.setdefault(new_bucket, set()).add(i)
+
+    def enemies_near(self, pos, radius):
+        """
+        Indices of the enemies whose cell may be within radius (Chebyshev)
+        of pos. Whole buckets are returned, so callers still do the exact test.
+        """
+        x, y = pos
+        min_bx, min_by = self._bucket((x - radius, y - radius))
+        max_bx, max_by = self._bucket((x + radius, y + radius))
+        found = []
+        for bx in range(min_bx, max_bx + 1):
+            for by in range(min_by, max_by + 1):
+                bucket = self.enemy_buckets.get((bx, by))
+                if bucket:
+                    found.extend(bucket)
+        return found
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class FloorWorker:
+    """
+    Generates floors on a background thread ahead of time.
+
+    The game schedules the floors the player is likely to need next (the
+    next floor of the current level and the first floor of the next level)
+    and picks them up with take() when the player gets there. Jobs are
+    identified by a (seed, level, floor) key.
+    """
+    def __init__(self, max_workers=1):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="floor-worker")
+        self.jobs = {}
+
+    def schedule(self, key, build_floor, *args):
+        """Start building a floor in the background unless it's already queued"""
+        if key not in self.jobs:
+            self.jobs[key] = self.executor.submit(build_floor, *args)
+
+    def take(self, key):
+        """
+        Hand over a finished floor. Returns None if the floor was never
+        scheduled, failed, or isn't done yet, in which case the caller
+        generates it synchronously.
+        """
+        job = self.jobs.pop(key, None)
+        if job is None or not job.done():
+            return None
+        try:
+            return job.result()
+        except Exception as e:
+            print(f"Error pre-generating floor {key}: {e}")
+            return None
+
+    def discard_except(self, keys):
+        """Drop speculative jobs that are no longer needed"""
+        for key in list(self.jobs):
+            if key not in keys:
+                # Jobs that already started finish quietly and still fill the level cache
+                self.jobs.pop(key).cancel()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class NullFloorWorker(FloorWorker):
+    """
+    FloorWorker for headless runs: no thread, nothing is built ahead, so
+    every floor is generated synchronously when it is needed.
+    """
+    def __init__(self):
+        self.jobs = {}
+
+    def schedule(self, key, build_floor, *args):
+        pass
+
+    def shutdown(self):
+        pass
@@ -1,30 +1,67 @@
 import pygame
 import sys
-import time
 import os
 import math
 import random
-from maze_generator import MazeGenerator
+import numpy as np
+from maze_generator import MazeGenerator, BRAID_FACTOR
 from player import Player
-from enemy import Enemy
-from trap import Trap
+from enemy_swarm import EnemySwarm
+from trap_scheduler import TrapScheduler
 from theme import Theme
 from level_manager import LevelManager
-from sound_manager import SoundManager
+from level_cache import LevelCache
+from floor_worker import FloorWorker, NullFloorWorker
+from entity_index import EntityIndex
+from pathfinding import PathfindingService
+from lighting import LightingManager
+from dirty_rects import DirtyRectTracker, FrameTimer
+from text_cache import TextCache
+from sprite_atlas import SpriteAtlas
+from render_list import RenderList
+from sound_manager import SoundManager, NullSoundManager
+
+# Screen size assumed when there is no display to ask
+HEADLESS_SCREEN_SIZE = (1920, 1080)
+
+# Longest frame the simulation catches up on; after a longer stall (window
+# dragged, breakpoint) the game slows down instead of running hundreds of ticks
+MAX_FRAME_TIME = 0.25
+
+# Random streams of a floor's entities, derived from the level seed
+ENEMY_RNG_STREAM = 1
+TRAP_RNG_STREAM = 2
 
 class MazeGame:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-        
-        # Get screen info to ensure maze fits
-        screen_info = pygame.display.Info()
-        self.max_screen_width = screen_info.current_w
-        self.max_screen_height = screen_info.current_h
+    def __init__(self, dirty_rendering=False, headless=False, tick_rate=60, frame_rate=60, cache_dir=None):
+        # Headless games run the simulation only: no window, no audio, no
+        # drawing, no background thread and nothing written to disk (no
+        # saved progress, and no level cache unless given a cache_dir), for
+        # bots, replays and load tests
+        self.headless = headless
         
         # Initialize managers
-        self.level_manager = LevelManager()
-        self.sound_manager = SoundManager()
+        if headless:
+            self.max_screen_width, self.max_screen_height = HEADLESS_SCREEN_SIZE
+            self.level_manager = LevelManager(save_file=None)
+            # No progress to earn without a player; any level can be run
+            self.level_manager.levels_unlocked = self.level_manager.max_level
+            self.sound_manager = NullSoundManager()
+            self.level_cache = LevelCache(cache_dir)
+            self.floor_worker = NullFloorWorker()
+        else:
+            pygame.init()
+            pygame.mixer.init()
+            
+            # Get screen info to ensure maze fits
+            screen_info = pygame.display.Info()
+            self.max_screen_width = screen_info.current_w
+            self.max_screen_height = screen_info.current_h
+            
+            self.level_manager = LevelManager()
+            self.sound_manager = SoundManager()
+            self.level_cache = LevelCache(cache_dir or "level_cache")
+            self.floor_worker = FloorWorker()
         
         # Game state
         self.game_active = False
@@ -32,14 +69,17 @@ class MazeGame:
         self.game_over = False
         self.level_complete = False
         self.show_minimap = True
+        self.show_frame_stats = False  # Draw cost overlay, toggled with F3
         self.current_floor = 1
         self.total_floors = 1
         self.keys_collected = 0
         self.keys_required = 0
         self.time_limit = 0
-        self.start_time = 0
+        self.game_time = 0  # Seconds of play on the current level, advanced by update()
         self.elapsed_time = 0
         self.score = 0
+        self.level_seed = None
+        self.next_level_seed = None
         
         # Screen settings
         self.info_panel_height = 100
@@ -47,14 +87,30 @@ class MazeGame:
         
         # Game objects
         self.player = None
+        self.enemy_swarm = None
         self.enemies = []
+        self.trap_scheduler = None
         self.traps = []
         
+        # Lookup of what is at or near each cell of the current floor
+        self.entity_index = None
+        
+        # Distance field towards the player for chasing enemies
+        self.pathfinder = PathfindingService()
+        
         # Theme
         self.theme = Theme("dungeon")
         
-        # Light surface for lighting effects
-        self.light_surface = None
+        # Light mask for lighting effects
+        self.lighting = None
+        
+        # Pre-rendered walls, paths and exit of the current floor
+        self.maze_surface = None
+        self.maze_surface_cell_size = None
+        
+        # Scaled minimap of the explored area, rebuilt when the player explores
+        self.minimap_surface = None
+        self.minimap_key = None
         
         # Game screens
         self.current_screen = "menu"  # menu, level_select, game, game_over, victory
@@ -62,6 +118,28 @@ class MazeGame:
         # Sound settings
         self.sound_muted = False
         
+        # Rendering: dirty-rect mode only repaints and presents the regions
+        # that changed, the frame timer measures draw cost in either mode
+        self.dirty_rendering = dirty_rendering
+        self.dirty_tracker = DirtyRectTracker()
+        self.frame_timer = FrameTimer()
+        self.last_drawn_view = None
+        self.frame_stats = ""  # Last frame's figures, shown by the overlay
+        
+        # Timing: the simulation advances in fixed ticks of 1/tick_rate
+        # seconds whatever the frame rate, and frames are capped at frame_rate
+        self.tick_time = 1.0 / tick_rate
+        self.frame_rate = frame_rate
+        
+        # Fonts and rendered text shared by every screen, so static labels
+        # are rendered once and dynamic ones only when their value changes
+        self.text_cache = TextCache()
+        
+        # Pre-rendered entity sprites, made for the cell size in init_game,
+        # and the list they are batched into each frame
+        self.sprite_atlas = None
+        self.render_list = RenderList()
+        
         # Initialize the menu
         self.init_menu()
         
@@ -74,8 +152,7 @@ class MazeGame:
         screen_height = min(600, self.max_screen_height)
         
         # Initialize screen
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
-        pygame.display.set_caption("Maze Runner")
+        self.set_screen((screen_width, screen_height), "Maze Runner")
         
         # Play menu music
         self.sound_manager.play_menu_music()
@@ -89,16 +166,28 @@ class MazeGame:
         screen_height = min(600, self.max_screen_height)
         
         # Initialize screen
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
-        pygame.display.set_caption("Maze Runner - Level Select")
+        self.set_screen((screen_width, screen_height), "Maze Runner - Level Select")
+    
+    def set_screen(self, size, caption):
+        """Open (or resize) the game window; headless games get an off-screen surface"""
+        if self.headless:
+            self.screen = pygame.Surface(size)
+        else:
+            self.screen = pygame.display.set_mode(size)
+            pygame.display.set_caption(caption)
         
-    def init_game(self, level_num=None):
-        # Set the current level if provided
-        if level_num is not None:
-            self.level_manager.set_level(level_num)
+    def init_game(self, level_num=None, seed=None):
+        # Set the current level if provided; everything below reads it back
+        # from the level manager, so a level that can't be set is an error
+        if level_num is not None and not self.level_manager.set_level(level_num):
+            raise ValueError(f"Level {level_num} is not unlocked")
+        
+        # A new seed gives a fresh layout; restarts pass the current seed back
+        # in so the same level loads from the level cache
+        self.level_seed = seed if seed is not None else random.randrange(2 ** 32)
         
         # Get the level configuration
-        level_config = self.level_manager.get_level_config(level_num)
+        level_config = self.level_manager.get_level_config()
         
         # Set theme based on level
         self.theme = Theme(level_config["theme"])
@@ -127,59 +216,49 @@ class MazeGame:
         screen_height = min(screen_height, self.max_screen_height)
         
         # Initialize screen
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
-        pygame.display.set_caption(f"Maze Runner - Level {self.level_manager.current_level}")
+        self.set_screen((screen_width, screen_height), f"Maze Runner - Level {self.level_manager.current_level}")
         
-        # Generate the maze
-        maze_generator = MazeGenerator(maze_width, maze_height)
-        self.maze_generator = maze_generator  # Store reference to maze generator
+        # Sprites for the new cell size (nothing is drawn when headless)
+        if not self.headless:
+            if self.sprite_atlas is None:
+                self.sprite_atlas = SpriteAtlas(self.cell_size)
+            else:
+                self.sprite_atlas.set_cell_size(self.cell_size)
         
-        maze_result = maze_generator.generate_maze(
-            keys_required=level_config.get("keys_required", 0),
-            num_enemies=level_config.get("enemies", 0),
-            num_traps=level_config.get("traps", 0),
-            num_floors=level_config.get("num_floors", 1),
-            current_floor=1,
-            complexity=level_config.get("complexity", 0.75),
-            density=level_config.get("density", 0.75),
-            min_exit_distance=level_config.get("min_exit_distance", None)
-        )
+        # Take the maze from the background worker, or generate it now
+        maze_generator, maze_result = self.take_floor(level_config, 1)
+        self.maze_generator = maze_generator  # Store reference to maze generator
         
         # Unpack the result properly
         self.maze, self.start_pos, self.exit_pos = maze_result
         
         # Initialize player
         start_x, start_y = self.start_pos
-        self.player = Player(start_x, start_y, self.cell_size)
-        
-        # Initialize enemies
-        self.enemies = []
-        enemy_speed = level_config.get("enemy_speed", 0.5)  # Default speed if not specified
-        for enemy_pos in maze_generator.get_enemy_positions():
-            self.enemies.append(Enemy(
-                enemy_pos[0], 
-                enemy_pos[1], 
-                self.cell_size, 
-                self.maze,
-                speed=enemy_speed
-            ))
-        
-        # Initialize traps
-        self.traps = []
+        self.player = Player(start_x, start_y, self.cell_size, self.maze.shape)
+        
+        # Initialize enemies; the swarm updates them all at once and
+        # self.enemies holds a view of each for drawing and collisions
+        enemy_speed = level_config.get("enemy_speed", 1.5)  # Default speed (cells per second) if not specified
+        chase_range = level_config.get("enemy_chase_range", 0)  # Steps; enemies only patrol by default
+        self.enemy_swarm = EnemySwarm(maze_generator.get_enemy_positions(), self.cell_size, self.maze,
+                                      speed=enemy_speed, chase_range=chase_range,
+                                      rng=self.floor_rng(ENEMY_RNG_STREAM))
+        self.pathfinder.set_maze(self.maze, maze_generator.graph)
+        self.enemies = self.enemy_swarm.enemies
+        
+        # Initialize traps; their states all come from the scheduler's clock,
+        # each trap at its own seeded point in the cycle
         trap_activation_time = level_config.get("trap_activation_time", 3.0)  # Default if not specified
-        for trap_info in maze_generator.get_trap_positions():
-            x, y, trap_type = trap_info
-            self.traps.append(Trap(
-                x, y, 
-                self.cell_size, 
-                trap_type,
-                activation_time=trap_activation_time
-            ))
+        self.trap_scheduler = TrapScheduler(maze_generator.get_trap_positions(), self.cell_size,
+                                            activation_time=trap_activation_time)
+        self.trap_scheduler.scatter(self.floor_rng(TRAP_RNG_STREAM))
+        self.traps = self.trap_scheduler.traps
         
         # Initialize key and door positions
         self.key_positions = maze_generator.get_key_positions()
         self.door_position = maze_generator.get_door_position()
         self.stair_positions = maze_generator.get_stair_positions()
+        self.build_entity_index()
         
         # Reset game state
         self.game_active = True
@@ -187,28 +266,184 @@ class MazeGame:
         self.game_over = False
         self.level_complete = False
         self.keys_collected = 0
-        self.start_time = time.time()
+        self.game_time = 0
         self.elapsed_time = 0
         self.score = 0
         
-        # Adjust player speed based on cell size
-        self.player.speed = max(2, self.cell_size // 6)
-        
         # Create light surface for lighting effects
         self.create_light_surface()
         
+        # Static maze layer is rendered on the first frame of the new floor
+        self.invalidate_maze_surface()
+        
+        # Start building the floors the player will need next
+        self.schedule_pregeneration()
+        
         # Play theme music
         self.sound_manager.play_theme_music(self.theme.name)
         
         # Set current screen to game
         self.current_screen = "game"
     
+    def generate_floor(self, level_config, floor, seed=None):
+        """
+        Generate one floor of a level from its seed (the current level seed by default).
+        Floors already generated for this seed are loaded from the level cache.
+        Safe to call from the floor worker thread.
+        """
+        if seed is None:
+            seed = self.level_seed
+        maze_width, maze_height = level_config["size"]
+        floor_seed = [seed, floor]
+        maze_generator = MazeGenerator(maze_width, maze_height, seed=floor_seed)
+        
+        if floor == 1:
+            generate_args = {
+                "keys_required": level_config.get("keys_required", 0),
+                "num_enemies": level_config.get("enemies", 0),
+                "num_traps": level_config.get("traps", 0),
+                "min_exit_distance": level_config.get("min_exit_distance", None)
+            }
+        else:
+            # Later floors share the level's enemies and traps and have no keys
+            generate_args = {
+                "keys_required": 0,
+                "num_enemies": level_config["enemies"] // level_config["floors"],
+                "num_traps": level_config["traps"] // level_config["floors"]
+            }
+        
+        cache_key = self.level_cache.make_key(floor_seed, level_config, floor)
+        maze_result = self.level_cache.generate(
+            maze_generator,
+            cache_key,
+            num_floors=level_config.get("floors", 1),
+            current_floor=floor,
+            complexity=level_config.get("complexity", 0.75),
+            density=level_config.get("density", 0.75),
+            engine=level_config.get("maze_engine", "vectorized"),
+            braid_factor=level_config.get("braid_factor", BRAID_FACTOR),
+            **generate_args
+        )
+        return maze_generator, maze_result
+    
+    def floor_rng(self, stream):
+        """
+        Random state for one kind of entity on the current floor, derived
+        from the level seed like the floor's layout, so a seeded level
+        plays out the same every time
+        """
+        return np.random.default_rng([self.level_seed, self.current_floor, stream])
+    
+    def take_floor(self, level_config, floor):
+        """
+        Hand over a floor of the current level pre-generated by the floor worker,
+        falling back to generating it synchronously if the worker isn't done.
+        """
+        key = (self.level_seed, self.level_manager.current_level, floor)
+        pregenerated = self.floor_worker.take(key)
+        if pregenerated is not None:
+            return pregenerated
+        return self.generate_floor(level_config, floor)
+    
+    def schedule_pregeneration(self):
+        """Speculatively build the next floor and the next level in the background"""
+        level = self.level_manager.current_level
+        wanted = []
+        
+        # Next floor of this level
+        if self.current_floor < self.total_floors:
+            level_config = self.level_manager.get_level_config(level)
+            key = (self.level_seed, level, self.current_floor + 1)
+            self.floor_worker.schedule(key, self.generate_floor, level_config, self.current_floor + 1, self.level_seed)
+            wanted.append(key)
+        
+        # First floor of the next level; its seed is picked now so that
+        # pressing N on the victory screen starts exactly this layout
+        if level < self.level_manager.max_level:
+            if self.next_level_seed is None or self.next_level_seed == self.level_seed:
+                self.next_level_seed = random.randrange(2 ** 32)
+            next_config = self.level_manager.get_level_config(level + 1)
+            key = (self.next_level_seed, level + 1, 1)
+            self.floor_worker.schedule(key, self.generate_floor, next_config, 1, self.next_level_seed)
+            wanted.append(key)
+        
+        self.floor_worker.discard_except(wanted)
+    
+    def build_entity_index(self):
+        """Index the current floor's entities for the per-tick cell lookups"""
+        self.entity_index = EntityIndex(self.maze.shape)
+        self.entity_index.add_traps(self.traps)
+        self.entity_index.add_keys(self.key_positions)
+        self.entity_index.add_stairs(self.stair_positions)
+        self.entity_index.set_door(self.door_position)
+        self.entity_index.place_enemies(self.enemies)
+    
     def create_light_surface(self):
+        if self.headless:
+            # Nothing is drawn, so there is no light mask to keep up to date
+            self.lighting = None
+            return
+        
         # Get the maze dimensions from the maze array
         maze_width, maze_height = self.maze.shape[1], self.maze.shape[0]
         
-        # Create a surface for the lighting effect
-        self.light_surface = pygame.Surface((maze_width * self.cell_size, maze_height * self.cell_size), pygame.SRCALPHA)
+        # Create the light mask for the lighting effect
+        self.lighting = LightingManager(maze_width, maze_height, self.cell_size)
+    
+    def invalidate_maze_surface(self):
+        """Forget the pre-rendered maze layer (new floor or cell size)"""
+        self.maze_surface = None
+        self.maze_surface_cell_size = None
+        self.minimap_surface = None
+        self.minimap_key = None
+        self.dirty_tracker.invalidate()
+    
+    def render_maze_surface(self):
+        """
+        Render the static part of the floor (walls, paths and exit) into one
+        surface. The whole image is built from the maze array with NumPy and
+        uploaded through pygame.surfarray in a single call.
+        """
+        cell = self.cell_size
+        
+        # One tile per cell type: paths get a 1px border, walls are solid
+        path_tile = np.empty((cell, cell, 3), dtype=np.uint8)
+        path_tile[:] = (150, 150, 150)
+        path_tile[1:-1, 1:-1] = (200, 200, 200)
+        wall_tile = np.empty((cell, cell, 3), dtype=np.uint8)
+        wall_tile[:] = (50, 50, 50)
+        exit_tile = np.empty((cell, cell, 3), dtype=np.uint8)
+        exit_tile[:] = (0, 255, 0)  # Green exit
+        tiles = np.stack([path_tile, wall_tile, exit_tile])
+        
+        # Tile index per cell: 0 path, 1 wall, 2 exit
+        cell_types = (np.asarray(self.maze) != 0).astype(np.intp)
+        exit_x, exit_y = self.exit_pos
+        cell_types[exit_y, exit_x] = 2
+        
+        # (rows, cols, cell, cell, 3) -> (rows * cell, cols * cell, 3), then
+        # swap to the (x, y) order surfarray expects
+        rows, cols = cell_types.shape
+        image = tiles[cell_types].transpose(0, 2, 1, 3, 4).reshape(rows * cell, cols * cell, 3)
+        
+        self.maze_surface = pygame.surfarray.make_surface(image.transpose(1, 0, 2))
+        self.maze_surface_cell_size = cell
+    
+    def render_minimap_surface(self, size):
+        """
+        Render the explored part of the maze at one pixel per cell and scale
+        it to the minimap size. Only cells the player has visited or stood
+        next to are shown.
+        """
+        colors = np.array([
+            (10, 10, 10),     # Unexplored (minimap background)
+            (10, 10, 10),
+            (180, 180, 180),  # Explored path
+            (100, 100, 100)   # Explored wall
+        ], dtype=np.uint8)
+        cell_types = self.player.explored * 2 + (np.asarray(self.maze) != 0)
+        tiny = pygame.surfarray.make_surface(colors[cell_types].transpose(1, 0, 2))
+        self.minimap_surface = pygame.transform.scale(tiny, size)
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -305,7 +540,7 @@ class MazeGame:
                 return  # Don't process other buttons if mute was clicked
             
             # Get level buttons
-            font = pygame.font.SysFont("Arial", 24)
+            font = self.text_cache.font("Arial", 24)
             level_buttons = self.level_manager.get_level_selection_surfaces(font)
             
             # Position buttons in a grid
@@ -377,12 +612,16 @@ class MazeGame:
             
             if event.key == pygame.K_r:
                 # Restart the current level
-                self.init_game(self.level_manager.current_level)
+                self.init_game(self.level_manager.current_level, seed=self.level_seed)
             
             if event.key == pygame.K_m:
                 # Toggle minimap
                 self.show_minimap = not self.show_minimap
             
+            if event.key == pygame.K_F3:
+                # Toggle the frame stats overlay
+                self.show_frame_stats = not self.show_frame_stats
+            
             if event.key == pygame.K_ESCAPE:
                 # Return to level select
                 self.sound_manager.play_sound("menu_back")
@@ -413,7 +652,7 @@ class MazeGame:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:
                 # Restart the current level
-                self.init_game(self.level_manager.current_level)
+                self.init_game(self.level_manager.current_level, seed=self.level_seed)
             elif event.key == pygame.K_ESCAPE:
                 # Return to level select
                 self.sound_manager.play_sound("menu_back")
@@ -424,22 +663,37 @@ class MazeGame:
             if event.key == pygame.K_n:
                 # Go to next level if available
                 if self.level_manager.next_level():
-                    self.init_game()
+                    self.init_game(seed=self.next_level_seed)
                 else:
                     # Return to level select if no more levels
                     self.init_level_select()
             elif event.key == pygame.K_r:
                 # Replay the current level
-                self.init_game(self.level_manager.current_level)
+                self.init_game(self.level_manager.current_level, seed=self.level_seed)
             elif event.key == pygame.K_ESCAPE:
                 # Return to level select
                 self.sound_manager.play_sound("menu_back")
                 self.init_level_select()
     
+    def step(self, delta_time, move=None):
+        """
+        Advance the game by one tick without going through pygame events,
+        for headless bots and replays. move is an optional (dx, dy) that is
+        applied like an arrow key press before updating.
+        """
+        if move is not None and self.game_active and not self.game_paused:
+            self.player.stop_continuous_movement()
+            if self.player.move(move[0], move[1], self.maze) and not self.sound_muted:
+                self.sound_manager.play_sound("move")
+        self.update(delta_time)
+    
     def update(self, delta_time):
         if self.current_screen == "game" and self.game_active and not self.game_paused:
+            # Advance the level clock; time limits and the score use play time
+            self.game_time += delta_time
+            
             # Update player
-            player_moved = self.player.update()
+            player_moved = self.player.update(delta_time)
             
             # Play footstep sound if player moved to a new cell and sound is not muted
             if player_moved and not self.sound_muted:
@@ -452,105 +706,103 @@ class MazeGame:
                     if not self.sound_muted:
                         self.sound_manager.play_sound("move")
             
-            # Update enemies
-            for enemy in self.enemies:
-                enemy.update(delta_time)
-                
-                # Check for collision with player
-                if self.player.get_rect().colliderect(enemy.get_rect()):
+            # Update enemies, moving them between index buckets as they change cells
+            # Point the chase distance field at the player's cell; it's only
+            # rebuilt when the player moved to another cell
+            if self.enemy_swarm.chase_range > 0:
+                self.pathfinder.set_target(self.player.get_position())
+            changed, old_x, old_y = self.enemy_swarm.update(delta_time, self.pathfinder)
+            for i, x, y in zip(changed.tolist(), old_x.tolist(), old_y.tolist()):
+                self.entity_index.move_enemy(i, (x, y), self.enemies[i].get_position())
+            
+            # Check for collision with player; an enemy and the player are at
+            # most a cell away from their cells, so only enemies within two
+            # cells can touch
+            player_pos = self.player.get_position()
+            player_rect = self.player.get_rect()
+            for i in self.entity_index.enemies_near(player_pos, 2):
+                if player_rect.colliderect(self.enemies[i].get_rect()):
                     self.game_over = True
                     self.game_active = False
                     self.sound_manager.play_sound("enemy_attack")
                     self.sound_manager.play_sound("game_over")
                     self.current_screen = "game_over"
+                    break
             
             # Update traps
-            for trap in self.traps:
-                trap.update(delta_time)
-                
-                # Check for collision with active trap
-                if trap.is_dangerous() and self.player.get_position() == (trap.x, trap.y):
-                    self.game_over = True
-                    self.game_active = False
-                    self.sound_manager.play_sound("trap_activate")
-                    self.sound_manager.play_sound("game_over")
-                    self.current_screen = "game_over"
+            self.trap_scheduler.update(delta_time)
+            
+            # Check for collision with an active trap
+            trap = self.entity_index.trap_at(player_pos)
+            if trap is not None and trap.is_dangerous():
+                self.game_over = True
+                self.game_active = False
+                self.sound_manager.play_sound("trap_activate")
+                self.sound_manager.play_sound("game_over")
+                self.current_screen = "game_over"
             
             # Check for key collection
-            player_pos = self.player.get_position()
-            if player_pos in self.key_positions:
+            if self.entity_index.has_key(player_pos):
+                self.entity_index.remove_key(player_pos)
                 self.key_positions.remove(player_pos)
                 self.keys_collected += 1
                 self.sound_manager.play_sound("key_pickup")
             
             # Check if player reached stairs
-            if player_pos in self.stair_positions and self.current_floor < self.total_floors:
+            if self.entity_index.is_stairs(player_pos) and self.current_floor < self.total_floors:
                 self.current_floor += 1
                 self.sound_manager.play_sound("stairs")
                 
                 # Generate new floor
                 level_config = self.level_manager.get_level_config()
-                maze_width, maze_height = level_config["size"]
-                
-                self.maze_generator = MazeGenerator(maze_width, maze_height)
-                self.maze = self.maze_generator.generate_maze(
-                    keys_required=self.keys_required if self.current_floor == 1 else 0,
-                    num_enemies=level_config["enemies"] // self.total_floors,
-                    num_traps=level_config["traps"] // self.total_floors,
-                    num_floors=self.total_floors,
-                    current_floor=self.current_floor
-                )
+                self.maze_generator, maze_result = self.take_floor(level_config, self.current_floor)
+                self.maze, self.start_pos, self.exit_pos = maze_result
                 
                 # Reset player position
-                start_x, start_y = self.maze_generator.get_start_position()
-                self.player.reset(start_x, start_y)
-                
-                # Update game objects for new floor
-                self.exit_pos = self.maze_generator.get_exit_position()
+                start_x, start_y = self.start_pos
+                self.player.reset(start_x, start_y, self.maze.shape)
                 
                 # Initialize enemies
-                self.enemies = []
-                enemy_speed = level_config.get("enemy_speed", 0.5)  # Default speed if not specified
-                for enemy_pos in self.maze_generator.get_enemy_positions():
-                    self.enemies.append(Enemy(
-                        enemy_pos[0], 
-                        enemy_pos[1], 
-                        self.cell_size, 
-                        self.maze,
-                        speed=enemy_speed
-                    ))
+                enemy_speed = level_config.get("enemy_speed", 1.5)  # Default speed (cells per second) if not specified
+                chase_range = level_config.get("enemy_chase_range", 0)  # Steps; enemies only patrol by default
+                self.enemy_swarm = EnemySwarm(self.maze_generator.get_enemy_positions(), self.cell_size, self.maze,
+                                              speed=enemy_speed, chase_range=chase_range,
+                                              rng=self.floor_rng(ENEMY_RNG_STREAM))
+                self.pathfinder.set_maze(self.maze, self.maze_generator.graph)
+                self.enemies = self.enemy_swarm.enemies
                 
-                # Initialize traps
-                self.traps = []
+                # Initialize traps; their states all come from the scheduler's clock,
+                # each trap at its own seeded point in the cycle
                 trap_activation_time = level_config.get("trap_activation_time", 3.0)  # Default if not specified
-                for trap_info in self.maze_generator.get_trap_positions():
-                    x, y, trap_type = trap_info
-                    self.traps.append(Trap(
-                        x, y, 
-                        self.cell_size, 
-                        trap_type,
-                        activation_time=trap_activation_time
-                    ))
+                self.trap_scheduler = TrapScheduler(self.maze_generator.get_trap_positions(), self.cell_size,
+                                                    activation_time=trap_activation_time)
+                self.trap_scheduler.scatter(self.floor_rng(TRAP_RNG_STREAM))
+                self.traps = self.trap_scheduler.traps
                 
                 # Update key and door positions
                 self.key_positions = self.maze_generator.get_key_positions()
                 self.door_position = self.maze_generator.get_door_position()
                 self.stair_positions = self.maze_generator.get_stair_positions()
+                self.build_entity_index()
                 
-                # Create new light surface
+                # Create new light surface and drop the old floor's maze layer
                 self.create_light_surface()
+                self.invalidate_maze_surface()
+                
+                # Start building the floor after this one
+                self.schedule_pregeneration()
             
             # Check if player reached the exit
             if player_pos == self.exit_pos:
                 # Check if door is locked and player has enough keys
-                if self.door_position == player_pos and self.keys_collected < self.keys_required:
+                if self.entity_index.is_door(player_pos) and self.keys_collected < self.keys_required:
                     # Door is locked
                     self.sound_manager.play_sound("door_unlock")
                 else:
                     # Level complete
                     self.game_active = False
                     self.level_complete = True
-                    self.elapsed_time = time.time() - self.start_time
+                    self.elapsed_time = self.game_time
                     self.calculate_score()
                     
                     # Unlock next level if this is the highest level completed
@@ -569,8 +821,7 @@ class MazeGame:
             
             # Check time limit if set
             if self.time_limit > 0:
-                current_time = time.time() - self.start_time
-                if current_time >= self.time_limit:
+                if self.game_time >= self.time_limit:
                     self.game_over = True
                     self.game_active = False
                     self.sound_manager.play_sound("game_over")
@@ -589,16 +840,16 @@ class MazeGame:
         # Calculate Manhattan distance to exit
         exit_distance = abs(player_pos[0] - exit_pos[0]) + abs(player_pos[1] - exit_pos[1])
         
-        # Check proximity to enemies
+        # Check proximity to enemies; only nearby ones can matter
+        max_distance = 10  # Maximum distance to consider for music adjustment
         enemy_distance = float('inf')
-        for enemy in self.enemies:
-            enemy_pos = enemy.get_position()
+        for i in self.entity_index.enemies_near(player_pos, max_distance):
+            enemy_pos = self.enemies[i].get_position()
             dist = abs(player_pos[0] - enemy_pos[0]) + abs(player_pos[1] - enemy_pos[1])
             enemy_distance = min(enemy_distance, dist)
         
         # Determine which proximity to use for music adjustment
         proximity_distance = min(exit_distance, enemy_distance)
-        max_distance = 10  # Maximum distance to consider for music adjustment
         
         # Adjust music based on proximity
         if proximity_distance < max_distance:
@@ -631,32 +882,138 @@ class MazeGame:
         self.score = max(10, self.score)
     
     def draw(self):
-        if self.current_screen == "menu":
-            self.draw_menu()
-        elif self.current_screen == "level_select":
-            self.draw_level_select()
-        elif self.current_screen == "game":
-            self.draw_game()
-        elif self.current_screen == "game_over":
-            self.draw_game_over()
-        elif self.current_screen == "victory":
-            self.draw_victory()
-        elif self.current_screen == "description":
-            self.draw_game_description()
+        if self.headless:
+            return
+        
+        self.frame_timer.begin()
+        self.render_list.begin_frame()
+        
+        # In dirty-rect mode, running game frames only repaint what changed;
+        # anything else (other screens, pause, a new floor) is a full redraw
+        view = (self.current_screen, self.game_paused)
+        if (self.dirty_rendering and self.current_screen == "game" and not self.game_paused and
+                view == self.last_drawn_view and not self.dirty_tracker.needs_full_redraw):
+            pygame.display.update(self.draw_game_dirty())
+        else:
+            if self.current_screen == "menu":
+                self.draw_menu()
+            elif self.current_screen == "level_select":
+                self.draw_level_select()
+            elif self.current_screen == "game":
+                self.draw_game()
+            elif self.current_screen == "game_over":
+                self.draw_game_over()
+            elif self.current_screen == "victory":
+                self.draw_victory()
+            elif self.current_screen == "description":
+                self.draw_game_description()
+            
+            pygame.display.flip()
+            
+            # Record what is on screen as the baseline for the next dirty frame
+            if self.dirty_rendering and self.current_screen == "game":
+                self.track_game_regions()
+                self.dirty_tracker.end_frame(self.screen.get_rect())
+                self.dirty_tracker.full_redraw_done()
+        
+        self.last_drawn_view = view
+        self.frame_timer.end()
+        self.frame_stats = self.format_frame_stats()
+    
+    def format_frame_stats(self):
+        """One line with the draw cost of the last frames for the overlay"""
+        render_list = self.render_list
+        stats = (f"Frame {self.frame_timer.average_ms():.1f} ms | Blits {render_list.draw_calls} calls, "
+                 f"{render_list.sprites} sprites, {render_list.culled} culled")
+        if self.dirty_rendering:
+            stats += f" | Dirty {self.dirty_tracker.rect_count} rects, {self.dirty_tracker.area} px"
+        return stats
+    
+    def frame_stats_rect(self):
+        font = self.text_cache.font("Arial", 14)
+        return pygame.Rect((4, 4), font.size(self.frame_stats))
+    
+    def draw_frame_stats(self):
+        """Draw the frame stats overlay in the top left corner"""
+        font = self.text_cache.font("Arial", 14)
+        text = font.render(self.frame_stats, True, (255, 255, 0), (0, 0, 0))
+        self.screen.blit(text, (4, 4))
+    
+    def cell_rect(self, pos):
+        x, y = pos
+        return pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+    
+    def track_game_regions(self):
+        """Register every changing part of the game screen with the dirty-rect tracker"""
+        tracker = self.dirty_tracker
+        tracker.begin_frame()
+        
+        tracker.track("player", self.player.get_draw_rect())
+        for i, enemy in enumerate(self.enemies):
+            tracker.track(("enemy", i), enemy.get_draw_rect(), enemy.direction)
+        for i, trap in enumerate(self.traps):
+            tracker.track(("trap", i), trap.get_draw_rect(), trap.get_state())
+        for key_pos in self.key_positions:
+            tracker.track(("key", key_pos), self.cell_rect(key_pos))
+        if self.door_position:
+            tracker.track("door", self.cell_rect(self.door_position), self.keys_collected >= self.keys_required)
+        for stair_pos in self.stair_positions:
+            tracker.track(("stairs", stair_pos), self.cell_rect(stair_pos))
+        
+        # The info panel (with the minimap) changes with the timer, steps and sound state
+        panel_top = self.maze.shape[0] * self.cell_size
+        panel_rect = pygame.Rect(0, panel_top, self.screen.get_width(), self.screen.get_height() - panel_top)
+        current_time = self.game_time if self.game_active else self.elapsed_time
+        panel_state = (
+            f"{current_time:.1f}",
+            self.player.get_steps_taken(),
+            self.player.get_position(),
+            self.sound_muted,
+            self.game_active,
+            self.score,
+            self.show_minimap
+        )
+        tracker.track("info_panel", panel_rect, panel_state)
         
-        pygame.display.flip()
+        if self.show_frame_stats:
+            tracker.track("frame_stats", self.frame_stats_rect(), self.frame_stats)
+    
+    def draw_game_dirty(self):
+        """Repaint only the changed regions of the game screen and return them"""
+        self.track_game_regions()
+        light_rect = self.lighting.update(self.player.get_position(), self.theme)
+        if light_rect is not None:
+            self.dirty_tracker.mark(light_rect)
+        rects = self.dirty_tracker.end_frame(self.screen.get_rect())
+        
+        panel_top = self.maze.shape[0] * self.cell_size
+        for rect in rects:
+            # Rebuild the region from the layers, clipped to it
+            self.screen.set_clip(rect)
+            self.screen.fill((0, 0, 0), rect)
+            self.screen.blit(self.maze_surface, rect.topleft, rect)
+            self.draw_game_objects(area=rect)
+            if rect.bottom > panel_top:
+                self.draw_info_panel()
+                if self.show_minimap:
+                    self.draw_minimap()
+            if self.show_frame_stats and rect.colliderect(self.frame_stats_rect()):
+                self.draw_frame_stats()
+        self.screen.set_clip(None)
+        
+        return rects
     
     def draw_menu(self):
         # Draw background
         self.screen.fill((20, 20, 30))
         
         # Draw title
-        font_title = pygame.font.SysFont("Arial", 48)
+        font_title = self.text_cache.font("Arial", 48)
         title_text = font_title.render("MAZE RUNNER", True, (255, 255, 255))
         self.screen.blit(title_text, (self.screen.get_width() // 2 - title_text.get_width() // 2, 100))
         
         # Draw buttons
-        font_button = pygame.font.SysFont("Arial", 32)
+        font_button = self.text_cache.font("Arial", 32)
         
         # Play button
         play_rect = pygame.Rect(300, 220, 200, 50)
@@ -677,7 +1034,7 @@ class MazeGame:
         self.screen.blit(quit_text, (quit_rect.centerx - quit_text.get_width() // 2, quit_rect.centery - quit_text.get_height() // 2))
         
         # Draw instructions
-        font_instructions = pygame.font.SysFont("Arial", 18)
+        font_instructions = self.text_cache.font("Arial", 18)
         instructions_text = font_instructions.render("Press ENTER to start or click PLAY", True, (200, 200, 200))
         self.screen.blit(instructions_text, (self.screen.get_width() // 2 - instructions_text.get_width() // 2, 430))
         
@@ -696,12 +1053,12 @@ class MazeGame:
         self.screen.fill((30, 30, 40))
         
         # Draw title
-        font_title = pygame.font.SysFont("Arial", 36)
+        font_title = self.text_cache.font("Arial", 36)
         title_text = font_title.render("SELECT LEVEL", True, (255, 255, 255))
         self.screen.blit(title_text, (self.screen.get_width() // 2 - title_text.get_width() // 2, 50))
         
         # Draw level buttons
-        font = pygame.font.SysFont("Arial", 24)
+        font = self.text_cache.font("Arial", 24)
         level_buttons = self.level_manager.get_level_selection_surfaces(font)
         
         # Position buttons in a grid
@@ -731,7 +1088,7 @@ class MazeGame:
         self.screen.blit(reset_text, (reset_rect.centerx - reset_text.get_width() // 2, reset_rect.centery - reset_text.get_height() // 2))
         
         # Draw instructions
-        font_instructions = pygame.font.SysFont("Arial", 18)
+        font_instructions = self.text_cache.font("Arial", 18)
         instructions_text = font_instructions.render("Press 1-9 to select a level or click on a level", True, (200, 200, 200))
         self.screen.blit(instructions_text, (self.screen.get_width() // 2 - instructions_text.get_width() // 2, 500))
         
@@ -757,6 +1114,10 @@ class MazeGame:
         if self.show_minimap:
             self.draw_minimap()
         
+        # Draw frame stats if enabled
+        if self.show_frame_stats:
+            self.draw_frame_stats()
+        
         # Draw pause overlay if paused
         if self.game_paused:
             self.draw_pause_overlay()
@@ -764,65 +1125,15 @@ class MazeGame:
             self.mute_button_rect = self.draw_mute_button()
     
     def draw_maze_with_lighting(self):
-        # Clear the light surface
-        self.light_surface.fill((0, 0, 0, 255))
-        
-        # Get player position
-        player_x, player_y = self.player.get_position()
-        
-        # Get light radius in cells
-        light_radius = self.theme.get_light_radius()
-        
-        # Get ambient light level (0-1)
-        ambient_light = self.theme.get_ambient_light()
-        
-        # Draw light around player
-        light_gradient = self.theme.get_light_gradient()
-        light_size = light_gradient.get_width()
-        light_pos = (
-            player_x * self.cell_size + self.cell_size // 2 - light_size // 2,
-            player_y * self.cell_size + self.cell_size // 2 - light_size // 2
-        )
-        
-        # Draw the light gradient at player position
-        self.light_surface.blit(light_gradient, light_pos)
-        
-        # Draw the maze
-        for y in range(self.maze.shape[0]):
-            for x in range(self.maze.shape[1]):
-                rect = pygame.Rect(
-                    x * self.cell_size,
-                    y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-                
-                # Calculate distance from player for ambient light
-                distance = max(abs(x - player_x), abs(y - player_y))
-                
-                # Determine cell visibility
-                if distance <= light_radius:
-                    # Cell is in light radius
-                    visibility = 1.0
-                else:
-                    # Cell is in ambient light
-                    visibility = ambient_light
-                
-                if self.maze[y][x] == 1:  # Wall
-                    pygame.draw.rect(self.screen, (50, 50, 50), rect)
-                else:  # Path
-                    pygame.draw.rect(self.screen, (200, 200, 200), rect)
-                    pygame.draw.rect(self.screen, (150, 150, 150), rect, 1)
-        
-        # Draw exit
-        exit_x, exit_y = self.exit_pos
-        exit_rect = pygame.Rect(
-            exit_x * self.cell_size,
-            exit_y * self.cell_size,
-            self.cell_size,
-            self.cell_size
-        )
-        pygame.draw.rect(self.screen, (0, 255, 0), exit_rect)  # Green exit
+        # Update the light mask; this only does work when the player changed
+        # cells or the theme's light settings changed
+        self.lighting.update(self.player.get_position(), self.theme)
+        
+        # Draw the maze from the pre-rendered layer, rebuilding it if the
+        # floor or the cell size changed
+        if self.maze_surface is None or self.maze_surface_cell_size != self.cell_size:
+            self.render_maze_surface()
+        self.screen.blit(self.maze_surface, (0, 0))
     
     def draw_info_panel(self):
         panel_rect = pygame.Rect(
@@ -838,8 +1149,8 @@ class MazeGame:
         small_font_size = max(10, min(18, self.info_panel_height // 6))
         
         # Create fonts with appropriate sizes
-        font = pygame.font.SysFont("Arial", font_size)
-        small_font = pygame.font.SysFont("Arial", small_font_size)
+        font = self.text_cache.font("Arial", font_size)
+        small_font = self.text_cache.font("Arial", small_font_size)
         
         # Calculate the right boundary for text to avoid overlapping with minimap
         # Reserve space for minimap (plus margin)
@@ -848,7 +1159,7 @@ class MazeGame:
         
         # Display time
         if self.game_active:
-            current_time = time.time() - self.start_time
+            current_time = self.game_time
         else:
             current_time = self.elapsed_time
         
@@ -954,37 +1265,16 @@ class MazeGame:
             minimap_size
         )
         
-        # Draw minimap background
-        pygame.draw.rect(self.screen, (10, 10, 10), minimap_rect)
-        pygame.draw.rect(self.screen, (100, 100, 100), minimap_rect, 1)  # Add border
-        
-        # Calculate cell size for minimap
+        # Draw explored areas and walls from the cached minimap image
         maze_width, maze_height = self.maze.shape[1], self.maze.shape[0]
         cell_width = minimap_rect.width / maze_width
         cell_height = minimap_rect.height / maze_height
-        
-        # Draw explored areas and walls
-        for y in range(maze_height):
-            for x in range(maze_width):
-                mini_rect = pygame.Rect(
-                    minimap_rect.x + x * cell_width,
-                    minimap_rect.y + y * cell_height,
-                    max(1, cell_width),  # Ensure minimum size of 1 pixel
-                    max(1, cell_height)  # Ensure minimum size of 1 pixel
-                )
-                
-                # Only draw cells that have been visited or are adjacent to visited cells
-                is_adjacent = False
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    if (x + dx, y + dy) in self.player.visited_cells:
-                        is_adjacent = True
-                        break
-                
-                if (x, y) in self.player.visited_cells or is_adjacent:
-                    if self.maze[y][x] == 1:  # Wall
-                        pygame.draw.rect(self.screen, (100, 100, 100), mini_rect)
-                    else:  # Path
-                        pygame.draw.rect(self.screen, (180, 180, 180), mini_rect)
+        minimap_key = (self.player.explored_version, minimap_rect.size)
+        if self.minimap_surface is None or self.minimap_key != minimap_key:
+            self.render_minimap_surface(minimap_rect.size)
+            self.minimap_key = minimap_key
+        self.screen.blit(self.minimap_surface, minimap_rect.topleft)
+        pygame.draw.rect(self.screen, (100, 100, 100), minimap_rect, 1)  # Add border
         
         # Draw player on minimap
         player_x, player_y = self.player.get_position()
@@ -1007,7 +1297,7 @@ class MazeGame:
         pygame.draw.rect(self.screen, (0, 255, 0), exit_rect)  # Green exit
         
         # Add "MAP" label above minimap
-        font = pygame.font.SysFont("Arial", 12)
+        font = self.text_cache.font("Arial", 12)
         map_text = font.render("MAP (M)", True, (200, 200, 200))
         self.screen.blit(map_text, (minimap_rect.centerx - map_text.get_width() // 2, minimap_rect.y - 15))
     
@@ -1019,12 +1309,12 @@ class MazeGame:
         self.screen.blit(overlay, (0, 0))
         
         # Game over text
-        font_title = pygame.font.SysFont("Arial", 48)
+        font_title = self.text_cache.font("Arial", 48)
         title_text = font_title.render("GAME OVER", True, (255, 0, 0))
         self.screen.blit(title_text, (self.screen.get_width() // 2 - title_text.get_width() // 2, 200))
         
         # Instructions
-        font_instructions = pygame.font.SysFont("Arial", 24)
+        font_instructions = self.text_cache.font("Arial", 24)
         restart_text = font_instructions.render("Press R to restart level", True, (255, 255, 255))
         self.screen.blit(restart_text, (self.screen.get_width() // 2 - restart_text.get_width() // 2, 280))
         
@@ -1039,17 +1329,17 @@ class MazeGame:
         self.screen.blit(overlay, (0, 0))
         
         # Victory text
-        font_title = pygame.font.SysFont("Arial", 48)
+        font_title = self.text_cache.font("Arial", 48)
         title_text = font_title.render("LEVEL COMPLETE!", True, (0, 255, 0))
         self.screen.blit(title_text, (self.screen.get_width() // 2 - title_text.get_width() // 2, 180))
         
         # Score
-        font_score = pygame.font.SysFont("Arial", 36)
+        font_score = self.text_cache.font("Arial", 36)
         score_text = font_score.render(f"Score: {self.score}", True, (255, 255, 0))
         self.screen.blit(score_text, (self.screen.get_width() // 2 - score_text.get_width() // 2, 250))
         
         # Time and steps
-        font_stats = pygame.font.SysFont("Arial", 24)
+        font_stats = self.text_cache.font("Arial", 24)
         time_text = font_stats.render(f"Time: {self.elapsed_time:.1f}s", True, (255, 255, 255))
         self.screen.blit(time_text, (self.screen.get_width() // 2 - time_text.get_width() // 2, 300))
         
@@ -1057,7 +1347,7 @@ class MazeGame:
         self.screen.blit(steps_text, (self.screen.get_width() // 2 - steps_text.get_width() // 2, 330))
         
         # Instructions
-        font_instructions = pygame.font.SysFont("Arial", 24)
+        font_instructions = self.text_cache.font("Arial", 24)
         next_text = font_instructions.render("Press N for next level", True, (255, 255, 255))
         self.screen.blit(next_text, (self.screen.get_width() // 2 - next_text.get_width() // 2, 380))
         
@@ -1075,12 +1365,12 @@ class MazeGame:
         self.screen.blit(overlay, (0, 0))
         
         # Pause text
-        font_title = pygame.font.SysFont("Arial", 48)
+        font_title = self.text_cache.font("Arial", 48)
         title_text = font_title.render("PAUSED", True, (255, 255, 255))
         self.screen.blit(title_text, (self.screen.get_width() // 2 - title_text.get_width() // 2, 200))
         
         # Instructions
-        font_instructions = pygame.font.SysFont("Arial", 24)
+        font_instructions = self.text_cache.font("Arial", 24)
         continue_text = font_instructions.render("Press P to continue", True, (200, 200, 200))
         self.screen.blit(continue_text, (self.screen.get_width() // 2 - continue_text.get_width() // 2, 280))
         
@@ -1090,11 +1380,25 @@ class MazeGame:
         menu_text = font_instructions.render("Press ESC to return to level select", True, (200, 200, 200))
         self.screen.blit(menu_text, (self.screen.get_width() // 2 - menu_text.get_width() // 2, 360))
     
-    def draw_game_objects(self):
+    def draw_game_objects(self, area=None):
+        # When an area is given (dirty-rect mode), skip anything outside it
+        def visible(rect):
+            return area is None or area.colliderect(rect)
+        
         # Draw player
-        self.player.draw(self.screen)
+        if visible(self.player.get_draw_rect()):
+            self.player.draw(self.screen)
+        
+        # Queue keys, the door, stairs, enemies and traps from the sprite
+        # atlas, skipping anything off screen, outside the area or unlit,
+        # and draw them with one batched blit
+        cull_rect = self.screen.get_rect().clip(self.lighting.visible_rect())
+        if area is not None:
+            cull_rect = cull_rect.clip(area)
+        atlas = self.sprite_atlas
+        render_list = self.render_list
+        render_list.begin(cull_rect)
         
-        # Draw keys
         for key_pos in self.key_positions:
             key_x, key_y = key_pos
             key_rect = pygame.Rect(
@@ -1103,47 +1407,33 @@ class MazeGame:
                 self.cell_size // 2,
                 self.cell_size // 2
             )
-            pygame.draw.rect(self.screen, (255, 215, 0), key_rect)  # Gold color for keys
+            render_list.add(atlas.key, key_rect)
         
-        # Draw door if present
+        # Door in brown or red depending on whether it's locked
         if self.door_position:
-            door_x, door_y = self.door_position
-            door_rect = pygame.Rect(
-                door_x * self.cell_size,
-                door_y * self.cell_size,
-                self.cell_size,
-                self.cell_size
-            )
-            # Draw door in brown or red depending on whether it's locked
-            door_color = (139, 69, 19) if self.keys_collected >= self.keys_required else (139, 0, 0)
-            pygame.draw.rect(self.screen, door_color, door_rect)
+            render_list.add(atlas.doors[self.keys_collected >= self.keys_required], self.cell_rect(self.door_position))
         
-        # Draw stairs
         for stair_pos in self.stair_positions:
-            stair_x, stair_y = stair_pos
-            stair_rect = pygame.Rect(
-                stair_x * self.cell_size,
-                stair_y * self.cell_size,
-                self.cell_size,
-                self.cell_size
-            )
-            pygame.draw.rect(self.screen, (128, 0, 128), stair_rect)  # Purple for stairs
+            render_list.add(atlas.stairs, self.cell_rect(stair_pos))
         
-        # Draw enemies
         for enemy in self.enemies:
-            enemy.draw(self.screen)
+            render_list.add(atlas.enemy_sprite(enemy), enemy.get_draw_rect())
         
-        # Draw traps
         for trap in self.traps:
-            trap.draw(self.screen)
+            render_list.add(atlas.trap_sprite(trap), trap.get_draw_rect())
+        
+        render_list.submit(self.screen)
         
         # Apply lighting effect
-        self.screen.blit(self.light_surface, (0, 0), special_flags=pygame.BLEND_MULT)
+        if area is None:
+            self.screen.blit(self.lighting.surface, (0, 0), special_flags=pygame.BLEND_MULT)
+        else:
+            self.screen.blit(self.lighting.surface, area.topleft, area, special_flags=pygame.BLEND_MULT)
     
     def reset_progress(self):
         """Reset all progress, unlocking only level 1"""
         # Show confirmation dialog
-        font = pygame.font.SysFont("Arial", 24)
+        font = self.text_cache.font("Arial", 24)
         
         # Create a semi-transparent overlay
         overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
@@ -1299,7 +1589,7 @@ class MazeGame:
                             -0.5, 0.5, 1)
         
         # Add tooltip text
-        font = pygame.font.SysFont("Arial", 12)
+        font = self.text_cache.font("Arial", 12)
         tooltip = font.render("X to toggle sound", True, (200, 200, 200))
         self.screen.blit(tooltip, (button_x - tooltip.get_width() + button_size, button_y - 15))
         
@@ -1311,13 +1601,13 @@ class MazeGame:
         self.screen.fill((20, 20, 30))
         
         # Title
-        font_title = pygame.font.SysFont("Arial", 36)
+        font_title = self.text_cache.font("Arial", 36)
         title_text = font_title.render("MAZE RUNNER - GAME GUIDE", True, (255, 255, 255))
         self.screen.blit(title_text, (self.screen.get_width() // 2 - title_text.get_width() // 2, 50))
         
         # Create fonts
-        font_heading = pygame.font.SysFont("Arial", 24)
-        font_text = pygame.font.SysFont("Arial", 18)
+        font_heading = self.text_cache.font("Arial", 24)
+        font_text = self.text_cache.font("Arial", 18)
         
         # Create a surface for the scrollable content
         # Make it taller than the screen to accommodate all content
@@ -1355,6 +1645,7 @@ class MazeGame:
         enemy_lines = [
             "Red squares patrol the maze in random patterns.",
             "They move faster in higher difficulty levels.",
+            "From level 6 on, enemies that get close will chase you.",
             "If an enemy touches you, you lose the game.",
             "Listen for audio cues when enemies are nearby.",
             "Enemies can't pass through walls, so use the maze layout to your advantage.",
@@ -1457,7 +1748,7 @@ class MazeGame:
             "In higher levels, focus on finding keys before heading to the exit.",
             "The lighting effect shows a limited view - be cautious when exploring.",
             "Enemies move in predictable patterns - observe before rushing through.",
-            "If you get stuck, try restarting the level with a fresh maze layout.",
+            "If you get stuck, pick the level again from level select for a fresh maze layout.",
             "Multi-floor mazes require careful planning to navigate efficiently."
         ]
         
@@ -1550,16 +1841,30 @@ class MazeGame:
                 max_scroll = max(0, self.description_content_height - visible_height)
                 self.description_scroll_y = min(max_scroll, self.description_scroll_y + 30)
     
+    def interpolate_entities(self, alpha):
+        """Draw moving entities alpha of the way between the last two simulation ticks"""
+        if self.player is not None:
+            self.player.interpolate(alpha)
+        if self.enemy_swarm is not None:
+            self.enemy_swarm.interpolate(alpha)
+    
     def run(self):
         clock = pygame.time.Clock()
+        accumulator = 0.0
         
         while True:
+            frame_time = min(clock.tick(self.frame_rate) / 1000, MAX_FRAME_TIME)
             self.handle_events()
             
             if self.game_active and not self.game_paused:
-                self.update(clock.tick(60) / 1000)
+                # Run as many fixed ticks as the frame's time covers; the
+                # remainder carries over to the next frame
+                accumulator += frame_time
+                while accumulator >= self.tick_time and self.game_active and not self.game_paused:
+                    self.update(self.tick_time)
+                    accumulator -= self.tick_time
+                self.interpolate_entities(accumulator / self.tick_time)
             else:
-                # Still tick the clock even when not updating
-                clock.tick(60)
+                accumulator = 0.0
             
-            self.draw() 
\ No newline at end of file
+            self.draw()
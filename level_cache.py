@@ -0,0 +1,134 @@
+import os
+import json
+import hashlib
+import threading
+import numpy as np
+from maze_grid import PackedMazeGrid
+
+# Bump when generation changes so stale cached levels are not reused
+CACHE_VERSION = 7
+
+
+class LevelCache:
+    """
+    On-disk cache of generated floors, stored as compressed .npz files
+    with the maze packed one bit per cell.
+
+    Entries are content-addressed: the file name is a hash of the seed, the
+    level configuration and the floor number, so the same seeded level is
+    only ever generated once and restarts load it straight from disk.
+    """
+    def __init__(self, cache_dir="level_cache", max_entries=64):
+        # With no cache_dir nothing is stored and every floor is generated
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def make_key(self, seed, level_config, floor=1):
+        # Seeds may be ints or lists of ints; the description text is not
+        # part of the generated content
+        config = {k: v for k, v in level_config.items() if k != "description"}
+        payload = json.dumps({
+            "version": CACHE_VERSION,
+            "seed": seed,
+            "config": config,
+            "floor": floor
+        }, sort_keys=True, default=list)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def load(self, key, maze_generator):
+        """
+        Restore a cached floor into maze_generator.
+        Returns the generate_maze result tuple, or None on a cache miss.
+        """
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path) as data:
+                maze = PackedMazeGrid(data["maze_bits"], data["maze_shape"]).unpack()
+                start_pos = tuple(int(v) for v in data["start"])
+                exit_pos = tuple(int(v) for v in data["exit"])
+                door = data["door"]
+
+                maze_generator.maze = maze
+                maze_generator.graph = None
+                maze_generator.start_pos = start_pos
+                maze_generator.exit_x, maze_generator.exit_y = exit_pos
+                maze_generator.key_positions = [tuple(p) for p in data["keys"].tolist()]
+                maze_generator.door_position = tuple(door.tolist()) if door.size else None
+                maze_generator.stair_positions = [tuple(p) for p in data["stairs"].tolist()]
+                maze_generator.enemy_positions = [tuple(p) for p in data["enemies"].tolist()]
+                maze_generator.trap_positions = [
+                    (x, y, str(trap_type))
+                    for (x, y), trap_type in zip(data["traps"].tolist(), data["trap_types"].tolist())
+                ]
+        except Exception as e:
+            print(f"Error loading cached level {key}: {e}")
+            return None
+
+        # Touch the entry so eviction drops the least recently used levels
+        os.utime(path)
+        return maze, start_pos, exit_pos
+
+    def save(self, key, maze_generator, maze_result):
+        """Store a generated floor; failures only cost a regeneration later"""
+        if self.cache_dir is None:
+            return
+        maze, start_pos, exit_pos = maze_result
+
+        def positions(items):
+            return np.array([item[:2] for item in items], dtype=np.int32).reshape(-1, 2)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            door = maze_generator.door_position
+
+            # Write to a temporary file and move it into place, so a floor
+            # generated on a worker thread is never read half-written
+            temp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    maze_bits=maze.pack().bits,
+                    maze_shape=np.array(maze.shape, dtype=np.int32),
+                    start=np.array(start_pos, dtype=np.int32),
+                    exit=np.array(exit_pos, dtype=np.int32),
+                    keys=positions(maze_generator.key_positions),
+                    door=np.array(door if door is not None else [], dtype=np.int32),
+                    stairs=positions(maze_generator.stair_positions),
+                    enemies=positions(maze_generator.enemy_positions),
+                    traps=positions(maze_generator.trap_positions),
+                    trap_types=np.array([trap[2] for trap in maze_generator.trap_positions], dtype=str)
+                )
+            os.replace(temp_path, self._path(key))
+            self._evict()
+        except Exception as e:
+            print(f"Error saving cached level {key}: {e}")
+
+    def generate(self, maze_generator, key, **generate_args):
+        """Load a floor from the cache, generating and storing it on a miss"""
+        maze_result = self.load(key, maze_generator)
+        if maze_result is None:
+            maze_result = maze_generator.generate_maze(**generate_args)
+            self.save(key, maze_generator, maze_result)
+        return maze_result
+
+    def _evict(self):
+        # Keep only the most recently used entries
+        entries = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                   if name.endswith(".npz")]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Already evicted by another writer
+                pass
@@ -3,12 +3,13 @@ import json
 import pygame
 
 class LevelManager:
-    def __init__(self):
+    def __init__(self, save_file="maze_progress.json"):
         self.current_level = 1
         self.max_level = 10
         self.levels_unlocked = 1
         self.high_scores = {}
-        self.save_file = "maze_progress.json"
+        # No save file (headless runs) keeps progress in memory only
+        self.save_file = save_file
         self.load_progress()
         
         # Level configurations
@@ -23,7 +24,7 @@ class LevelManager:
                 "floors": 1,
                 "theme": "dungeon",
                 "description": "Find your way through a simple maze with a single enemy and trap.",
-                "enemy_speed": 0.3,  # Slow enemy speed
+                "enemy_speed": 0.9,  # Slow enemy speed (cells per second)
                 "trap_activation_time": 5.0,  # Long trap activation cycle
                 "min_exit_distance": 15  # Ensure exit is not too close
             },
@@ -37,7 +38,7 @@ class LevelManager:
                 "floors": 1,
                 "theme": "dungeon",
                 "description": "More enemies and traps to avoid.",
-                "enemy_speed": 0.4,
+                "enemy_speed": 1.2,
                 "trap_activation_time": 4.0,
                 "min_exit_distance": 18
             },
@@ -51,7 +52,7 @@ class LevelManager:
                 "floors": 1,
                 "theme": "dungeon",
                 "description": "Find the key while avoiding enemies and traps.",
-                "enemy_speed": 0.5,
+                "enemy_speed": 1.5,
                 "trap_activation_time": 3.5,
                 "min_exit_distance": 20
             },
@@ -65,7 +66,7 @@ class LevelManager:
                 "floors": 1,
                 "theme": "dungeon",
                 "description": "Beat the clock while navigating through dangers.",
-                "enemy_speed": 0.6,
+                "enemy_speed": 1.8,
                 "trap_activation_time": 3.0,
                 "min_exit_distance": 22
             },
@@ -79,7 +80,7 @@ class LevelManager:
                 "floors": 1,
                 "theme": "forest",
                 "description": "Navigate through the forest maze with increased dangers.",
-                "enemy_speed": 0.7,
+                "enemy_speed": 2.1,
                 "trap_activation_time": 2.5,
                 "min_exit_distance": 25
             },
@@ -93,7 +94,8 @@ class LevelManager:
                 "floors": 2,
                 "theme": "dungeon",
                 "description": "Find the stairs while avoiding numerous enemies and traps.",
-                "enemy_speed": 0.8,
+                "enemy_speed": 2.4,
+                "enemy_chase_range": 5,  # Enemies this many steps away chase the player
                 "trap_activation_time": 2.0,
                 "min_exit_distance": 20
             },
@@ -107,7 +109,8 @@ class LevelManager:
                 "floors": 1,
                 "theme": "space",
                 "description": "Navigate through the space station with fast enemies.",
-                "enemy_speed": 0.9,
+                "enemy_speed": 2.7,
+                "enemy_chase_range": 6,
                 "trap_activation_time": 1.8,
                 "min_exit_distance": 28
             },
@@ -121,7 +124,8 @@ class LevelManager:
                 "floors": 2,
                 "theme": "space",
                 "description": "A complex multi-floor space station with aggressive enemies.",
-                "enemy_speed": 1.0,
+                "enemy_speed": 3.0,
+                "enemy_chase_range": 8,
                 "trap_activation_time": 1.5,
                 "min_exit_distance": 30
             },
@@ -135,7 +139,8 @@ class LevelManager:
                 "floors": 2,
                 "theme": "forest",
                 "description": "A challenging forest maze with fast enemies and quick traps.",
-                "enemy_speed": 1.1,
+                "enemy_speed": 3.3,
+                "enemy_chase_range": 10,
                 "trap_activation_time": 1.2,
                 "min_exit_distance": 32
             },
@@ -149,13 +154,16 @@ class LevelManager:
                 "floors": 3,
                 "theme": "dungeon",
                 "description": "The ultimate maze challenge with deadly enemies and traps.",
-                "enemy_speed": 1.2,
+                "enemy_speed": 3.6,
+                "enemy_chase_range": 12,
                 "trap_activation_time": 1.0,
                 "min_exit_distance": 35
             }
         }
     
     def load_progress(self):
+        if self.save_file is None:
+            return
         try:
             if os.path.exists(self.save_file):
                 with open(self.save_file, 'r') as f:
@@ -171,6 +179,8 @@ class LevelManager:
             self.high_scores = {}
     
     def save_progress(self):
+        if self.save_file is None:
+            return
         try:
             data = {
                 "levels_unlocked": self.levels_unlocked,
@@ -0,0 +1,104 @@
+import numpy as np
+import pygame
+
+
+class LightingManager:
+    """
+    Keeps the light mask that is multiplied over the maze each frame.
+
+    The mask only depends on the player's cell and the theme's light
+    settings, so it is recomputed only when one of those changes, and a
+    player move only redraws the rectangle covering the old and the new
+    light. Each pixel's brightness is capped by its cell's visibility:
+    cells within light_radius (Chebyshev distance) of the player get the
+    radial gradient, every other cell gets the theme's ambient light.
+    """
+    def __init__(self, maze_width, maze_height, cell_size):
+        self.cell_size = cell_size
+        self.surface = pygame.Surface((maze_width * cell_size, maze_height * cell_size))
+        self.surface.fill((0, 0, 0))
+
+        # What the mask currently shows
+        self.light_cell = None
+        self.settings = None
+        self.gradient = None
+
+        # Number of mask redraws, to check that idle frames cost nothing
+        self.redraws = 0
+
+    def update(self, player_cell, theme):
+        """Bring the mask up to date; returns the redrawn rect or None"""
+        gradient_surface = theme.get_light_gradient()
+        settings = (theme.get_light_radius(), theme.get_ambient_light(), gradient_surface)
+
+        if settings != self.settings:
+            # New theme or light settings: redraw everything
+            self.settings = settings
+            self.gradient = pygame.surfarray.array_alpha(gradient_surface) / 255.0
+            dirty = self.surface.get_rect()
+        elif player_cell == self.light_cell:
+            return None
+        else:
+            dirty = self._lit_rect(self.light_cell).union(self._lit_rect(player_cell))
+
+        self.light_cell = player_cell
+        dirty = dirty.clip(self.surface.get_rect())
+        if dirty.width and dirty.height:
+            self._render(dirty)
+        self.redraws += 1
+        return dirty
+
+    def visible_rect(self):
+        """
+        The part of the mask that isn't black: all of it when there is
+        ambient light, otherwise only the light around the player
+        """
+        if self.settings is None:
+            return self.surface.get_rect()
+        ambient = self.settings[1]
+        if ambient > 0:
+            return self.surface.get_rect()
+        return self._lit_rect(self.light_cell).clip(self.surface.get_rect())
+
+    def _lit_rect(self, cell):
+        # Pixels that can be brighter than ambient with the light at cell:
+        # the gradient square and the visibility square around the cell
+        radius = self.settings[0]
+        gradient_size = self.gradient.shape[0]
+        x, y = cell
+        center_x = x * self.cell_size + self.cell_size // 2
+        center_y = y * self.cell_size + self.cell_size // 2
+        gradient_rect = pygame.Rect(center_x - gradient_size // 2, center_y - gradient_size // 2,
+                                    gradient_size, gradient_size)
+        visible_rect = pygame.Rect((x - radius) * self.cell_size, (y - radius) * self.cell_size,
+                                   (2 * radius + 1) * self.cell_size, (2 * radius + 1) * self.cell_size)
+        return gradient_rect.union(visible_rect)
+
+    def _render(self, rect):
+        radius, ambient, _ = self.settings
+        light_x, light_y = self.light_cell
+        gradient_w, gradient_h = self.gradient.shape
+
+        # Pixel coordinates of the dirty rect, along x and y
+        px = np.arange(rect.left, rect.right)
+        py = np.arange(rect.top, rect.bottom)
+
+        # Per-cell visibility: 1.0 within the light radius, ambient elsewhere
+        in_radius = ((np.abs(px // self.cell_size - light_x) <= radius)[:, None] &
+                     (np.abs(py // self.cell_size - light_y) <= radius)[None, :])
+        visibility = np.where(in_radius, 1.0, ambient)
+
+        # Gradient centered on the player's cell, zero outside its square
+        gx = px - (light_x * self.cell_size + self.cell_size // 2 - gradient_w // 2)
+        gy = py - (light_y * self.cell_size + self.cell_size // 2 - gradient_h // 2)
+        valid_x = (gx >= 0) & (gx < gradient_w)
+        valid_y = (gy >= 0) & (gy < gradient_h)
+        gradient = np.zeros((px.size, py.size))
+        gradient[np.ix_(valid_x, valid_y)] = self.gradient[np.ix_(gx[valid_x], gy[valid_y])]
+
+        # Never darker than ambient, never brighter than the cell's visibility
+        level = np.maximum(ambient, np.minimum(visibility, gradient))
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        pixels[rect.left:rect.right, rect.top:rect.bottom] = (level * 255).astype(np.uint8)[:, :, None]
+        del pixels
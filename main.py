@@ -1,5 +1,7 @@
+import sys
 from game import MazeGame
 
 if __name__ == "__main__":
-    game = MazeGame()
-    game.run()
\ No newline at end of file
+    # --dirty-rects only repaints the parts of the screen that change
+    game = MazeGame(dirty_rendering="--dirty-rects" in sys.argv[1:])
+    game.run()
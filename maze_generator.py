@@ -1,12 +1,25 @@
-import random
 import numpy as np
+from carving import get_carving_engine
+from connectivity import ConnectivityMap
+from placement import PlacementIndex
+from maze_graph import MazeGraph
+from maze_grid import MazeGrid
+
+# Walls opened per maze cell to add loops after carving
+BRAID_FACTOR = 1 / 30
+# Rounds of the braid stage; each opens a batch of walls
+BRAID_ROUNDS = 8
 
 class MazeGenerator:
-    def __init__(self, width, height):
+    def __init__(self, width, height, seed=None):
+        # Private random state so a given seed always produces the same maze
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        
         # Ensure width and height are odd numbers to have proper walls
         self.width = width if width % 2 == 1 else width + 1
         self.height = height if height % 2 == 1 else height + 1
-        self.maze = np.ones((self.height, self.width), dtype=int)  # 1 represents walls
+        self.maze = MazeGrid((self.height, self.width))  # 1 represents walls
         self.exit_x = 0
         self.exit_y = 0
         self.key_positions = []
@@ -14,8 +27,9 @@ class MazeGenerator:
         self.stair_positions = []
         self.enemy_positions = []
         self.trap_positions = []
+        self.graph = None
     
-    def generate_maze(self, keys_required=0, num_enemies=0, num_traps=0, num_floors=1, current_floor=1, complexity=0.75, density=0.75, start_pos=None, min_exit_distance=None):
+    def generate_maze(self, keys_required=0, num_enemies=0, num_traps=0, num_floors=1, current_floor=1, complexity=0.75, density=0.75, start_pos=None, min_exit_distance=None, engine="vectorized", braid_factor=BRAID_FACTOR):
         """
         Generate a maze using a randomized algorithm.
         Ensures the maze is solvable by validating paths.
@@ -24,10 +38,12 @@ class MazeGenerator:
         complexity: Complexity of the maze (0-1)
         density: Density of the maze (0-1)
         start_pos: Optional tuple (x, y) for the starting position
-        min_exit_distance: Minimum Manhattan distance from start to exit
+        min_exit_distance: Minimum walking distance from start to exit
+        engine: Carving engine name ("vectorized", "loop", "backtracker", "kruskal" or "eller") or a CarvingEngine instance
+        braid_factor: Walls opened per maze cell after carving to add loops (0 for none)
         
         Returns:
-        maze: 2D numpy array where 0 represents paths and 1 represents walls
+        maze: MazeGrid (2D uint8 array) where 0 represents paths and 1 represents walls
         start_pos: Tuple (x, y) of the starting position
         exit_pos: Tuple (x, y) of the exit position
         """
@@ -35,8 +51,11 @@ class MazeGenerator:
         complexity = int(complexity * (5 * (self.height + self.width)))
         density = int(density * ((self.height // 2) * (self.width // 2)))
         
-        # Create an array of ones (walls)
-        self.maze = np.ones((self.height, self.width), dtype=int)
+        # Select the wall carving engine
+        carving_engine = get_carving_engine(engine)
+        
+        # Create a grid of ones (walls)
+        self.maze = MazeGrid((self.height, self.width))
         
         # Fill borders with ones (walls)
         self.maze[0, :] = self.maze[-1, :] = self.maze[:, 0] = self.maze[:, -1] = 1
@@ -48,15 +67,15 @@ class MazeGenerator:
         # Generate random starting position if not provided
         if start_pos is None:
             # Make sure starting position is on an odd cell (path)
-            start_x = np.random.randint(1, self.width // 2) * 2 - 1
-            start_y = np.random.randint(1, self.height // 2) * 2 - 1
+            start_x = int(self.rng.integers(1, self.width // 2)) * 2 - 1
+            start_y = int(self.rng.integers(1, self.height // 2)) * 2 - 1
             start_pos = (start_x, start_y)
         else:
             # Ensure start_pos is a tuple with two elements
             if not isinstance(start_pos, tuple) or len(start_pos) != 2:
                 print("Warning: Invalid start_pos provided. Using default.")
-                start_x = np.random.randint(1, self.width // 2) * 2 - 1
-                start_y = np.random.randint(1, self.height // 2) * 2 - 1
+                start_x = int(self.rng.integers(1, self.width // 2)) * 2 - 1
+                start_y = int(self.rng.integers(1, self.height // 2)) * 2 - 1
                 start_pos = (start_x, start_y)
             else:
                 start_x, start_y = start_pos
@@ -64,29 +83,51 @@ class MazeGenerator:
         # Make sure the starting position is a path
         self.maze[start_y, start_x] = 0
         
-        # Create paths by randomly removing walls
-        for _ in range(density):
-            x = np.random.randint(0, self.width // 2) * 2
-            y = np.random.randint(0, self.height // 2) * 2
-            self.maze[y, x] = 0
+        # Entities keep their distance from here, and solvability is checked from here
+        self.start_pos = start_pos
+        
+        # Generate the layout and place everything on it, starting over if
+        # the exit ends up too close, an entity doesn't fit or the maze
+        # can't be solved
+        attempts = 0
+        max_attempts = 5  # Maximum number of attempts to generate a solvable maze
+        
+        while not self._generate_attempt(carving_engine, density, complexity, start_pos, min_exit_distance,
+                                         keys_required, num_enemies, num_traps, num_floors, current_floor,
+                                         braid_factor):
+            attempts += 1
+            if attempts >= max_attempts:
+                print("Failed to generate a solvable maze after maximum attempts. Creating a simple solvable maze.")
+                self._create_simple_solvable_maze(start_pos, min_exit_distance, keys_required, braid_factor,
+                                                  needs_stairs=num_floors > 1 and current_floor < num_floors)
+                break
             
-            for _ in range(complexity):
-                directions = []
-                if x > 1:
-                    directions.append((x - 2, y))
-                if x < self.width - 2:
-                    directions.append((x + 2, y))
-                if y > 1:
-                    directions.append((x, y - 2))
-                if y < self.height - 2:
-                    directions.append((x, y + 2))
-                
-                if len(directions) > 0:
-                    next_x, next_y = directions[np.random.randint(0, len(directions))]
-                    if self.maze[next_y, next_x] == 1:
-                        self.maze[next_y, next_x] = 0
-                        self.maze[y + (next_y - y) // 2, x + (next_x - x) // 2] = 0
-                        x, y = next_x, next_y
+            print(f"Generated maze is unusable. Regenerating (attempt {attempts}/{max_attempts})...")
+            
+            # Start again from solid walls
+            self.maze = MazeGrid((self.height, self.width))
+            self.maze[0, :] = self.maze[-1, :] = self.maze[:, 0] = self.maze[:, -1] = 1
+            
+            # Make sure the starting position is a path
+            self.maze[start_y, start_x] = 0
+        
+        return self.maze, start_pos, (self.exit_x, self.exit_y)
+    
+    def _generate_attempt(self, carving_engine, density, complexity, start_pos, min_exit_distance,
+                          keys_required, num_enemies, num_traps, num_floors, current_floor, braid_factor):
+        """
+        Carve the maze and place the exit and all entities on it.
+        Returns False if the attempt has to be thrown away: no exit far
+        enough from the start, fewer keys or stairs than required, or
+        (for engines that can leave regions apart) an unsolvable maze.
+        """
+        # Create paths by removing walls
+        carving_engine.carve(self.maze, density, complexity, self.rng, start=start_pos)
+        
+        # Add some random paths to make the maze less rigid. This is the
+        # final layout, so the distances everything is placed by hold in
+        # the delivered maze; opening walls never makes it unsolvable
+        self._add_random_paths(braid_factor)
         
         # Reset positions
         self.key_positions = []
@@ -95,78 +136,24 @@ class MazeGenerator:
         self.enemy_positions = []
         self.trap_positions = []
         
-        # Find valid positions for the exit (open spaces)
-        valid_positions = []
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y, x] == 0:
-                    # Calculate Manhattan distance from start
-                    distance = abs(x - start_x) + abs(y - start_y)
-                    # Only consider positions that are far enough from start
-                    if distance >= min_exit_distance:
-                        valid_positions.append((x, y, distance))
-        
-        # If no valid positions found with minimum distance, relax the constraint
-        if not valid_positions:
-            print("Warning: No positions meet the minimum distance requirement. Relaxing constraint.")
-            for y in range(1, self.height - 1):
-                for x in range(1, self.width - 1):
-                    if self.maze[y, x] == 0 and (x != start_x or y != start_y):
-                        valid_positions.append((x, y, abs(x - start_x) + abs(y - start_y)))
-        
-        # Initialize exit_pos with a default value
-        exit_pos = None
-        
-        # Sort by distance (descending) and pick one of the furthest positions
-        if valid_positions:
-            valid_positions.sort(key=lambda pos: pos[2], reverse=True)
-            # Choose randomly from the top 25% furthest positions
-            top_count = max(1, len(valid_positions) // 4)
-            top_positions = valid_positions[:top_count]
-            idx = np.random.randint(0, len(top_positions))
-            exit_x, exit_y, _ = top_positions[idx]
-            exit_pos = (exit_x, exit_y)
-        else:
-            # Fallback: just pick a random position that's not the start
-            print("Warning: No valid exit positions found. Using fallback method.")
-            attempts = 0
-            while attempts < 100:  # Prevent infinite loop
-                exit_x = np.random.randint(1, self.width - 1)
-                exit_y = np.random.randint(1, self.height - 1)
-                if self.maze[exit_y, exit_x] == 0 and (exit_x != start_x or exit_y != start_y):
-                    exit_pos = (exit_x, exit_y)
-                    break
-                attempts += 1
-            
-            if attempts >= 100 or exit_pos is None:
-                # Last resort: find any open cell
-                for y in range(1, self.height - 1):
-                    for x in range(1, self.width - 1):
-                        if self.maze[y, x] == 0 and (x != start_x or y != start_y):
-                            exit_pos = (x, y)
-                            break
-                    if exit_pos is not None:
-                        break
-                
-                # If still no exit position, create one
-                if exit_pos is None:
-                    exit_x = self.width - 2
-                    exit_y = self.height - 2
-                    self.maze[exit_y, exit_x] = 0
-                    exit_pos = (exit_x, exit_y)
+        # Pick the exit by walking distance from the start
+        if not self._choose_exit(start_pos, min_exit_distance):
+            return False
         
-        # Store exit position
-        self.exit_x, self.exit_y = exit_pos
+        # Index the open cells once for all entity placement
+        self.placement = PlacementIndex(self.maze, self.rng)
         
         # Place keys if required
         if keys_required > 0:
-            self._place_keys(keys_required)
+            if not self._place_keys(keys_required):
+                return False
             # Place a locked door before the exit
             self._place_door()
         
         # Place stairs if this is a multi-floor maze and not the last floor
         if num_floors > 1 and current_floor < num_floors:
-            self._place_stairs()
+            if not self._place_stairs():
+                return False
         
         # Place enemies
         if num_enemies > 0:
@@ -176,247 +163,131 @@ class MazeGenerator:
         if num_traps > 0:
             self._place_traps(num_traps)
         
-        # Add some random paths to make the maze less rigid
-        self._add_random_paths()
-        
         # After placing all elements (keys, doors, enemies, traps, etc.)
-        # Verify that the maze is solvable
-        attempts = 0
-        max_attempts = 5  # Maximum number of attempts to generate a solvable maze
-        
-        while not self._is_maze_solvable() and attempts < max_attempts:
-            print(f"Generated maze is not solvable. Regenerating (attempt {attempts+1}/{max_attempts})...")
-            
-            # Regenerate the maze
-            self.maze = np.ones((self.height, self.width), dtype=int)
-            self.maze[0, :] = self.maze[-1, :] = self.maze[:, 0] = self.maze[:, -1] = 1
-            
-            # Make sure the starting position is a path
-            self.maze[start_y, start_x] = 0
-            
-            # Create paths by randomly removing walls
-            for _ in range(density):
-                x = np.random.randint(0, self.width // 2) * 2
-                y = np.random.randint(0, self.height // 2) * 2
-                self.maze[y, x] = 0
-                
-                for _ in range(complexity):
-                    directions = []
-                    if x > 1:
-                        directions.append((x - 2, y))
-                    if x < self.width - 2:
-                        directions.append((x + 2, y))
-                    if y > 1:
-                        directions.append((x, y - 2))
-                    if y < self.height - 2:
-                        directions.append((x, y + 2))
-                    
-                    if len(directions) > 0:
-                        next_x, next_y = directions[np.random.randint(0, len(directions))]
-                        if self.maze[next_y, next_x] == 1:
-                            self.maze[next_y, next_x] = 0
-                            self.maze[y + (next_y - y) // 2, x + (next_x - x) // 2] = 0
-                            x, y = next_x, next_y
-            
-            # Reset positions
-            self.key_positions = []
-            self.door_position = None
-            self.stair_positions = []
-            self.enemy_positions = []
-            self.trap_positions = []
-            
-            # Find valid positions for the exit
-            valid_positions = []
-            for y in range(1, self.height - 1):
-                for x in range(1, self.width - 1):
-                    if self.maze[y, x] == 0:
-                        # Calculate Manhattan distance from start
-                        distance = abs(x - start_x) + abs(y - start_y)
-                        # Only consider positions that are far enough from start
-                        if distance >= min_exit_distance:
-                            valid_positions.append((x, y, distance))
-            
-            # ... rest of exit position selection code ...
-            
-            # Place keys, doors, stairs, enemies, and traps
-            if keys_required > 0:
-                self._place_keys(keys_required)
-                self._place_door()
-            
-            if num_floors > 1 and current_floor < num_floors:
-                self._place_stairs()
-            
-            if num_enemies > 0:
-                self._place_enemies(num_enemies)
-            
-            if num_traps > 0:
-                self._place_traps(num_traps)
-            
-            self._add_random_paths()
-            
-            attempts += 1
+        # verify that the maze is solvable; perfect mazes always are
+        return carving_engine.perfect or self._is_maze_solvable()
+    
+    def _choose_exit(self, start_pos, min_exit_distance):
+        """
+        Pick the exit among the open cells at least min_exit_distance steps
+        (walking distance) from the start, preferring the furthest ones.
+        Returns False if no cell is that far. Also leaves the start's
+        walking distances in self.start_distances for the placement of
+        keys and stairs.
+        """
+        self.graph = MazeGraph(self.maze)
+        self.start_distances = self.graph.distances_from(start_pos)
+        
+        # Interior cells only, in row order so ties keep a stable order;
+        # the exit is never the start itself
+        interior = self.start_distances[1:-1, 1:-1]
+        ys, xs = np.nonzero(interior >= max(min_exit_distance, 1))
+        if not xs.size:
+            return False
         
-        if attempts >= max_attempts and not self._is_maze_solvable():
-            print("Failed to generate a solvable maze after maximum attempts. Creating a simple solvable maze.")
-            self._create_simple_solvable_maze(start_pos, min_exit_distance, keys_required)
+        # Sort by distance (descending) and pick one of the furthest positions
+        distances = interior[ys, xs]
+        order = np.argsort(-distances, kind="stable")
+        # Choose randomly from the top 25% furthest positions
+        top_count = max(1, xs.size // 4)
+        idx = order[self.rng.integers(0, top_count)]
         
-        return self.maze, start_pos, (self.exit_x, self.exit_y)
+        # Store exit position
+        self.exit_x, self.exit_y = int(xs[idx]) + 1, int(ys[idx]) + 1
+        return True
     
-    def _carve_paths(self, x, y):
-        # Directions: right, down, left, up
-        directions = [(2, 0), (0, 2), (-2, 0), (0, -2)]
-        random.shuffle(directions)
-        
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
-            
-            # Check if the new position is within bounds and is a wall
-            if (0 < new_x < self.width - 1 and 
-                0 < new_y < self.height - 1 and 
-                self.maze[new_y][new_x] == 1):
-                
-                # Carve a path by setting the cells to 0
-                self.maze[y + dy // 2][x + dx // 2] = 0
-                self.maze[new_y][new_x] = 0
-                
-                # Continue carving paths from the new position
-                self._carve_paths(new_x, new_y)
+    def get_maze_graph(self):
+        """Corridor graph of the finished maze, for walking-distance queries"""
+        if self.graph is None:
+            self.graph = MazeGraph(self.maze)
+        return self.graph
     
-    def _add_random_paths(self):
-        # Add some random paths to make the maze less rigid
-        # This creates more path options and makes the maze more interesting
-        
-        # Number of random paths to add (based on maze size)
-        num_paths = (self.width * self.height) // 30  # Increased from 40 to 30 for more paths
-        
-        for _ in range(num_paths):
-            # Pick a random wall that's not on the border
-            while True:
-                x = random.randint(1, self.width - 2)
-                y = random.randint(1, self.height - 2)
-                
-                # Only consider walls
-                if self.maze[y][x] == 1:
-                    # Count adjacent paths
-                    adjacent_paths = 0
-                    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                        if 0 <= x + dx < self.width and 0 <= y + dy < self.height:
-                            if self.maze[y + dy][x + dx] == 0:
-                                adjacent_paths += 1
-                    
-                    # Only remove walls that connect exactly two paths
-                    # This prevents creating large open areas
-                    if adjacent_paths == 2:
-                        self.maze[y][x] = 0
-                        break
+    def _add_random_paths(self, braid_factor=BRAID_FACTOR):
+        """
+        Braid the maze: open walls that sit between exactly two paths,
+        adding loops so the maze is less rigid. braid_factor is the number
+        of walls to open per cell of the maze (fewer if the maze runs out
+        of such walls); 0 leaves the maze as it is.
+        """
+        remaining = int(braid_factor * self.width * self.height)
+        rounds = 0
+        while remaining > 0 and rounds < BRAID_ROUNDS:
+            # Walls off the border with exactly two open neighbours; only
+            # these are removed, which prevents creating large open areas
+            candidates = (self.maze == 1) & (self.maze.open_neighbour_counts() == 2)
+            candidates[0, :] = candidates[-1, :] = candidates[:, 0] = candidates[:, -1] = False
+            ys, xs = np.nonzero(candidates)
+            if not xs.size:
+                break
+            
+            # Sample candidates without replacement, in random order. One
+            # is opened only if it comes before every sampled neighbour, so
+            # no two neighbouring walls open together and each one still
+            # has exactly two open neighbours when it is opened
+            take = min(remaining, xs.size)
+            chosen = self.rng.choice(xs.size, size=take, replace=False)
+            ys, xs = ys[chosen], xs[chosen]
+            rank = np.full((self.height + 2, self.width + 2), take)
+            rank[ys + 1, xs + 1] = np.arange(take)
+            first = np.minimum(np.minimum(rank[ys, xs + 1], rank[ys + 2, xs + 1]),
+                               np.minimum(rank[ys + 1, xs], rank[ys + 1, xs + 2])) > np.arange(take)
+            
+            self.maze[ys[first], xs[first]] = 0
+            remaining -= int(np.count_nonzero(first))
+            rounds += 1
     
     def _place_keys(self, num_keys):
-        # Find possible key positions (path cells away from entrance and exit)
-        possible_positions = []
-        
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0:
-                    # Make sure it's not too close to the entrance
-                    distance_from_start = abs(x - 0) + abs(y - 1)
-                    if distance_from_start > 5:  # At least 5 cells away from start
-                        possible_positions.append((x, y))
-        
-        # Place keys
-        for _ in range(min(num_keys, len(possible_positions))):
-            if possible_positions:
-                pos = random.choice(possible_positions)
-                self.key_positions.append(pos)
-                possible_positions.remove(pos)
+        # Possible key positions: path cells more than 5 steps' walk from the entrance
+        possible = self.placement.free() & self.placement.farther_than(self.start_distances, 5)
+        
+        # Place keys; False if there aren't enough cells for all of them
+        self.key_positions.extend(self.placement.sample(num_keys, possible))
+        return len(self.key_positions) == num_keys
     
     def _place_door(self):
-        # Place a door near the exit
-        possible_door_positions = []
-        
-        # Find path cells that are close to where the exit might be
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0:
-                    # Check if it's in the far half of the maze
-                    if x > self.width // 2 and y > self.height // 4:
-                        # Make sure it's not a key position
-                        if (x, y) not in self.key_positions:
-                            possible_door_positions.append((x, y))
-        
-        if possible_door_positions:
-            self.door_position = random.choice(possible_door_positions)
+        # Place a door in the far half of the maze, where the exit is likely to be,
+        # on a cell that isn't already taken by a key
+        possible = (self.placement.free() &
+                    (self.placement.xs > self.width // 2) &
+                    (self.placement.ys > self.height // 4))
+        
+        door = self.placement.sample(1, possible)
+        if door:
+            self.door_position = door[0]
     
     def _place_stairs(self):
-        # Find possible stair positions (path cells away from entrance, keys, and door)
-        possible_positions = []
-        
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0:
-                    # Make sure it's not too close to the entrance
-                    distance_from_start = abs(x - 0) + abs(y - 1)
-                    if distance_from_start > 5:  # At least 5 cells away from start
-                        # Check it's not a key or door position
-                        if (x, y) not in self.key_positions and (x, y) != self.door_position:
-                            possible_positions.append((x, y))
-        
-        # Place stairs
-        if possible_positions:
-            stair_pos = random.choice(possible_positions)
-            self.stair_positions.append(stair_pos)
+        # Possible stair positions: path cells a walk away from the entrance, keys, and door
+        possible = self.placement.free() & self.placement.farther_than(self.start_distances, 5)
+        
+        # Place stairs; False if there is no cell for them
+        self.stair_positions.extend(self.placement.sample(1, possible))
+        return bool(self.stair_positions)
     
     def _place_enemies(self, num_enemies):
-        # Find possible enemy positions (path cells away from entrance, keys, door, and stairs)
-        possible_positions = []
-        
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0:
-                    # Make sure it's not too close to the entrance
-                    distance_from_start = abs(x - 0) + abs(y - 1)
-                    if distance_from_start > 3:  # At least 3 cells away from start
-                        # Check it's not a key, door, stair, or exit position
-                        if ((x, y) not in self.key_positions and 
-                            (x, y) != self.door_position and 
-                            (x, y) not in self.stair_positions and
-                            (x, y) != (self.exit_x, self.exit_y)):
-                            possible_positions.append((x, y))
+        # Possible enemy positions: path cells away from the entrance, not on a key,
+        # door, stair, or the exit
+        possible = (self.placement.free() &
+                    self.placement.outside_zone(self.start_pos, 3) &
+                    self.placement.excluding([(self.exit_x, self.exit_y)]))
         
         # Place enemies
-        for _ in range(min(num_enemies, len(possible_positions))):
-            if possible_positions:
-                pos = random.choice(possible_positions)
-                self.enemy_positions.append(pos)
-                possible_positions.remove(pos)
+        self.enemy_positions.extend(self.placement.sample(num_enemies, possible))
     
     def _place_traps(self, num_traps):
-        # Find possible trap positions (path cells away from entrance, keys, door, stairs, and enemies)
-        possible_positions = []
-        
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.maze[y][x] == 0:
-                    # Make sure it's not too close to the entrance
-                    distance_from_start = abs(x - 0) + abs(y - 1)
-                    if distance_from_start > 3:  # At least 3 cells away from start
-                        # Check it's not a key, door, stair, enemy, or exit position
-                        if ((x, y) not in self.key_positions and 
-                            (x, y) != self.door_position and 
-                            (x, y) not in self.stair_positions and
-                            (x, y) not in self.enemy_positions and
-                            (x, y) != (self.exit_x, self.exit_y)):
-                            possible_positions.append((x, y))
-        
-        # Place traps
-        for _ in range(min(num_traps, len(possible_positions))):
-            if possible_positions:
-                pos = random.choice(possible_positions)
-                trap_type = random.choice(["spike", "fire"])
-                self.trap_positions.append((pos[0], pos[1], trap_type))
-                possible_positions.remove(pos)
+        # Possible trap positions: path cells away from the entrance, not on a key,
+        # door, stair, enemy, or the exit
+        possible = (self.placement.free() &
+                    self.placement.outside_zone(self.start_pos, 3) &
+                    self.placement.excluding([(self.exit_x, self.exit_y)]))
+        
+        # Place traps, each with a random type
+        positions = self.placement.sample(num_traps, possible)
+        trap_types = self.rng.choice(["spike", "fire"], size=len(positions)).tolist()
+        for (x, y), trap_type in zip(positions, trap_types):
+            self.trap_positions.append((x, y, trap_type))
     
     def get_start_position(self):
-        return (0, 1)  # x, y coordinates
+        return self.start_pos  # x, y coordinates
     
     def get_exit_position(self):
         return (self.exit_x, self.exit_y)  # x, y coordinates
@@ -438,159 +309,43 @@ class MazeGenerator:
     
     def _is_maze_solvable(self):
         """
-        Check if the maze is solvable using breadth-first search.
-        Accounts for keys, doors, and multiple floors.
+        Check if the maze is solvable using connected-component labels.
+        Accounts for keys and doors: the maze is labelled once and every
+        reachability query is then a label comparison.
         """
-        from collections import deque
-        
         # Start position
         start_x, start_y = self.start_pos if hasattr(self, 'start_pos') else (1, 1)
+        start = (start_x, start_y)
+        exit_pos = (self.exit_x, self.exit_y)
+        
+        connectivity = ConnectivityMap(self.maze)
         
-        # If there's a door, we need to check if all keys are reachable and then if the exit is reachable
+        # If there's a door, all keys and the door must be reachable from the start
+        # and the exit must be reachable from the door
         if self.door_position is not None and self.key_positions:
-            # First, check if all keys are reachable from the start
-            keys_reachable = set()
-            
-            # For each key, check if it's reachable
-            for key_pos in self.key_positions:
-                # Create a visited set
-                visited = set()
-                queue = deque([(start_x, start_y)])
-                
-                while queue:
-                    x, y = queue.popleft()
-                    
-                    if (x, y) == key_pos:
-                        keys_reachable.add(key_pos)
-                        break
-                    
-                    if (x, y) in visited:
-                        continue
-                    
-                    visited.add((x, y))
-                    
-                    # Check all four directions
-                    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                        nx, ny = x + dx, y + dy
-                        
-                        # Check if the new position is valid
-                        if (0 <= nx < self.width and 0 <= ny < self.height and 
-                            self.maze[ny, nx] == 0 and (nx, ny) not in visited):
-                            queue.append((nx, ny))
-            
-            # If not all keys are reachable, the maze is not solvable
-            if len(keys_reachable) < len(self.key_positions):
-                return False
-            
-            # Now check if the door is reachable from the start
-            visited = set()
-            queue = deque([(start_x, start_y)])
-            door_reachable = False
-            
-            while queue:
-                x, y = queue.popleft()
-                
-                if (x, y) == self.door_position:
-                    door_reachable = True
-                    break
-                
-                if (x, y) in visited:
-                    continue
-                
-                visited.add((x, y))
-                
-                # Check all four directions
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    nx, ny = x + dx, y + dy
-                    
-                    # Check if the new position is valid
-                    if (0 <= nx < self.width and 0 <= ny < self.height and 
-                        self.maze[ny, nx] == 0 and (nx, ny) not in visited):
-                        queue.append((nx, ny))
-            
-            # If the door is not reachable, the maze is not solvable
-            if not door_reachable:
-                return False
-            
-            # Finally, check if the exit is reachable from the door
-            visited = set()
-            queue = deque([self.door_position])
-            
-            while queue:
-                x, y = queue.popleft()
-                
-                if (x, y) == (self.exit_x, self.exit_y):
-                    return True
-                
-                if (x, y) in visited:
-                    continue
-                
-                visited.add((x, y))
-                
-                # Check all four directions
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    nx, ny = x + dx, y + dy
-                    
-                    # Check if the new position is valid
-                    if (0 <= nx < self.width and 0 <= ny < self.height and 
-                        self.maze[ny, nx] == 0 and (nx, ny) not in visited):
-                        queue.append((nx, ny))
-            
-            # If we get here, the exit is not reachable from the door
-            return False
+            return (connectivity.all_reachable(start, self.key_positions) and
+                    connectivity.is_reachable(start, self.door_position) and
+                    connectivity.is_reachable(self.door_position, exit_pos))
         
         # If there's no door, just check if the exit is reachable from the start
-        else:
-            # Create a visited set
-            visited = set()
-            queue = deque([(start_x, start_y)])
-            
-            while queue:
-                x, y = queue.popleft()
-                
-                if (x, y) == (self.exit_x, self.exit_y):
-                    return True
-                
-                if (x, y) in visited:
-                    continue
-                
-                visited.add((x, y))
-                
-                # Check all four directions
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    nx, ny = x + dx, y + dy
-                    
-                    # Check if the new position is valid
-                    if (0 <= nx < self.width and 0 <= ny < self.height and 
-                        self.maze[ny, nx] == 0 and (nx, ny) not in visited):
-                        queue.append((nx, ny))
-            
-            # If we get here, the exit is not reachable
-            return False
+        return connectivity.is_reachable(start, exit_pos)
     
-    def _create_simple_solvable_maze(self, start_pos, min_exit_distance, keys_required):
+    def _create_simple_solvable_maze(self, start_pos, min_exit_distance, keys_required, braid_factor=BRAID_FACTOR, needs_stairs=False):
         """
         Create a simple maze that is guaranteed to be solvable.
         Used as a fallback when normal generation fails.
         """
         # Reset the maze to all walls
-        self.maze = np.ones((self.height, self.width), dtype=int)
+        self.maze = MazeGrid((self.height, self.width))
         self.maze[0, :] = self.maze[-1, :] = self.maze[:, 0] = self.maze[:, -1] = 1
         
         # Extract start position
         start_x, start_y = start_pos
         
-        # Create a path from start to a distant point for the exit
-        exit_x = self.width - 2
-        exit_y = self.height - 2
-        
-        # Ensure minimum distance
-        if min_exit_distance is not None:
-            while abs(exit_x - start_x) + abs(exit_y - start_y) < min_exit_distance:
-                if exit_x > start_x + min_exit_distance // 2:
-                    exit_x = start_x + min_exit_distance // 2
-                if exit_y > start_y + min_exit_distance // 2:
-                    exit_y = start_y + min_exit_distance // 2
+        # Create a path from start to the far corner for the exit: the
+        # furthest it can be, so the minimum distance holds whenever it can
+        exit_x = 1 if start_x > self.width // 2 else self.width - 2
+        exit_y = 1 if start_y > self.height // 2 else self.height - 2
         
         # Create a direct path from start to exit
         x, y = start_x, start_y
@@ -665,4 +420,21 @@ class MazeGenerator:
         self.exit_x, self.exit_y = exit_x, exit_y
         
         # Add some random paths to make it less obvious
-        self._add_random_paths(extra_paths=True) 
\ No newline at end of file
+        self._add_random_paths(braid_factor * 2)
+        self.graph = None
+        
+        # Every open cell hangs off the carved path, so stairs can go on any
+        # free one a walk away from the start
+        self.stair_positions = []
+        if needs_stairs:
+            self.start_distances = MazeGraph(self.maze).distances_from(start_pos)
+            self.placement = PlacementIndex(self.maze, self.rng)
+            self.placement.occupy([start_pos, (exit_x, exit_y)] + self.key_positions)
+            if self.door_position is not None:
+                self.placement.occupy([self.door_position])
+            self._place_stairs()
+        
+        # Entities left from the failed attempts must still stand on a path
+        self.enemy_positions = [pos for pos in self.enemy_positions if self.maze[pos[1], pos[0]] == 0]
+        self.trap_positions = [trap for trap in self.trap_positions if self.maze[trap[1], trap[0]] == 0]
+
@@ -0,0 +1,217 @@
+import heapq
+import numpy as np
+from maze_grid import NEIGHBOURS
+
+UNREACHABLE = np.iinfo(np.int32).max
+
+
+class MazeGraph:
+    """
+    A maze reduced to a weighted graph for true walking distances.
+
+    Nodes are the junctions and dead ends (open cells without exactly two
+    open neighbours); the corridors between them become edges weighted by
+    their length. Every corridor cell remembers its edge and how far along
+    it lies, so a distance between any two cells is a short search over
+    the nodes plus a lookup at each end. Everything is stored in int32
+    arrays: node coordinates, edges in CSR form, and per-cell edge/offset
+    grids.
+    """
+    def __init__(self, maze):
+        maze = np.asarray(maze)
+        self.height, self.width = maze.shape
+        open_cells = maze == 0
+
+        # Open neighbour count of every open cell
+        padded = np.pad(open_cells, 1)
+        degree = (padded[:-2, 1:-1].astype(np.int8) + padded[2:, 1:-1] +
+                  padded[1:-1, :-2] + padded[1:-1, 2:])
+        degree[~open_cells] = 0
+
+        # Per cell: node id, or the corridor edge it is on and its offset from edge_u
+        self.cell_node = np.full(maze.shape, -1, dtype=np.int32)
+        self.cell_edge = np.full(maze.shape, -1, dtype=np.int32)
+        self.cell_offset = np.zeros(maze.shape, dtype=np.int32)
+
+        node_cells = np.argwhere(open_cells & (degree != 2))
+        nodes = [(int(x), int(y)) for y, x in node_cells]
+        for i, (x, y) in enumerate(nodes):
+            self.cell_node[y, x] = i
+
+        edges = []
+        for node in range(len(nodes)):
+            self._trace_edges(node, nodes, edges, open_cells)
+
+        # Corridors that loop back on themselves without any junction: make
+        # one cell of each loop a node and trace from there
+        while True:
+            untraced = np.argwhere(open_cells & (self.cell_node < 0) & (self.cell_edge < 0))
+            if not untraced.size:
+                break
+            y, x = (int(v) for v in untraced[0])
+            self.cell_node[y, x] = len(nodes)
+            nodes.append((x, y))
+            self._trace_edges(len(nodes) - 1, nodes, edges, open_cells)
+
+        self.node_x = np.array([x for x, _ in nodes], dtype=np.int32)
+        self.node_y = np.array([y for _, y in nodes], dtype=np.int32)
+        edge_array = np.array(edges, dtype=np.int32).reshape(-1, 3)
+        self.edge_u, self.edge_v, self.edge_weight = edge_array.T.copy()
+
+        # Adjacency in CSR form, each edge stored in both directions
+        sources = np.concatenate([self.edge_u, self.edge_v])
+        targets = np.concatenate([self.edge_v, self.edge_u])
+        weights = np.concatenate([self.edge_weight, self.edge_weight])
+        order = np.argsort(sources, kind="stable")
+        self.adjacency = targets[order]
+        self.adjacency_weight = weights[order]
+        self.indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=len(nodes)), out=self.indptr[1:])
+
+        # Rows of node-to-node distances computed so far
+        self.node_rows = {}
+        self.all_pairs = None
+
+    def __len__(self):
+        return self.node_x.size
+
+    def _trace_edges(self, node, nodes, edges, open_cells):
+        """Follow every corridor leaving node until it reaches another node"""
+        start_x, start_y = nodes[node]
+        steps = NEIGHBOURS.tolist()  # Plain ints for the cell-by-cell walk
+        for dx, dy in steps:
+            x, y = start_x + dx, start_y + dy
+            if not (0 <= x < self.width and 0 <= y < self.height and open_cells[y, x]):
+                continue
+            if self.cell_node[y, x] >= 0:
+                # Two nodes side by side; store the edge once
+                if node < self.cell_node[y, x]:
+                    edges.append((node, int(self.cell_node[y, x]), 1))
+                continue
+            if self.cell_edge[y, x] >= 0:
+                continue  # Corridor already traced from its other end
+
+            edge = len(edges)
+            previous = (start_x, start_y)
+            length = 1
+            while self.cell_node[y, x] < 0:
+                self.cell_edge[y, x] = edge
+                self.cell_offset[y, x] = length
+                # Corridor cells have exactly two open neighbours: go on
+                # through the one we didn't come from
+                for ndx, ndy in steps:
+                    nx, ny = x + ndx, y + ndy
+                    if ((nx, ny) != previous and 0 <= nx < self.width and 0 <= ny < self.height
+                            and open_cells[ny, nx]):
+                        break
+                previous = (x, y)
+                x, y = nx, ny
+                length += 1
+            edges.append((node, int(self.cell_node[y, x]), length))
+
+    def _endpoints(self, cell):
+        """(node, distance) pairs to walk through to leave cell"""
+        x, y = cell
+        node = self.cell_node[y, x]
+        if node >= 0:
+            return [(int(node), 0)]
+        edge = self.cell_edge[y, x]
+        if edge < 0:
+            return []  # Wall
+        offset = int(self.cell_offset[y, x])
+        return [(int(self.edge_u[edge]), offset),
+                (int(self.edge_v[edge]), int(self.edge_weight[edge]) - offset)]
+
+    def _dijkstra(self, seeds):
+        distances = np.full(len(self), UNREACHABLE, dtype=np.int64)
+        frontier = []
+        for node, distance in seeds:
+            if distance < distances[node]:
+                distances[node] = distance
+                heapq.heappush(frontier, (distance, node))
+
+        indptr = self.indptr.tolist()
+        adjacency = self.adjacency.tolist()
+        weights = self.adjacency_weight.tolist()
+        best = distances.tolist()
+        while frontier:
+            distance, node = heapq.heappop(frontier)
+            if distance > best[node]:
+                continue  # Stale queue entry
+            for i in range(indptr[node], indptr[node + 1]):
+                neighbour = adjacency[i]
+                candidate = distance + weights[i]
+                if candidate < best[neighbour]:
+                    best[neighbour] = candidate
+                    heapq.heappush(frontier, (candidate, neighbour))
+        return np.array(best, dtype=np.int64)
+
+    def node_distances(self, node):
+        """Walking distances from one node to every node (cached)"""
+        if self.all_pairs is not None:
+            return self.all_pairs[node]
+        row = self.node_rows.get(node)
+        if row is None:
+            row = self._dijkstra([(node, 0)])
+            self.node_rows[node] = row
+        return row
+
+    def precompute_all_pairs(self):
+        """Fill the full node-to-node distance matrix so every query is a lookup"""
+        if self.all_pairs is None:
+            matrix = np.empty((len(self), len(self)), dtype=np.int32)
+            for node in range(len(self)):
+                row = self.node_rows.get(node)
+                if row is None:
+                    row = self._dijkstra([(node, 0)])
+                matrix[node] = np.minimum(row, UNREACHABLE)
+            self.all_pairs = matrix
+            self.node_rows = {}
+        return self.all_pairs
+
+    def distance(self, a, b):
+        """Walking distance between two open cells, or None if b can't be reached from a"""
+        if a == b:
+            return 0
+        best = UNREACHABLE
+
+        # Both on the same corridor: walking straight along it
+        edge_a = self.cell_edge[a[1], a[0]]
+        if edge_a >= 0 and edge_a == self.cell_edge[b[1], b[0]]:
+            best = abs(int(self.cell_offset[a[1], a[0]]) - int(self.cell_offset[b[1], b[0]]))
+
+        for node_a, distance_a in self._endpoints(a):
+            row = self.node_distances(node_a)
+            for node_b, distance_b in self._endpoints(b):
+                if row[node_b] < UNREACHABLE:
+                    best = min(best, distance_a + int(row[node_b]) + distance_b)
+        return None if best == UNREACHABLE else best
+
+    def distances_from(self, cell):
+        """
+        Walking distance from cell to every cell of the maze, as an int32
+        array shaped like the maze; walls and unreachable cells are -1.
+        """
+        node_distances = self._dijkstra(self._endpoints(cell))
+        result = np.full((self.height, self.width), UNREACHABLE, dtype=np.int64)
+
+        # Nodes directly
+        result[self.node_y, self.node_x] = node_distances
+
+        # Corridor cells through whichever end of their corridor is closer
+        corridor = self.cell_edge >= 0
+        edges = self.cell_edge[corridor]
+        offsets = self.cell_offset[corridor]
+        via_u = node_distances[self.edge_u[edges]] + offsets
+        via_v = node_distances[self.edge_v[edges]] + self.edge_weight[edges] - offsets
+        result[corridor] = np.minimum(via_u, via_v)
+
+        # Cells on the start's own corridor can also be reached directly along it
+        x, y = cell
+        own_edge = self.cell_edge[y, x]
+        if own_edge >= 0:
+            same = self.cell_edge == own_edge
+            result[same] = np.minimum(result[same], np.abs(self.cell_offset[same] - self.cell_offset[y, x]))
+
+        result[result >= UNREACHABLE] = -1
+        return result.astype(np.int32)
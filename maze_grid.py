@@ -0,0 +1,104 @@
+import numpy as np
+
+PATH = 0
+WALL = 1
+
+# Neighbour offsets as (dx, dy); the one order used for directions everywhere
+NEIGHBOURS = np.array([(0, 1), (1, 0), (0, -1), (-1, 0)])
+
+
+class MazeGrid(np.ndarray):
+    """
+    A maze as a 2D uint8 array, indexed [y, x], with 0 for path and 1 for
+    wall: one byte per cell instead of eight for the default int array.
+
+    It is a NumPy array, so whole-maze code keeps working on it unchanged;
+    the methods add bounds-checked single-cell and bulk neighbour queries.
+    Results of arithmetic and comparisons come back as plain arrays. For
+    storage, pack() squeezes it further to one bit per cell.
+    """
+    def __new__(cls, shape, fill=WALL):
+        return np.full(shape, fill, dtype=np.uint8).view(cls)
+
+    @classmethod
+    def from_array(cls, array):
+        """MazeGrid with the cells of any 0/1 array (copied)"""
+        return np.array(array, dtype=np.uint8).view(cls)
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        # Only the maze itself (and views of it) is a MazeGrid
+        if return_scalar:
+            return array[()]
+        return array.view(np.ndarray)
+
+    @property
+    def width(self):
+        return self.shape[1]
+
+    @property
+    def height(self):
+        return self.shape[0]
+
+    def is_open(self, x, y):
+        """Whether (x, y) is inside the maze and a path"""
+        height, width = self.shape
+        return 0 <= x < width and 0 <= y < height and self.item(y, x) == PATH
+
+    def open_mask(self, x, y):
+        """For arrays of coordinates, the mask of cells inside the maze that are paths"""
+        x = np.asarray(x)
+        y = np.asarray(y)
+        inside = (x >= 0) & (x < self.shape[1]) & (y >= 0) & (y < self.shape[0])
+        result = np.zeros(x.shape, dtype=bool)
+        result[inside] = self.view(np.ndarray)[y[inside], x[inside]] == PATH
+        return result
+
+    def open_neighbours(self, x, y):
+        """
+        For arrays of cells, an (n, 4) mask of which neighbours are paths,
+        in NEIGHBOURS order.
+        """
+        x = np.asarray(x).reshape(-1, 1)
+        y = np.asarray(y).reshape(-1, 1)
+        return self.open_mask(x + NEIGHBOURS[:, 0], y + NEIGHBOURS[:, 1])
+
+    def open_neighbour_counts(self):
+        """Number of open neighbours of every cell, as an array shaped like the maze"""
+        padded = np.pad(self.view(np.ndarray) == PATH, 1)
+        return (padded[:-2, 1:-1].astype(np.uint8) + padded[2:, 1:-1] +
+                padded[1:-1, :-2] + padded[1:-1, 2:])
+
+    def pack(self):
+        return PackedMazeGrid(np.packbits(self.view(np.ndarray), axis=1, bitorder="little"), self.shape)
+
+
+class PackedMazeGrid:
+    """
+    A maze stored one bit per cell (set for walls), each row packed into
+    bytes with np.packbits. Answers the same cell queries as MazeGrid
+    without unpacking; unpack() gives back the MazeGrid.
+    """
+    def __init__(self, bits, shape):
+        self.bits = bits
+        self.shape = tuple(shape)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def is_open(self, x, y):
+        height, width = self.shape
+        return 0 <= x < width and 0 <= y < height and not (self.bits.item(y, x >> 3) >> (x & 7)) & 1
+
+    def open_mask(self, x, y):
+        x = np.asarray(x)
+        y = np.asarray(y)
+        inside = (x >= 0) & (x < self.shape[1]) & (y >= 0) & (y < self.shape[0])
+        xs = x[inside]
+        result = np.zeros(x.shape, dtype=bool)
+        result[inside] = (self.bits[y[inside], xs >> 3] >> (xs & 7)) & 1 == 0
+        return result
+
+    def unpack(self):
+        cells = np.unpackbits(self.bits, axis=1, count=self.shape[1], bitorder="little")
+        return cells.view(MazeGrid)
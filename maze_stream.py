@@ -0,0 +1,162 @@
+import argparse
+import sys
+import numpy as np
+from maze_grid import MazeGrid, WALL
+
+
+def _find(parent, label):
+    while parent[label] != label:
+        parent[label] = parent[parent[label]]
+        label = parent[label]
+    return label
+
+
+def eller_rows(width, rng=None, height=None):
+    """
+    Generate a perfect maze row by row with Eller's algorithm, yielding
+    each maze row (a uint8 array of width cells, 0 = path, 1 = wall) as
+    soon as it is final.
+
+    Only the current row of cells and their set labels are kept, so memory
+    stays O(width) however tall the maze gets. With height=None the stream
+    never ends; otherwise it yields exactly height rows (height is made
+    odd like in MazeGenerator) with the last row of cells closed off so
+    the maze is connected.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    width = width if width % 2 == 1 else width + 1
+    cols = (width - 1) // 2
+    rows = None
+    if height is not None:
+        height = height if height % 2 == 1 else height + 1
+        rows = (height - 1) // 2
+
+    # Top border
+    yield np.full(width, WALL, dtype=np.uint8)
+    if cols < 1 or rows == 0:
+        if height is not None:
+            for _ in range(height - 1):
+                yield np.full(width, WALL, dtype=np.uint8)
+        return
+
+    # Set label of every cell in the current row, always compacted to 0..cols-1
+    labels = np.arange(cols)
+    row = 0
+    while rows is None or row < rows:
+        last = rows is not None and row == rows - 1
+
+        # Join neighbours in different sets at random (all of them on the
+        # last row); left to right with a small union-find over the labels
+        # so a join never closes a loop
+        parent = list(range(cols))
+        join_rolls = rng.random(cols - 1).tolist()
+        cell_row = np.full(width, WALL, dtype=np.uint8)
+        cell_row[1:-1:2] = 0
+        label_list = labels.tolist()
+        for k in range(cols - 1):
+            a = _find(parent, label_list[k])
+            b = _find(parent, label_list[k + 1])
+            if a != b and (last or join_rolls[k] < 0.5):
+                parent[b] = a
+                cell_row[2 * k + 2] = 0
+        labels = np.array([_find(parent, label) for label in label_list])
+        yield cell_row
+
+        if last:
+            break
+
+        # Each set carries on downwards through at least one cell, the
+        # others drop down at random
+        down = rng.random(cols) < 0.5
+        has_down = np.zeros(cols, dtype=bool)
+        has_down[labels[down]] = True
+        order = rng.permutation(cols)
+        set_ids, first = np.unique(labels[order], return_index=True)
+        representatives = order[first[~has_down[set_ids]]]
+        down[representatives] = True
+
+        below = np.full(width, WALL, dtype=np.uint8)
+        below[1:-1:2][down] = 0
+        yield below
+
+        # Cells below a passage keep their set, the rest start new ones
+        labels = np.where(down, labels, cols + np.arange(cols))
+        _, labels = np.unique(labels, return_inverse=True)
+        row += 1
+
+    # Bottom border
+    yield np.full(width, WALL, dtype=np.uint8)
+
+
+class MazeStream:
+    """
+    A scrolling window over an endless maze: the last window_height rows
+    of an eller_rows stream, as a MazeGrid. scroll() pulls new rows in at
+    the bottom and drops the top ones; top is the absolute row index of
+    the window's first row, so positions in the endless maze map to window
+    rows by subtracting it.
+    """
+    def __init__(self, width, window_height, rng=None, height=None):
+        self.rows = eller_rows(width, rng, height)
+        self.window = MazeGrid((window_height, width if width % 2 == 1 else width + 1))
+        self.top = 0
+        self.finished = False
+        for y in range(window_height):
+            self.window[y] = self._next_row()
+
+    def _next_row(self):
+        row = next(self.rows, None)
+        if row is None:
+            # A finite stream has ended; keep scrolling through solid wall
+            self.finished = True
+            return np.full(self.window.shape[1], WALL, dtype=np.uint8)
+        return row
+
+    def scroll(self, count=1):
+        """Move the window count rows down the maze"""
+        if count <= 0:
+            return
+        # Rows that would scroll straight through the window are skipped
+        for _ in range(count - self.window.shape[0]):
+            self._next_row()
+        kept = min(count, self.window.shape[0])
+        new_rows = np.array([self._next_row() for _ in range(kept)])
+        self.window[:-kept] = self.window[kept:]
+        self.window[-kept:] = new_rows
+        self.top += count
+
+    def is_open(self, x, y):
+        """Whether absolute maze cell (x, y) is inside the window and a path"""
+        return self.window.is_open(x, y - self.top)
+
+
+def write_maze(rows, out, wall="#", path=" "):
+    """Write maze rows to a text file as they arrive; returns the number of rows"""
+    # Row values index straight into the two characters
+    table = np.frombuffer((path + wall).encode("ascii"), dtype=np.uint8)
+    count = 0
+    for row in rows:
+        out.write(table[row].tobytes().decode("ascii") + "\n")
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream an arbitrarily tall maze to a text file")
+    parser.add_argument("--width", type=int, default=41)
+    parser.add_argument("--height", type=int, default=41)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="-", help="File to write ('-' for stdout)")
+    args = parser.parse_args()
+
+    rows = eller_rows(args.width, np.random.default_rng(args.seed), args.height)
+    if args.output == "-":
+        write_maze(rows, sys.stdout)
+    else:
+        with open(args.output, "w") as out:
+            count = write_maze(rows, out)
+        print(f"Wrote {count} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
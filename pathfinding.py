@@ -0,0 +1,76 @@
+import numpy as np
+from maze_graph import MazeGraph
+from maze_grid import NEIGHBOURS
+
+
+class PathfindingService:
+    """
+    Shared pathfinding for enemy AI on one maze.
+
+    Chasing enemies follow a single distance field towards the target (the
+    player's cell): each one steps to a neighbour one closer, so the cost
+    is one search per target move however many enemies chase. The field
+    comes from the maze's corridor graph (MazeGraph.distances_from) and is
+    only rebuilt when the target changes cells.
+    """
+    def __init__(self, maze=None):
+        self.maze = None
+        self.graph = None
+        self.target = None
+        self.field = None
+
+        # Number of distance field rebuilds, to check that idle ticks cost nothing
+        self.field_builds = 0
+
+        if maze is not None:
+            self.set_maze(maze)
+
+    def set_maze(self, maze, graph=None):
+        """
+        Switch to a new maze, dropping everything computed for the old one.
+        graph is the maze's MazeGraph if there already is one; otherwise it
+        is built the first time a field is needed.
+        """
+        self.maze = np.asarray(maze)
+        self.graph = graph
+        self.target = None
+        self.field = None
+
+    def set_target(self, target):
+        """Point the distance field at target, rebuilding it only if it moved"""
+        if target != self.target:
+            self.target = target
+            if self.graph is None:
+                self.graph = MazeGraph(self.maze)
+            self.field = self.graph.distances_from(target)
+            self.field_builds += 1
+
+    def distance(self, x, y):
+        """Steps from the given cell(s) to the target; -1 if unreachable"""
+        return self.field[y, x]
+
+    def next_directions(self, x, y):
+        """
+        For arrays of cells, the index into NEIGHBOURS of the step that gets
+        closer to the target, or -1 where there is none (at the target or
+        cut off from it).
+        """
+        height, width = self.field.shape
+        x = np.asarray(x)
+        y = np.asarray(y)
+        own = self.field[y, x]
+
+        # Distances of the four neighbours, with walls and the outside as "no way"
+        neighbour_distances = np.full((x.size, len(NEIGHBOURS)), np.iinfo(np.int32).max, dtype=np.int64)
+        for i, (dx, dy) in enumerate(NEIGHBOURS):
+            nx = x + dx
+            ny = y + dy
+            inside = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+            values = np.full(x.size, -1, dtype=np.int64)
+            values[inside] = self.field[ny[inside], nx[inside]]
+            reachable = values >= 0
+            neighbour_distances[reachable, i] = values[reachable]
+
+        best = neighbour_distances.argmin(axis=1)
+        closer = neighbour_distances[np.arange(x.size), best] < own
+        return np.where((own > 0) & closer, best, -1)
@@ -0,0 +1,72 @@
+import numpy as np
+
+
+class PlacementIndex:
+    """
+    Index of the open interior cells of a maze, built once per generation
+    and shared by all of MazeGenerator's _place_* methods.
+
+    Candidate cells are stored as parallel x/y arrays so placement filters
+    are vectorized masks over them, and an occupancy bitmap replaces list
+    membership checks against already placed entities.
+    """
+    def __init__(self, maze, rng=None):
+        height, width = maze.shape
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.width = width
+        self.height = height
+
+        # Open cells, excluding the border rows and columns
+        cells = np.argwhere(np.asarray(maze)[1:-1, 1:-1] == 0) + 1
+        self.ys = cells[:, 0]
+        self.xs = cells[:, 1]
+
+        # Cells already taken by a placed entity
+        self.occupied = np.zeros((height, width), dtype=bool)
+
+    def __len__(self):
+        return self.xs.size
+
+    def free(self):
+        """Mask of candidate cells that are not occupied"""
+        return ~self.occupied[self.ys, self.xs]
+
+    def outside_zone(self, center, radius):
+        """Mask of candidate cells further than radius (Manhattan) from center"""
+        cx, cy = center
+        return np.abs(self.xs - cx) + np.abs(self.ys - cy) > radius
+
+    def inside_zone(self, center, radius):
+        """Mask of candidate cells within radius (Manhattan) of center"""
+        return ~self.outside_zone(center, radius)
+
+    def farther_than(self, distances, radius):
+        """Mask of candidate cells whose value in a distance grid is over radius"""
+        return distances[self.ys, self.xs] > radius
+
+    def excluding(self, positions):
+        """Mask of candidate cells that are none of the given positions"""
+        mask = np.ones(self.xs.size, dtype=bool)
+        for x, y in positions:
+            mask &= (self.xs != x) | (self.ys != y)
+        return mask
+
+    def occupy(self, positions):
+        for x, y in positions:
+            self.occupied[y, x] = True
+
+    def sample(self, count, mask=None, occupy=True):
+        """
+        Pick up to count distinct candidate cells matching mask.
+        Returns a list of (x, y) tuples, marked as occupied unless told otherwise.
+        """
+        choices = np.flatnonzero(mask) if mask is not None else np.arange(self.xs.size)
+        count = min(count, choices.size)
+        if count <= 0:
+            return []
+
+        picked = self.rng.choice(choices, size=count, replace=False)
+        positions = list(zip(self.xs[picked].tolist(), self.ys[picked].tolist()))
+        if occupy:
+            self.occupy(positions)
+        return positions
@@ -1,22 +1,48 @@
+import numpy as np
 import pygame
 
 class Player:
-    def __init__(self, x, y, cell_size):
+    def __init__(self, x, y, cell_size, maze_shape=None):
         self.x = x
         self.y = y
         self.cell_size = cell_size
         self.color = (0, 0, 255)  # Blue
-        self.speed = 5
+        self.speed = 9.0  # Movement speed (cells per second)
         self.target_x = x * cell_size
         self.target_y = y * cell_size
         self.current_x = self.target_x
         self.current_y = self.target_y
+        
+        # Position at the previous simulation tick and the interpolated
+        # position between the two that is drawn
+        self.previous_x = self.current_x
+        self.previous_y = self.current_y
+        self.draw_x = self.current_x
+        self.draw_y = self.current_y
         self.moving = False
         self.steps_taken = 0
         self.visited_cells = set()
         self.visited_cells.add((x, y))
         self.continuous_dx = 0
         self.continuous_dy = 0
+        
+        # Cells shown on the minimap: visited cells and their neighbours.
+        # explored_version changes whenever the mask does
+        self.explored = None
+        self.explored_version = 0
+        if maze_shape is not None:
+            self.reset_explored(maze_shape)
+    
+    def reset_explored(self, maze_shape):
+        self.explored = np.zeros(maze_shape, dtype=bool)
+        self.explore(self.x, self.y)
+    
+    def explore(self, x, y):
+        """Mark a visited cell and its four neighbours as explored"""
+        height, width = self.explored.shape
+        self.explored[y, max(0, x - 1):min(width, x + 2)] = True
+        self.explored[max(0, y - 1):min(height, y + 2), x] = True
+        self.explored_version += 1
     
     def move(self, dx, dy, maze):
         if self.moving:
@@ -25,7 +51,7 @@ class Player:
         new_x, new_y = self.x + dx, self.y + dy
         
         # Check if the new position is valid (not a wall)
-        if 0 <= new_x < maze.shape[1] and 0 <= new_y < maze.shape[0] and maze[new_y][new_x] == 0:
+        if maze.is_open(new_x, new_y):
             self.x = new_x
             self.y = new_y
             self.target_x = self.x * self.cell_size
@@ -33,6 +59,9 @@ class Player:
             self.moving = True
             self.steps_taken += 1
             self.visited_cells.add((new_x, new_y))
+            if self.explored is None or self.explored.shape != maze.shape:
+                self.reset_explored(maze.shape)
+            self.explore(new_x, new_y)
             
             # Set continuous movement direction
             self.continuous_dx = dx
@@ -53,9 +82,11 @@ class Player:
         self.continuous_dx = 0
         self.continuous_dy = 0
     
-    def update(self):
-        """Update player position based on continuous movement"""
+    def update(self, delta_time):
+        """Advance the movement animation by delta_time seconds"""
         moved = False
+        self.previous_x = self.current_x
+        self.previous_y = self.current_y
         
         if self.moving:
             # Calculate target position
@@ -65,8 +96,9 @@ class Player:
             # Move towards target position
             dx = target_x - self.current_x
             dy = target_y - self.current_y
+            step = self.speed * self.cell_size * delta_time
             
-            if abs(dx) < self.speed and abs(dy) < self.speed:
+            if abs(dx) <= step and abs(dy) <= step:
                 # Reached target position
                 self.current_x = target_x
                 self.current_y = target_y
@@ -75,38 +107,53 @@ class Player:
             else:
                 # Continue moving towards target
                 if dx > 0:
-                    self.current_x += self.speed
+                    self.current_x += step
                 elif dx < 0:
-                    self.current_x -= self.speed
+                    self.current_x -= step
                 
                 if dy > 0:
-                    self.current_y += self.speed
+                    self.current_y += step
                 elif dy < 0:
-                    self.current_y -= self.speed
+                    self.current_y -= step
         
+        self.draw_x = self.current_x
+        self.draw_y = self.current_y
         return moved
     
+    def interpolate(self, alpha):
+        """Place the drawn position alpha of the way from the previous tick to the current one"""
+        self.draw_x = self.previous_x + (self.current_x - self.previous_x) * alpha
+        self.draw_y = self.previous_y + (self.current_y - self.previous_y) * alpha
+    
     def draw(self, screen):
         pygame.draw.circle(
             screen, 
             self.color, 
-            (self.current_x + self.cell_size // 2, self.current_y + self.cell_size // 2), 
+            (self.draw_x + self.cell_size // 2, self.draw_y + self.cell_size // 2), 
             self.cell_size // 2 - 4
         )
     
-    def reset(self, x, y):
+    def reset(self, x, y, maze_shape=None):
         self.x = x
         self.y = y
         self.target_x = x * self.cell_size
         self.target_y = y * self.cell_size
         self.current_x = self.target_x
         self.current_y = self.target_y
+        self.previous_x = self.current_x
+        self.previous_y = self.current_y
+        self.draw_x = self.current_x
+        self.draw_y = self.current_y
         self.moving = False
         self.steps_taken = 0
         self.visited_cells = set()
         self.visited_cells.add((x, y))
         self.continuous_dx = 0
         self.continuous_dy = 0
+        if maze_shape is None and self.explored is not None:
+            maze_shape = self.explored.shape
+        if maze_shape is not None:
+            self.reset_explored(maze_shape)
     
     def get_position(self):
         return (self.x, self.y)
@@ -114,6 +161,10 @@ class Player:
     def get_steps_taken(self):
         return self.steps_taken
     
+    def get_draw_rect(self):
+        """Screen area covered by draw(), used to track what needs repainting"""
+        return pygame.Rect(int(self.draw_x), int(self.draw_y), self.cell_size + 1, self.cell_size + 1)
+    
     def get_rect(self):
         """
         Returns a pygame Rect object representing the player's position and size.
@@ -0,0 +1,44 @@
+class RenderList:
+    """
+    Collects the sprites to draw and submits them to a surface in one
+    Surface.blits call, in the order they were added.
+
+    Sprites whose destination rect misses the cull rect (the part of the
+    screen that is being drawn and can be seen) are dropped as they are
+    added. The counters cover the current frame, which may submit several
+    lists (one per dirty rect): draw_calls is the number of calls made on
+    the surface, sprites how many were drawn and culled how many skipped.
+    """
+    def __init__(self):
+        self.items = []
+        self.cull_rect = None
+
+        self.draw_calls = 0
+        self.sprites = 0
+        self.culled = 0
+
+    def begin_frame(self):
+        """Reset the counters"""
+        self.draw_calls = 0
+        self.sprites = 0
+        self.culled = 0
+
+    def begin(self, cull_rect=None):
+        """Start a new list; with no cull_rect nothing is culled"""
+        self.items = []
+        self.cull_rect = cull_rect
+
+    def add(self, sprite, rect):
+        """Queue sprite for drawing at rect.topleft, unless rect can't be seen"""
+        if self.cull_rect is not None and not self.cull_rect.colliderect(rect):
+            self.culled += 1
+            return
+        self.items.append((sprite, rect.topleft))
+
+    def submit(self, surface):
+        """Draw everything queued onto surface"""
+        if self.items:
+            surface.blits(self.items, doreturn=False)
+            self.draw_calls += 1
+            self.sprites += len(self.items)
+        self.items = []
@@ -0,0 +1,48 @@
+import argparse
+import random
+import time
+from game import MazeGame
+
+MOVES = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+
+def simulate(level, ticks, delta_time=1 / 60, seed=0, restart=True):
+    """
+    Play a level headlessly with a random-walk bot for the given number of
+    ticks, restarting the same layout whenever the game ends.
+    Returns (ticks per second, number of games finished).
+    """
+    bot = random.Random(seed)
+    game = MazeGame(headless=True)
+    game.init_game(level, seed=seed)
+
+    finished = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        move = bot.choice(MOVES) if not game.player.moving else None
+        game.step(delta_time, move)
+        if not game.game_active:
+            finished += 1
+            if not restart:
+                break
+            game.init_game(level, seed=seed)
+    elapsed = time.perf_counter() - start
+    game.floor_worker.shutdown()
+    return ticks / elapsed if elapsed > 0 else float("inf"), finished
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Maze Runner levels headlessly with a random bot")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'level':<8}{'ticks':>10}{'ticks/s':>12}{'games':>8}")
+    for level in args.levels:
+        rate, finished = simulate(level, args.ticks, seed=args.seed)
+        print(f"{level:<8}{args.ticks:>10}{rate:>12.0f}{finished:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -255,4 +255,44 @@ class SoundManager:
     def set_sound_volume(self, volume):
         """Set the volume for all sound effects (0.0 to 1.0)"""
         for sound in self.sounds.values():
-            sound.set_volume(volume) 
\ No newline at end of file
+            sound.set_volume(volume)
+
+
+class NullChannel:
+    """Mixer channel stand-in that plays nothing"""
+    def play(self, *args, **kwargs):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def set_volume(self, *args):
+        pass
+    
+    def get_busy(self):
+        return False
+
+
+class NullSoundManager(SoundManager):
+    """
+    Silent SoundManager for headless runs. It never touches pygame.mixer, so
+    it works without an audio device; with no sounds or music loaded every
+    play call does nothing.
+    """
+    def __init__(self):
+        self.effect_channel = NullChannel()
+        self.ambient_channel = NullChannel()
+        self.music_channel = NullChannel()
+        
+        self.music_volume = 0.5
+        self.effect_volume = 0.7
+        self.ambient_volume = 0.4
+        
+        self.sounds = {}
+        self.music_tracks = {}
+        self.current_music = None
+        self.current_ambient = None
+    
+    def set_music_volume(self, volume):
+        pass
+
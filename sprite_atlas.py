@@ -0,0 +1,75 @@
+import pygame
+from trap import Trap, STATE_COLORS
+from enemy import Enemy
+
+TRAP_TYPES = ("spike", "fire")
+ENEMY_DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+KEY_COLOR = (255, 215, 0)  # Gold
+DOOR_COLORS = {False: (139, 0, 0), True: (139, 69, 19)}  # Red while locked, brown once unlocked
+STAIRS_COLOR = (128, 0, 128)  # Purple
+
+
+class SpriteAtlas:
+    """
+    Pre-rendered entity sprites for one cell size.
+
+    Every trap type in every state and the enemy in each facing direction
+    is drawn once onto its own transparent surface with the same code as
+    Trap.draw and Enemy.draw, and keys, the door and stairs get their
+    filled squares, so a frame only has to blit them. The sprites are
+    redrawn when the cell size changes.
+    """
+    def __init__(self, cell_size, enemy_color=(255, 0, 0)):
+        self.cell_size = None
+        self.enemy_color = enemy_color
+        self.traps = {}    # (trap type, state) -> surface
+        self.enemies = {}  # (dx, dy) -> surface
+        self.key = None
+        self.doors = {}    # unlocked -> surface
+        self.stairs = None
+        self.set_cell_size(cell_size)
+
+    def set_cell_size(self, new_cell_size):
+        """Redraw every sprite for a new cell size (nothing to do if unchanged)"""
+        if new_cell_size == self.cell_size:
+            return
+        self.cell_size = new_cell_size
+
+        self.traps = {}
+        for trap_type in TRAP_TYPES:
+            size = Trap.sprite_size(new_cell_size, trap_type)
+            for state in STATE_COLORS:
+                sprite = pygame.Surface(size, pygame.SRCALPHA)
+                Trap.draw_sprite(sprite, 0, 0, new_cell_size, trap_type, state)
+                self.traps[(trap_type, state)] = self._prepare(sprite)
+
+        self.enemies = {}
+        for direction in ENEMY_DIRECTIONS:
+            sprite = pygame.Surface((new_cell_size + 1, new_cell_size + 1), pygame.SRCALPHA)
+            Enemy.draw_sprite(sprite, 0, 0, new_cell_size, self.enemy_color, direction)
+            self.enemies[direction] = self._prepare(sprite)
+
+        # Keys are half a cell, drawn a quarter cell in from the corner
+        self.key = self._square(new_cell_size // 2, KEY_COLOR)
+        self.doors = {unlocked: self._square(new_cell_size, color) for unlocked, color in DOOR_COLORS.items()}
+        self.stairs = self._square(new_cell_size, STAIRS_COLOR)
+
+    def _square(self, size, color):
+        sprite = pygame.Surface((size, size))
+        sprite.fill(color)
+        if pygame.display.get_surface() is not None:
+            return sprite.convert()
+        return sprite
+
+    def _prepare(self, sprite):
+        # Match the display's pixel format for fast blits, when there is one
+        if pygame.display.get_surface() is not None:
+            return sprite.convert_alpha()
+        return sprite
+
+    def trap_sprite(self, trap):
+        return self.traps[(trap.trap_type, trap.get_state())]
+
+    def enemy_sprite(self, enemy):
+        return self.enemies[enemy.direction]
@@ -0,0 +1,37 @@
+from collections import deque
+import numpy as np
+from connectivity import label_components
+
+
+def bfs_distances(maze, source):
+    """Plain breadth-first walking distances, -1 for walls and unreachable cells"""
+    maze = np.asarray(maze)
+    height, width = maze.shape
+    distances = np.full(maze.shape, -1, dtype=np.int64)
+    x, y = source
+    distances[y, x] = 0
+    queue = deque([source])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and maze[ny, nx] == 0 and distances[ny, nx] < 0:
+                distances[ny, nx] = distances[y, x] + 1
+                queue.append((nx, ny))
+    return distances
+
+
+def open_cells(maze):
+    return [(int(x), int(y)) for y, x in np.argwhere(np.asarray(maze) == 0)]
+
+
+def edge_count(maze):
+    """Number of pairs of neighbouring open cells"""
+    cells = np.asarray(maze) == 0
+    return int(np.count_nonzero(cells[:, :-1] & cells[:, 1:]) + np.count_nonzero(cells[:-1, :] & cells[1:, :]))
+
+
+def assert_perfect(maze):
+    """One region, and as a graph of open cells a spanning tree"""
+    assert label_components(maze).max() == 1
+    assert edge_count(maze) == np.count_nonzero(np.asarray(maze) == 0) - 1
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from carving import CARVING_ENGINES, get_carving_engine
+from maze_grid import MazeGrid
+from helpers import assert_perfect
+
+PERFECT_ENGINES = ["backtracker", "kruskal", "eller"]
+
+
+def carve(engine, width, height, seed, start=None):
+    # density and complexity scaled the way MazeGenerator.generate_maze does
+    maze = MazeGrid((height, width))
+    density = int(0.75 * (height // 2) * (width // 2))
+    complexity = int(0.75 * 5 * (height + width))
+    get_carving_engine(engine).carve(maze, density, complexity, np.random.default_rng(seed), start=start)
+    return maze
+
+
+def test_vectorized_engine_opens_as_much_as_the_loop_engine():
+    # Not the same cells for a seed, but statistically the same mazes
+    def open_fraction(engine):
+        return np.mean([np.mean(carve(engine, 31, 31, seed) == 0) for seed in range(10)])
+    assert abs(open_fraction("vectorized") - open_fraction("loop")) < 0.03
+
+
+@pytest.mark.parametrize("engine", sorted(CARVING_ENGINES))
+def test_engines_are_deterministic_for_a_seed(engine):
+    np.testing.assert_array_equal(carve(engine, 31, 31, 4, start=(1, 1)), carve(engine, 31, 31, 4, start=(1, 1)))
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        get_carving_engine("nope")
+
+
+@pytest.mark.parametrize("engine", PERFECT_ENGINES)
+@pytest.mark.parametrize("size", [(5, 5), (31, 21), (51, 51)])
+@pytest.mark.parametrize("seed", range(3))
+def test_perfect_engines_carve_spanning_trees(engine, size, seed):
+    width, height = size
+    maze = carve(engine, width, height, seed, start=(1, 1))
+    assert get_carving_engine(engine).perfect
+    assert (maze[0] == 1).all() and (maze[-1] == 1).all()
+    assert (maze[:, 0] == 1).all() and (maze[:, -1] == 1).all()
+    # Every cell of the lattice is part of the maze
+    assert (maze[1:-1:2, 1:-1:2] == 0).all()
+    assert_perfect(maze)
+
+
+def test_backtracker_handles_mazes_deeper_than_the_recursion_limit():
+    assert_perfect(carve("backtracker", 301, 301, 0))
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from connectivity import ConnectivityMap, DisjointSet, label_components
+from helpers import bfs_distances, open_cells
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_label_components_matches_flood_fill(seed):
+    # Random open/wall noise has many regions of every shape
+    maze = (np.random.default_rng(seed).random((25, 40)) < 0.45).astype(np.uint8)
+    labels = label_components(maze)
+    assert (labels[maze == 1] == 0).all()
+
+    seen = set()
+    for cell in open_cells(maze):
+        if cell in seen:
+            continue
+        region = bfs_distances(maze, cell) >= 0
+        # One label for the whole flood-filled region, used nowhere else
+        assert set(np.unique(labels[region]).tolist()) == {labels[cell[1], cell[0]]}
+        assert (labels[~region] != labels[cell[1], cell[0]]).all()
+        seen.update((int(x), int(y)) for y, x in np.argwhere(region))
+
+
+def test_connectivity_map_reachability():
+    maze = np.ones((5, 7), dtype=np.uint8)
+    maze[1, 1:3] = 0
+    maze[1, 4:6] = 0
+    connectivity = ConnectivityMap(maze)
+    assert connectivity.is_reachable((1, 1), (2, 1))
+    assert not connectivity.is_reachable((1, 1), (4, 1))
+    # A start inside the wall between them reaches both sides
+    assert connectivity.all_reachable((3, 1), [(2, 1), (4, 1)])
+
+
+def test_disjoint_set():
+    sets = DisjointSet(6)
+    assert sets.union(0, 1)
+    assert sets.union(2, 3)
+    assert not sets.union(1, 0)
+    assert sets.find(0) == sets.find(1) != sets.find(2)
+    joined = sets.union_edges([1, 4, 0], [3, 5, 2])
+    assert joined.tolist() == [True, True, False]
+    assert sets.sets == 2
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from enemy_swarm import EnemySwarm
+from maze_grid import MazeGrid
+
+
+def open_maze(size=9):
+    maze = MazeGrid((size, size))
+    maze[1:-1, 1:-1] = 0
+    return maze
+
+
+def test_view_set_cell_size_rescales_the_swarm():
+    swarm = EnemySwarm([(2, 3), (5, 5)], 10, open_maze(), rng=np.random.default_rng(0))
+    for enemy in swarm.enemies:
+        enemy.set_cell_size(20)
+
+    assert swarm.cell_size == 20
+    for enemy, (x, y) in zip(swarm.enemies, [(2, 3), (5, 5)]):
+        assert enemy.cell_size == 20
+        assert (enemy.current_x, enemy.current_y) == (x * 20, y * 20)
+        assert (enemy.draw_x, enemy.draw_y) == (x * 20, y * 20)
+
+
+def test_view_cannot_be_updated_on_its_own():
+    swarm = EnemySwarm([(2, 3)], 10, open_maze(), rng=np.random.default_rng(0))
+    with pytest.raises(TypeError):
+        swarm.enemies[0].update(0.1)
+
+
+def test_enemies_only_walk_on_paths():
+    maze = open_maze(11)
+    maze[5, 1:-2] = 1
+    swarm = EnemySwarm([(1, 1), (9, 9), (3, 7)], 10, maze, rng=np.random.default_rng(1))
+    for _ in range(600):
+        swarm.update(1 / 60)
+        assert maze.open_mask(swarm.x, swarm.y).all()
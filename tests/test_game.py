@@ -0,0 +1,64 @@
+import threading
+import numpy as np
+import pytest
+from game import MazeGame
+
+
+@pytest.fixture
+def headless_game(tmp_path, monkeypatch):
+    # Run where any stray level cache writes would show up
+    monkeypatch.chdir(tmp_path)
+    game = MazeGame(headless=True)
+    yield game
+    game.floor_worker.shutdown()
+
+
+def test_headless_game_runs_any_level(headless_game):
+    headless_game.init_game(10, seed=123)
+    assert headless_game.level_manager.current_level == 10
+    assert headless_game.maze.shape == (51, 51)
+    assert headless_game.total_floors == 3
+
+
+def test_locked_level_raises(headless_game):
+    headless_game.level_manager.levels_unlocked = 1
+    with pytest.raises(ValueError):
+        headless_game.init_game(5)
+    assert headless_game.level_manager.current_level == 1
+
+
+def test_headless_game_writes_nothing_and_starts_no_thread(headless_game, tmp_path):
+    headless_game.init_game(3, seed=5)
+    for _ in range(120):
+        headless_game.step(1 / 60, (1, 0))
+    assert list(tmp_path.iterdir()) == []
+    assert not any(thread.name.startswith("floor-worker") for thread in threading.enumerate())
+
+
+def test_headless_game_can_use_a_level_cache(tmp_path):
+    game = MazeGame(headless=True, cache_dir=str(tmp_path / "cache"))
+    game.init_game(2, seed=5)
+    assert len(list((tmp_path / "cache").glob("*.npz"))) == 1
+
+
+def play(level, seed, ticks=600):
+    game = MazeGame(headless=True)
+    game.init_game(level, seed=seed)
+    moves = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+    for tick in range(ticks):
+        game.step(1 / 60, moves[(tick // 30) % 4])
+    positions = (game.enemy_swarm.x.tolist(), game.enemy_swarm.y.tolist())
+    game.floor_worker.shutdown()
+    return positions
+
+
+def test_seeded_level_plays_out_the_same():
+    assert play(6, 11) == play(6, 11)
+
+
+def test_traps_get_seeded_phases(headless_game):
+    headless_game.init_game(8, seed=3)
+    phases = headless_game.trap_scheduler.phase.copy()
+    assert np.unique(phases).size == phases.size
+    headless_game.init_game(8, seed=3)
+    np.testing.assert_array_equal(headless_game.trap_scheduler.phase, phases)
@@ -0,0 +1,54 @@
+import numpy as np
+from level_cache import LevelCache
+from level_manager import LevelManager
+from maze_generator import MazeGenerator
+
+GENERATE_ARGS = {"keys_required": 3, "num_enemies": 4, "num_traps": 5, "num_floors": 2, "min_exit_distance": 20}
+
+
+def test_round_trip(tmp_path):
+    cache = LevelCache(str(tmp_path))
+    config = LevelManager(save_file=None).get_level_config(6)
+    key = cache.make_key([9, 1], config)
+
+    generated = MazeGenerator(41, 41, seed=[9, 1])
+    maze, start, exit_pos = cache.generate(generated, key, **GENERATE_ARGS)
+
+    loaded = MazeGenerator(41, 41)
+    loaded_maze, loaded_start, loaded_exit = cache.load(key, loaded)
+    np.testing.assert_array_equal(loaded_maze, maze)
+    assert loaded_maze.dtype == np.uint8
+    assert (loaded_start, loaded_exit) == (start, exit_pos)
+    assert loaded.key_positions == generated.key_positions
+    assert loaded.door_position == generated.door_position
+    assert loaded.stair_positions == generated.stair_positions
+    assert loaded.enemy_positions == generated.enemy_positions
+    assert loaded.trap_positions == generated.trap_positions
+
+
+def test_keys_depend_on_seed_config_and_floor(tmp_path):
+    cache = LevelCache(str(tmp_path))
+    manager = LevelManager(save_file=None)
+    config = manager.get_level_config(2)
+    key = cache.make_key([1, 1], config, 1)
+    assert key == cache.make_key([1, 1], dict(config, description="other text"), 1)
+    assert key != cache.make_key([2, 1], config, 1)
+    assert key != cache.make_key([1, 1], config, 2)
+    assert key != cache.make_key([1, 1], manager.get_level_config(3), 1)
+
+
+def test_miss_and_eviction(tmp_path):
+    cache = LevelCache(str(tmp_path), max_entries=2)
+    assert cache.load("missing", MazeGenerator(11, 11)) is None
+    for seed in range(3):
+        cache.generate(MazeGenerator(11, 11, seed=seed), f"key{seed}", min_exit_distance=1)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+
+def test_no_cache_dir_stores_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = LevelCache(None)
+    result = cache.generate(MazeGenerator(11, 11, seed=0), "key", min_exit_distance=1)
+    assert result is not None
+    assert cache.load("key", MazeGenerator(11, 11)) is None
+    assert list(tmp_path.iterdir()) == []
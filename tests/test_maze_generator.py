@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+from connectivity import ConnectivityMap
+from level_manager import LevelManager
+from maze_generator import MazeGenerator
+from maze_graph import MazeGraph
+from helpers import assert_perfect, edge_count
+
+
+def generate_floor(level, seed, floor=1):
+    """Generate a floor with the same arguments as MazeGame.generate_floor"""
+    config = LevelManager(save_file=None).get_level_config(level)
+    width, height = config["size"]
+    generator = MazeGenerator(width, height, seed=[seed, floor])
+    if floor == 1:
+        args = {"keys_required": config["keys_required"], "num_enemies": config["enemies"],
+                "num_traps": config["traps"], "min_exit_distance": config["min_exit_distance"]}
+    else:
+        args = {"num_enemies": config["enemies"] // config["floors"],
+                "num_traps": config["traps"] // config["floors"]}
+    result = generator.generate_maze(num_floors=config["floors"], current_floor=floor, **args)
+    return config, generator, result
+
+
+@pytest.mark.parametrize("level", range(1, 11))
+@pytest.mark.parametrize("seed", [0, 7, 123])
+def test_floor_has_every_required_key_and_stairs(level, seed):
+    config, generator, (maze, start, exit_pos) = generate_floor(level, seed)
+    assert len(set(generator.key_positions)) == config["keys_required"]
+    assert len(generator.stair_positions) == (1 if config["floors"] > 1 else 0)
+
+    connectivity = ConnectivityMap(maze)
+    assert connectivity.all_reachable(start, generator.key_positions + generator.stair_positions)
+    assert connectivity.is_reachable(start, exit_pos)
+
+
+def test_level_10_seed_123_places_all_keys_and_stairs():
+    # This seed used to get 1 of 4 keys and no stairs
+    config, generator, _ = generate_floor(10, 123)
+    assert len(generator.key_positions) == 4
+    assert len(generator.stair_positions) == 1
+
+
+@pytest.mark.parametrize("level", range(1, 11))
+@pytest.mark.parametrize("seed", range(10))
+def test_delivered_maze_keeps_its_distances(level, seed):
+    # Walking distances in the maze that is handed out, loops included
+    config, generator, (maze, start, exit_pos) = generate_floor(level, seed)
+    distances = MazeGraph(maze).distances_from(start)
+    assert distances[exit_pos[1], exit_pos[0]] >= config["min_exit_distance"]
+    for x, y in generator.key_positions + generator.stair_positions:
+        assert distances[y, x] > 5
+
+    if config["floors"] > 1:
+        _, generator, (maze, start, _) = generate_floor(level, seed, floor=2)
+        distances = MazeGraph(maze).distances_from(start)
+        for x, y in generator.stair_positions:
+            assert distances[y, x] > 5
+
+
+def test_fallback_maze_keeps_keys_and_stairs():
+    generator = MazeGenerator(31, 31, seed=1)
+    generator.start_pos = (1, 1)
+    generator._create_simple_solvable_maze((1, 1), 15, 3, needs_stairs=True)
+    maze = generator.maze
+    assert len(generator.key_positions) == 3
+    assert len(generator.stair_positions) == 1
+    assert generator._is_maze_solvable()
+    assert ConnectivityMap(maze).is_reachable((1, 1), generator.stair_positions[0])
+    distances = MazeGraph(maze).distances_from((1, 1))
+    assert distances[generator.exit_y, generator.exit_x] >= 15
+    for x, y in generator.key_positions + generator.stair_positions:
+        assert distances[y, x] > 5
+
+
+def test_generation_is_deterministic_for_a_seed():
+    first = generate_floor(7, 42)
+    second = generate_floor(7, 42)
+    assert np.array_equal(first[2][0], second[2][0])
+    assert first[1].key_positions == second[1].key_positions
+    assert first[1].trap_positions == second[1].trap_positions
+
+
+def carved_generator(seed, size=41):
+    generator = MazeGenerator(size, size, seed=seed)
+    generator.generate_maze(engine="backtracker", braid_factor=0, start_pos=(1, 1))
+    return generator
+
+
+def dead_ends(maze):
+    return int(np.count_nonzero((maze == 0) & (maze.open_neighbour_counts() == 1)))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_braiding_adds_loops_and_removes_dead_ends(seed):
+    generator = carved_generator(seed)
+    before = generator.maze.copy()
+    generator._add_random_paths(1 / 20)
+    maze = generator.maze
+
+    # Only walls are opened, at most the budget, never on the border
+    opened = (before == 1) & (maze == 0)
+    assert np.array_equal(maze == 1, (before == 1) & ~opened)
+    assert 0 < np.count_nonzero(opened) <= int(41 * 41 / 20)
+    assert not opened[0].any() and not opened[-1].any() and not opened[:, 0].any() and not opened[:, -1].any()
+
+    # Still one region, now with a loop for every opened wall
+    assert ConnectivityMap(maze).labels.max() == 1
+    assert edge_count(maze) - np.count_nonzero(maze == 0) + 1 >= np.count_nonzero(opened)
+    assert dead_ends(maze) < dead_ends(before)
+
+
+def test_braid_factor_zero_keeps_the_perfect_maze():
+    generator = carved_generator(1)
+    assert_perfect(generator.maze)
+    before = generator.maze.copy()
+    generator._add_random_paths(0)
+    assert np.array_equal(generator.maze, before)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from maze_generator import MazeGenerator
+from maze_graph import MazeGraph
+from helpers import bfs_distances, open_cells
+
+
+def braided_maze(seed, size=31, engine="vectorized"):
+    generator = MazeGenerator(size, size, seed=seed)
+    maze, start, _ = generator.generate_maze(engine=engine, min_exit_distance=1)
+    return maze, start
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("engine", ["vectorized", "loop"])
+def test_distances_from_matches_bfs(seed, engine):
+    maze, start = braided_maze(seed, engine=engine)
+    graph = MazeGraph(maze)
+    rng = np.random.default_rng(seed)
+    cells = open_cells(maze)
+    for index in rng.choice(len(cells), size=5, replace=False):
+        source = cells[index]
+        np.testing.assert_array_equal(graph.distances_from(source), bfs_distances(maze, source))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_distance_matches_bfs(seed):
+    maze, start = braided_maze(seed)
+    graph = MazeGraph(maze)
+    expected = bfs_distances(maze, start)
+    for cell in open_cells(maze):
+        distance = graph.distance(start, cell)
+        assert distance == (None if expected[cell[1], cell[0]] < 0 else expected[cell[1], cell[0]])
+
+
+def test_all_pairs_gives_the_same_distances():
+    maze, start = braided_maze(3)
+    graph = MazeGraph(maze)
+    cells = open_cells(maze)[::7]
+    before = [graph.distance(start, cell) for cell in cells]
+    graph.precompute_all_pairs()
+    assert [graph.distance(start, cell) for cell in cells] == before
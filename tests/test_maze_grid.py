@@ -0,0 +1,36 @@
+import numpy as np
+from maze_grid import MazeGrid, NEIGHBOURS
+
+
+def random_grid(seed, shape=(13, 29)):
+    return MazeGrid.from_array(np.random.default_rng(seed).random(shape) < 0.5)
+
+
+def test_pack_round_trip_and_size():
+    grid = random_grid(0)
+    packed = grid.pack()
+    assert packed.nbytes == 13 * 4
+    np.testing.assert_array_equal(packed.unpack(), grid)
+
+
+def test_packed_queries_match_the_grid():
+    grid = random_grid(1)
+    packed = grid.pack()
+    xs, ys = np.meshgrid(np.arange(-1, 31), np.arange(-1, 15))
+    np.testing.assert_array_equal(packed.open_mask(xs, ys), grid.open_mask(xs, ys))
+    for x, y in [(-1, 0), (0, 0), (28, 12), (29, 12), (5, 7)]:
+        assert packed.is_open(x, y) == grid.is_open(x, y)
+
+
+def test_open_neighbours_and_counts():
+    grid = random_grid(2)
+    ys, xs = np.nonzero(np.ones(grid.shape, dtype=bool))
+    neighbours = grid.open_neighbours(xs, ys)
+    assert neighbours.shape == (xs.size, len(NEIGHBOURS))
+    np.testing.assert_array_equal(neighbours.sum(axis=1).reshape(grid.shape), grid.open_neighbour_counts())
+
+
+def test_results_are_plain_arrays():
+    grid = random_grid(3)
+    assert type(grid == 0) is np.ndarray
+    assert type(grid[1:3]) is MazeGrid
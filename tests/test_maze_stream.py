@@ -0,0 +1,33 @@
+import io
+import numpy as np
+from maze_grid import MazeGrid
+from maze_stream import MazeStream, eller_rows, write_maze
+from helpers import assert_perfect
+
+
+def test_eller_rows_builds_a_perfect_maze():
+    rows = list(eller_rows(41, np.random.default_rng(2), 61))
+    assert len(rows) == 61
+    assert_perfect(MazeGrid.from_array(rows))
+
+
+def test_maze_stream_scrolls_through_the_same_maze():
+    full = MazeGrid.from_array(list(eller_rows(21, np.random.default_rng(5), 101)))
+    stream = MazeStream(21, 15, np.random.default_rng(5), height=101)
+    np.testing.assert_array_equal(stream.window, full[:15])
+
+    stream.scroll(40)
+    assert stream.top == 40
+    np.testing.assert_array_equal(stream.window, full[40:55])
+    x, y = np.argwhere(full[40:55] == 0)[0][::-1]
+    assert stream.is_open(int(x), int(y) + 40)
+    assert not stream.is_open(int(x), 0)  # Scrolled out of the window
+
+
+def test_write_maze():
+    out = io.StringIO()
+    count = write_maze(eller_rows(7, np.random.default_rng(0), 5), out)
+    lines = out.getvalue().splitlines()
+    assert count == len(lines) == 5
+    assert lines[0] == "#######"
+    assert set("".join(lines)) <= {"#", " "}
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from maze_generator import MazeGenerator
+from pathfinding import PathfindingService
+from maze_grid import NEIGHBOURS
+from helpers import bfs_distances, open_cells
+
+
+def braided_maze(seed, size=31):
+    generator = MazeGenerator(size, size, seed=seed)
+    maze, start, _ = generator.generate_maze(min_exit_distance=1)
+    return generator, maze
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_field_matches_bfs_and_steps_get_closer(seed):
+    generator, maze = braided_maze(seed)
+    service = PathfindingService()
+    service.set_maze(maze, generator.graph)
+    cells = open_cells(maze)
+    target = cells[len(cells) // 2]
+    service.set_target(target)
+    expected = bfs_distances(maze, target)
+    np.testing.assert_array_equal(service.field, expected)
+
+    xs = np.array([x for x, _ in cells])
+    ys = np.array([y for _, y in cells])
+    steps = service.next_directions(xs, ys)
+    reachable = expected[ys, xs] > 0
+    assert (steps[reachable] >= 0).all()
+    assert (steps[~reachable] == -1).all()
+    next_x = xs[reachable] + NEIGHBOURS[steps[reachable], 0]
+    next_y = ys[reachable] + NEIGHBOURS[steps[reachable], 1]
+    np.testing.assert_array_equal(expected[next_y, next_x], expected[ys, xs][reachable] - 1)
+
+
+def test_field_is_only_rebuilt_when_the_target_moves():
+    _, maze = braided_maze(1)
+    service = PathfindingService(maze)
+    target = open_cells(maze)[0]
+    service.set_target(target)
+    service.set_target(target)
+    assert service.field_builds == 1
@@ -0,0 +1,45 @@
+import numpy as np
+from maze_grid import MazeGrid
+from placement import PlacementIndex
+
+
+def index(seed=0):
+    maze = MazeGrid((7, 9))
+    maze[1:-1, 1:-1] = 0
+    maze[3, 1:7] = 1
+    return maze, PlacementIndex(maze, np.random.default_rng(seed))
+
+
+def test_candidates_are_the_open_interior_cells():
+    maze, placement = index()
+    assert len(placement) == np.count_nonzero(maze == 0)
+    assert (maze[placement.ys, placement.xs] == 0).all()
+
+
+def test_sample_is_distinct_and_capped_by_the_mask():
+    maze, placement = index()
+    picked = placement.sample(100)
+    assert len(picked) == len(set(picked)) == len(placement)
+    assert not placement.free().any()
+    assert placement.sample(1, placement.free()) == []
+
+
+def test_masks():
+    maze, placement = index()
+    near = placement.inside_zone((1, 1), 2)
+    assert set(zip(placement.xs[near].tolist(), placement.ys[near].tolist())) == {
+        (1, 1), (2, 1), (3, 1), (1, 2), (2, 2)}
+    assert (near == ~placement.outside_zone((1, 1), 2)).all()
+    assert not placement.excluding([(1, 1)])[(placement.xs == 1) & (placement.ys == 1)].any()
+
+    distances = np.zeros(maze.shape, dtype=int)
+    distances[5, 4] = 9
+    far = placement.farther_than(distances, 5)
+    assert list(zip(placement.xs[far].tolist(), placement.ys[far].tolist())) == [(4, 5)]
+
+
+def test_sample_respects_occupied_cells():
+    maze, placement = index(1)
+    placement.occupy([(1, 1), (2, 1)])
+    picked = placement.sample(3, placement.free() & placement.inside_zone((1, 1), 1))
+    assert picked == [(1, 2)]
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from trap_scheduler import ACTIVE, INACTIVE, WARNING, TrapScheduler
+
+TRAPS = [(1, 1, "spike"), (3, 1, "fire")]
+
+
+def test_cycle_starts_active_then_waits_and_warns():
+    scheduler = TrapScheduler(TRAPS, 10, activation_time=3.0, active_duration=1.0)
+    assert scheduler.states_at(0.5).tolist() == [ACTIVE, ACTIVE]
+    assert scheduler.states_at(1.5).tolist() == [INACTIVE, INACTIVE]
+    assert scheduler.states_at(3.8).tolist() == [WARNING, WARNING]
+    assert scheduler.states_at(4.2).tolist() == [ACTIVE, ACTIVE]
+    np.testing.assert_allclose(scheduler.time_until_active(1.5), [2.5, 2.5])
+    np.testing.assert_allclose(scheduler.time_until_active(0.5), [0.0, 0.0])
+
+
+def test_update_matches_the_closed_form_and_views():
+    scheduler = TrapScheduler(TRAPS, 10, phase=[0.0, 2.0])
+    for _ in range(300):
+        scheduler.update(1 / 60)
+        expected = scheduler.states_at(scheduler.time)
+        assert scheduler.states.tolist() == expected.tolist()
+        for trap, active in zip(scheduler.traps, scheduler.active_at(scheduler.time)):
+            assert trap.active == active == trap.is_active_at(scheduler.time)
+
+
+def test_views_follow_the_cell_size_and_refuse_updates():
+    scheduler = TrapScheduler(TRAPS, 10)
+    scheduler.set_cell_size(16)
+    assert [trap.cell_size for trap in scheduler.traps] == [16, 16]
+    with pytest.raises(TypeError):
+        scheduler.traps[0].update(0.1)
+
+
+def test_scatter_spreads_phases_over_the_cycle_reproducibly():
+    traps = [(x, 1, "spike") for x in range(40)]
+    first = TrapScheduler(traps, 10, activation_time=3.0)
+    second = TrapScheduler(traps, 10, activation_time=3.0)
+    first.scatter(np.random.default_rng(3))
+    second.scatter(np.random.default_rng(3))
+    np.testing.assert_array_equal(first.phase, second.phase)
+    assert ((first.phase >= 0) & (first.phase < first.cycle_time)).all()
+    # Not in lock-step any more
+    assert 0 < np.count_nonzero(first.active_at(0.5)) < len(traps)
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """
+    Shared registry of fonts and rendered text surfaces.
+
+    Fonts are keyed by (family, size) and rendered text by the string, its
+    colors and the font, each in its own LRU so the fonts and labels used
+    every frame stay loaded while one-off strings (e.g. a timer value that
+    has moved on) fall out. Cached surfaces are shared between callers and
+    must only be blitted, never drawn on.
+    """
+    def __init__(self, max_fonts=16, max_surfaces=512):
+        self.max_fonts = max_fonts
+        self.max_surfaces = max_surfaces
+        self.fonts = OrderedDict()
+        self.surfaces = OrderedDict()
+
+        # Render counters, to check that static text is rendered only once
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, family, size):
+        """Return a font for (family, size) whose render() goes through the cache"""
+        return CachedFont(self, family, size)
+
+    def get_font(self, family, size):
+        """Return the underlying pygame font, loading it on first use"""
+        key = (family, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(family, size)
+            self.fonts[key] = font
+            if len(self.fonts) > self.max_fonts:
+                self.fonts.popitem(last=False)
+        else:
+            self.fonts.move_to_end(key)
+        return font
+
+    def render(self, family, size, text, antialias, color, background=None):
+        key = (text, antialias, tuple(color), tuple(background) if background is not None else None,
+               family, size)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        font = self.get_font(family, size)
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        self.misses += 1
+        return surface
+
+    def clear(self):
+        self.fonts.clear()
+        self.surfaces.clear()
+
+
+class CachedFont:
+    """Stand-in for pygame.font.Font that renders through a TextCache"""
+    def __init__(self, cache, family, size):
+        self.cache = cache
+        self.family = family
+        self.size_px = size
+
+    def render(self, text, antialias, color, background=None):
+        return self.cache.render(self.family, self.size_px, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        # size(), get_height(), get_linesize() etc. come from the real font
+        return getattr(self.cache.get_font(self.family, self.size_px), name)
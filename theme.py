@@ -1,5 +1,38 @@
+import numpy as np
 import pygame
 
+# Light gradient surfaces shared across Theme instances, keyed by (intensity, size)
+_light_gradient_cache = {}
+
+def build_light_gradient(intensity, size):
+    """
+    Build a white radial gradient whose alpha falls off linearly from the
+    center, computed with NumPy distance arrays instead of per-pixel set_at.
+    """
+    center = size // 2
+    radius = size // 2
+    
+    # Create a surface with alpha channel
+    gradient = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    # Distance of every pixel from the center, indexed [x, y] like surfarray
+    coords = np.arange(size) - center
+    distance = np.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2)
+    inside = distance < radius
+    
+    # Linear falloff inside the radius, fully transparent outside
+    alpha = np.zeros((size, size), dtype=np.uint8)
+    alpha[inside] = (255 * (1 - distance[inside] / radius) * intensity).astype(np.uint8)
+    
+    pixels = pygame.surfarray.pixels3d(gradient)
+    pixels[inside] = 255
+    del pixels
+    pixels_alpha = pygame.surfarray.pixels_alpha(gradient)
+    pixels_alpha[:] = alpha
+    del pixels_alpha
+    
+    return gradient
+
 class Theme:
     def __init__(self, name="dungeon"):
         self.name = name
@@ -59,26 +92,16 @@ class Theme:
         self.create_light_gradient()
     
     def create_light_gradient(self):
-        # Create a radial gradient for the light effect
+        # Create a radial gradient for the light effect. The gradient only
+        # depends on intensity and size, so it is built once and shared by
+        # every Theme instance
         size = 400  # Size of the gradient surface
-        center = (size // 2, size // 2)
-        radius = size // 2
-        
-        # Create a surface with alpha channel
-        self.light_gradient = pygame.Surface((size, size), pygame.SRCALPHA)
+        intensity = self.properties["light_intensity"]
+        cache_key = (intensity, size)
         
-        # Draw the gradient
-        for x in range(size):
-            for y in range(size):
-                # Calculate distance from center
-                distance = ((x - center[0]) ** 2 + (y - center[1]) ** 2) ** 0.5
-                
-                # Calculate alpha based on distance
-                if distance < radius:
-                    # Linear falloff
-                    alpha = int(255 * (1 - distance / radius) * self.properties["light_intensity"])
-                    # Draw pixel
-                    self.light_gradient.set_at((x, y), (255, 255, 255, alpha))
+        if cache_key not in _light_gradient_cache:
+            _light_gradient_cache[cache_key] = build_light_gradient(intensity, size)
+        self.light_gradient = _light_gradient_cache[cache_key]
     
     def get_wall_color(self):
         return self.properties["wall_color"]
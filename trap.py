@@ -1,6 +1,13 @@
 import pygame
 import random
 
+# Trap colors by state
+STATE_COLORS = {
+    "inactive": (100, 100, 100),  # Gray when inactive
+    "warning": (255, 165, 0),  # Orange when about to activate
+    "active": (255, 0, 0),  # Red when active
+}
+
 class Trap:
     def __init__(self, x, y, cell_size, trap_type="spike", activation_time=3.0):
         self.x = x
@@ -13,9 +20,9 @@ class Trap:
         self.active = False
         
         # Colors for different trap states
-        self.inactive_color = (100, 100, 100)  # Gray when inactive
-        self.active_color = (255, 0, 0)  # Red when active
-        self.warning_color = (255, 165, 0)  # Orange when about to activate
+        self.inactive_color = STATE_COLORS["inactive"]
+        self.active_color = STATE_COLORS["active"]
+        self.warning_color = STATE_COLORS["warning"]
     
     def update(self, delta_time):
         self.time_since_last_cycle += delta_time
@@ -34,44 +41,38 @@ class Trap:
             self.time_since_last_cycle = 0
     
     def draw(self, screen):
-        rect = pygame.Rect(
-            self.x * self.cell_size,
-            self.y * self.cell_size,
-            self.cell_size,
-            self.cell_size
-        )
+        self.draw_sprite(screen, self.x * self.cell_size, self.y * self.cell_size,
+                         self.cell_size, self.trap_type, self.get_state())
+    
+    @staticmethod
+    def draw_sprite(screen, left, top, cell_size, trap_type, state):
+        """Draw a trap of the given type and state with its cell's top-left corner at (left, top)"""
+        rect = pygame.Rect(left, top, cell_size, cell_size)
         
         # Draw base
         pygame.draw.rect(screen, (100, 100, 100), rect)
         
         # Determine the current color based on trap state
-        if self.active:
-            current_color = self.active_color
-        else:
-            # Check if trap is about to activate (last 0.5 seconds of inactive period)
-            time_until_active = self.activation_time - (self.time_since_last_cycle % (self.activation_time + self.active_duration))
-            if time_until_active < 0.5:
-                current_color = self.warning_color  # About to activate
-            else:
-                current_color = self.inactive_color  # Safely inactive
+        active = state == "active"
+        current_color = STATE_COLORS[state]
         
-        if self.trap_type == "spike":
+        if trap_type == "spike":
             # Draw spikes
-            if self.active:
+            if active:
                 # Active spikes (taller)
-                spike_height = self.cell_size // 2
-                base_y = self.y * self.cell_size + self.cell_size - spike_height
+                spike_height = cell_size // 2
+                base_y = top + cell_size - spike_height
             else:
                 # Inactive or warning spikes (shorter)
-                spike_height = self.cell_size // 6
-                base_y = self.y * self.cell_size + self.cell_size - spike_height
+                spike_height = cell_size // 6
+                base_y = top + cell_size - spike_height
             
             # Draw multiple spikes
-            spike_width = max(2, self.cell_size // 8)
-            num_spikes = self.cell_size // (spike_width * 2)
+            spike_width = max(2, cell_size // 8)
+            num_spikes = cell_size // (spike_width * 2)
             
             for i in range(num_spikes):
-                spike_x = self.x * self.cell_size + (i * 2 + 1) * spike_width
+                spike_x = left + (i * 2 + 1) * spike_width
                 
                 # Draw triangle spike
                 pygame.draw.polygon(
@@ -84,19 +85,19 @@ class Trap:
                     ]
                 )
         
-        elif self.trap_type == "fire":
+        elif trap_type == "fire":
             # Draw fire
-            if self.active or current_color == self.warning_color:
+            if active or state == "warning":
                 # Draw flames
-                flame_height = self.cell_size // 2 if self.active else self.cell_size // 4
-                base_y = self.y * self.cell_size + self.cell_size - flame_height
+                flame_height = cell_size // 2 if active else cell_size // 4
+                base_y = top + cell_size - flame_height
                 
                 # Draw multiple flames
-                flame_width = max(4, self.cell_size // 6)
-                num_flames = max(3, self.cell_size // (flame_width * 2))
+                flame_width = max(4, cell_size // 6)
+                num_flames = max(3, cell_size // (flame_width * 2))
                 
                 for i in range(num_flames):
-                    flame_x = self.x * self.cell_size + (i * 2 + 1) * flame_width
+                    flame_x = left + (i * 2 + 1) * flame_width
                     
                     # Draw flame (curved triangle)
                     pygame.draw.polygon(
@@ -111,6 +112,16 @@ class Trap:
                         ]
                     )
     
+    def get_state(self):
+        """Visual state of the trap: active, warning or inactive"""
+        if self.active:
+            return "active"
+        # Check if trap is about to activate (last 0.5 seconds of inactive period)
+        time_until_active = self.activation_time - (self.time_since_last_cycle % (self.activation_time + self.active_duration))
+        if time_until_active < 0.5:
+            return "warning"
+        return "inactive"
+    
     def is_dangerous(self):
         return self.active
     
@@ -122,5 +133,25 @@ class Trap:
             self.cell_size
         )
     
+    def get_draw_rect(self):
+        """
+        Screen area covered by draw(). Flames can reach past the right edge
+        of the cell and spike bases touch the row below, so this is larger
+        than get_rect().
+        """
+        width, height = self.sprite_size(self.cell_size, self.trap_type)
+        return pygame.Rect(self.x * self.cell_size, self.y * self.cell_size, width, height)
+    
+    @staticmethod
+    def sprite_size(cell_size, trap_type):
+        """Size of the area draw_sprite() covers from the cell's top-left corner"""
+        if trap_type == "fire":
+            flame_width = max(4, cell_size // 6)
+            num_flames = max(3, cell_size // (flame_width * 2))
+            width = (num_flames * 2 - 1) * flame_width + flame_width // 2
+        else:
+            width = cell_size
+        return (max(width, cell_size) + 1, cell_size + 1)
+    
     def set_cell_size(self, new_cell_size):
         self.cell_size = new_cell_size 
\ No newline at end of file
@@ -0,0 +1,133 @@
+import numpy as np
+from trap import Trap, STATE_COLORS
+
+# Trap states by the codes returned from TrapScheduler.states_at
+TRAP_STATES = ("inactive", "warning", "active")
+INACTIVE, WARNING, ACTIVE = range(len(TRAP_STATES))
+
+# Seconds before the end of the activation time that the warning shows
+WARNING_TIME = 0.5
+
+
+class TrapScheduler:
+    """
+    All traps of a floor on one shared clock.
+
+    A trap's state is a function of time only: with its phase offset
+    added, the time modulo its cycle (active_duration + activation_time)
+    says where in the cycle it is. Each cycle starts with the active
+    period. Nothing is accumulated per trap, so the whole floor is
+    evaluated in one vectorized expression, and any moment, including a
+    future one, can be queried. The traps list holds TrapView objects
+    that expose each trap through the usual Trap API for drawing and
+    collision checks.
+    """
+    def __init__(self, trap_infos, cell_size, activation_time=3.0, active_duration=1.0, phase=None):
+        self.cell_size = cell_size
+        self.time = 0.0  # Seconds on the floor's clock
+
+        count = len(trap_infos)
+        self.x = np.array([info[0] for info in trap_infos], dtype=np.int64)
+        self.y = np.array([info[1] for info in trap_infos], dtype=np.int64)
+        self.activation_time = np.full(count, float(activation_time))  # Time between activations
+        self.active_duration = np.full(count, float(active_duration))  # How long a trap stays active
+        self.cycle_time = self.activation_time + self.active_duration
+
+        # Seconds each trap is ahead of the clock; all in step by default
+        self.phase = np.zeros(count) if phase is None else np.asarray(phase, dtype=float).copy()
+
+        # States at self.time, refreshed by update()
+        self.states = np.zeros(count, dtype=np.int8)
+        self.active = np.zeros(count, dtype=bool)
+
+        self.traps = [TrapView(self, i, info[2]) for i, info in enumerate(trap_infos)]
+        self.refresh()
+
+    def __len__(self):
+        return len(self.traps)
+
+    def cycle_position(self, time):
+        """Seconds into its current cycle for every trap at the given time"""
+        return np.mod(time + self.phase, self.cycle_time)
+
+    def states_at(self, time):
+        """State codes (INACTIVE, WARNING, ACTIVE) of every trap at the given time"""
+        position = self.cycle_position(time)
+        states = np.full(len(self), INACTIVE, dtype=np.int8)
+        # Matches the original Trap.get_state, which shows the warning
+        # from WARNING_TIME before the activation time has passed
+        states[position > self.activation_time - WARNING_TIME] = WARNING
+        states[position < self.active_duration] = ACTIVE
+        return states
+
+    def active_at(self, time):
+        """Mask of the traps that are dangerous at the given time"""
+        return self.cycle_position(time) < self.active_duration
+
+    def time_until_active(self, time):
+        """Seconds from the given time until each trap is next active (0 if it is now)"""
+        position = self.cycle_position(time)
+        return np.where(position < self.active_duration, 0.0, self.cycle_time - position)
+
+    def scatter(self, rng):
+        """Give every trap a random phase in its cycle so they don't all fire together"""
+        self.phase[:] = rng.random(len(self)) * self.cycle_time
+        self.refresh()
+
+    def refresh(self):
+        self.states[:] = self.states_at(self.time)
+        self.active[:] = self.states == ACTIVE
+
+    def update(self, delta_time):
+        """Advance the clock and evaluate every trap at the new time"""
+        self.time += delta_time
+        self.refresh()
+
+    def set_cell_size(self, new_cell_size):
+        self.cell_size = new_cell_size
+        for view in self.traps:
+            view.cell_size = new_cell_size
+
+
+class TrapView(Trap):
+    """
+    One trap of a TrapScheduler seen through the Trap API. Drawing and
+    collision methods are inherited from Trap; the state they read comes
+    from the scheduler, which does all updating.
+    """
+    def __init__(self, scheduler, index, trap_type):
+        self.scheduler = scheduler
+        self.index = index
+        self.x = int(scheduler.x[index])
+        self.y = int(scheduler.y[index])
+        self.cell_size = scheduler.cell_size
+        self.trap_type = trap_type
+
+        # Colors for different trap states
+        self.inactive_color = STATE_COLORS["inactive"]
+        self.active_color = STATE_COLORS["active"]
+        self.warning_color = STATE_COLORS["warning"]
+
+    @property
+    def activation_time(self):
+        return float(self.scheduler.activation_time[self.index])
+
+    @property
+    def active_duration(self):
+        return float(self.scheduler.active_duration[self.index])
+
+    @property
+    def active(self):
+        return bool(self.scheduler.active[self.index])
+
+    def get_state(self):
+        return TRAP_STATES[self.scheduler.states[self.index]]
+
+    def is_active_at(self, time):
+        """Whether the trap is dangerous at a given time on the scheduler's clock"""
+        i = self.index
+        position = (time + self.scheduler.phase[i]) % self.scheduler.cycle_time[i]
+        return bool(position < self.scheduler.active_duration[i])
+
+    def update(self, delta_time):
+        raise TypeError("Scheduled traps are updated through TrapScheduler.update")